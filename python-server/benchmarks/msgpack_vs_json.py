@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+getUserAggregates 응답 인코딩 벤치마크: MessagePack vs JSON
+shared/domain-rust/sample_data.json 구조의 사용자 데이터를 아이템 수별로 늘려 응답 크기와 인코딩/디코딩 시간 비교
+
+실행:
+    python benchmarks/msgpack_vs_json.py [--items 2 50 500] [--number 200]
+"""
+
+import argparse
+import copy
+import json
+import os
+import sys
+import timeit
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.api import jsonrpc_codec, msgpack_codec
+from src.api.openrpc_server import OpenRpcServer
+from src.domain.user.aggregates import UserAggregates
+
+SAMPLE_DATA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "shared", "domain-rust", "sample_data.json"
+)
+
+
+def build_response(sample: dict, item_count: int) -> dict:
+    """sample_data.json의 아이템을 반복해 item_count개 아이템을 가진 getUserAggregates 응답 생성"""
+    data = copy.deepcopy(sample)
+    items = sample["inventory"]["items"]
+    data["inventory"]["items"] = [
+        {**copy.deepcopy(items[i % len(items)]), "id": f"{items[i % len(items)]['id']}_{i}"}
+        for i in range(item_count)
+    ]
+    data["inventory"]["capacity"] = max(data["inventory"]["capacity"], item_count)
+
+    aggregates = UserAggregates.from_dict(data)
+    result = OpenRpcServer._user_aggregates_to_dict(aggregates)
+    return {"jsonrpc": "2.0", "result": result, "id": 1}
+
+
+def measure(encode, decode, response: dict, number: int) -> tuple[int, float, float]:
+    """(크기, 인코딩 µs, 디코딩 µs)"""
+    payload = encode(response)
+    encode_us = timeit.timeit(lambda: encode(response), number=number) / number * 1e6
+    decode_us = timeit.timeit(lambda: decode(payload), number=number) / number * 1e6
+    return len(payload), encode_us, decode_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MessagePack vs JSON 인코딩 벤치마크")
+    parser.add_argument("--items", type=int, nargs="+", default=[2, 50, 500], help="아이템 수 목록")
+    parser.add_argument("--number", type=int, default=200, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    if not msgpack_codec.MSGPACK_AVAILABLE:
+        print("msgpack is not installed: pip install msgpack")
+        sys.exit(1)
+
+    with open(SAMPLE_DATA_PATH, "r", encoding="utf-8") as f:
+        sample = json.load(f)
+
+    json_codec_name = "orjson" if jsonrpc_codec.ORJSON_AVAILABLE else "json (codec)"
+    codecs = [
+        ("json (stdlib)", lambda r: json.dumps(r).encode("utf-8"), json.loads),
+        (json_codec_name, jsonrpc_codec.encode_response, jsonrpc_codec.loads),
+        ("msgpack", msgpack_codec.encode_response, msgpack_codec.loads),
+    ]
+
+    print(f"{'items':>6} {'codec':<14} {'bytes':>9} {'vs json':>8} {'encode µs':>11} {'decode µs':>11}")
+    for item_count in args.items:
+        response = build_response(sample, item_count)
+        baseline = None
+        for name, encode, decode in codecs:
+            size, encode_us, decode_us = measure(encode, decode, response, args.number)
+            baseline = baseline or size
+            print(f"{item_count:>6} {name:<14} {size:>9} {size / baseline:>7.0%} {encode_us:>11.1f} {decode_us:>11.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+getUserAggregates 결과 인코딩 벤치마크: dict 변환 후 직렬화 vs 직접 인코딩
+shared/domain-rust/sample_data.json 구조의 사용자 데이터를 아이템 수별로 늘려 UserAggregates -> JSON bytes 시간 비교
+
+- dict + json (stdlib): 응답 dict를 만들고 표준 json으로 직렬화 (JSONResponse와 같은 경로)
+- dict + codec: 응답 dict를 만들고 jsonrpc_codec.dumps로 직렬화 (orjson 설치 시 orjson)
+- direct: encode_user_aggregates로 UserAggregates에서 bytes를 직접 생성
+
+실행:
+    python benchmarks/user_aggregates_encoding.py [--items 0 50 500] [--number 500]
+"""
+
+import argparse
+import copy
+import json
+import os
+import sys
+import timeit
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.api import jsonrpc_codec
+from src.api.openrpc_server import OpenRpcServer
+from src.api.user_aggregates_encoder import encode_user_aggregates
+from src.domain.user.aggregates import UserAggregates
+
+SAMPLE_DATA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "shared", "domain-rust", "sample_data.json"
+)
+
+
+def build_aggregates(sample: dict, item_count: int) -> UserAggregates:
+    """sample_data.json의 아이템을 반복해 item_count개 아이템을 가진 UserAggregates 생성"""
+    data = copy.deepcopy(sample)
+    items = sample["inventory"]["items"]
+    data["inventory"]["items"] = [
+        {**copy.deepcopy(items[i % len(items)]), "id": f"{items[i % len(items)]['id']}_{i}"}
+        for i in range(item_count)
+    ]
+    data["inventory"]["capacity"] = max(data["inventory"]["capacity"], item_count)
+    return UserAggregates.from_dict(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UserAggregates 인코딩 벤치마크")
+    parser.add_argument("--items", type=int, nargs="+", default=[0, 50, 500], help="아이템 수 목록")
+    parser.add_argument("--number", type=int, default=500, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    with open(SAMPLE_DATA_PATH, "r", encoding="utf-8") as f:
+        sample = json.load(f)
+
+    to_dict = OpenRpcServer._user_aggregates_to_dict
+    codec_name = "dict + orjson" if jsonrpc_codec.ORJSON_AVAILABLE else "dict + codec"
+    encoders = [
+        ("dict + json", lambda a: json.dumps(to_dict(a), ensure_ascii=False, separators=(",", ":")).encode("utf-8")),
+        (codec_name, lambda a: jsonrpc_codec.dumps(to_dict(a))),
+        ("direct", encode_user_aggregates),
+    ]
+
+    print(f"{'items':>6} {'encoder':<14} {'bytes':>9} {'encode µs':>11} {'vs dict+json':>13}")
+    for item_count in args.items:
+        aggregates = build_aggregates(sample, item_count)
+        expected = jsonrpc_codec.loads(jsonrpc_codec.dumps(to_dict(aggregates)))
+        baseline = None
+        for name, encode in encoders:
+            payload = encode(aggregates)
+            if jsonrpc_codec.loads(payload) != expected:
+                print(f"{name}: output differs from the response dict")
+                sys.exit(1)
+            encode_us = timeit.timeit(lambda: encode(aggregates), number=args.number) / args.number * 1e6
+            baseline = baseline or encode_us
+            print(f"{item_count:>6} {name:<14} {len(payload):>9} {encode_us:>11.1f} {encode_us / baseline:>12.0%}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+user:{id}:data 저장 형식 리포트: json vs json_zlib vs msgpack
+장비(레벨/등급/속성)와 소모품이 섞인 인벤토리를 아이템 수별로 만들어 형식별 크기와 인코딩/디코딩 시간 비교
+
+- bytes: 해시 필드에 저장되는 값 크기 (1M users: 사용자 100만 명 기준 데이터 크기)
+- encode / decode: UserAggregates <-> 저장 bytes 시간
+- --redis-url을 지정하면 해당 Redis에 임시 키로 저장해 MEMORY USAGE(키 오버헤드 포함)도 측정하고 삭제
+
+실행:
+    python benchmarks/user_data_codec.py [--items 10 50 200] [--number 500] [--redis-url redis://localhost:6379/0]
+"""
+
+import argparse
+import copy
+import json
+import os
+import random
+import sys
+import timeit
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.domain.user.aggregates import UserAggregates
+from src.domain.user.repositories.user_data_codec import (
+    UserDataCodec,
+    FORMAT_JSON,
+    FORMAT_JSON_ZLIB,
+    FORMAT_MSGPACK
+)
+
+SAMPLE_DATA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "shared", "domain-rust", "sample_data.json"
+)
+
+RARITIES = ["common", "uncommon", "rare", "epic", "legendary"]
+PROPERTY_NAMES = ["attack", "defense", "durability", "speed", "critical", "element"]
+
+
+def build_aggregates(sample: dict, item_count: int, rng: random.Random) -> UserAggregates:
+    """sample_data.json 프로필에 장비 60% / 소모품 40% 인벤토리를 가진 UserAggregates 생성"""
+    data = copy.deepcopy(sample)
+    items = []
+    for i in range(item_count):
+        if rng.random() < 0.6:
+            item = {
+                "id": f"equip_{rng.randint(1, 999):03d}_{i}",
+                "quantity": 1,
+                "level": rng.randint(1, 100),
+                "rarity": rng.choice(RARITIES),
+                "properties": {
+                    name: rng.randint(1, 500) for name in rng.sample(PROPERTY_NAMES, rng.randint(1, 4))
+                }
+            }
+        else:
+            item = {"id": f"consumable_{rng.randint(1, 99):02d}_{i}", "quantity": rng.randint(1, 99)}
+        items.append(item)
+    data["inventory"]["items"] = items
+    data["inventory"]["capacity"] = max(data["inventory"]["capacity"], item_count)
+    return UserAggregates.from_dict(data)
+
+
+def redis_memory_usage(redis_url: str, payload: bytes, users: int) -> float:
+    """같은 데이터를 users개 키에 저장해 MEMORY USAGE 평균(bytes/user) 측정 후 삭제"""
+    import redis
+
+    client = redis.Redis.from_url(redis_url)
+    keys = [f"bench:user_data_codec:{i}:data" for i in range(users)]
+    try:
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.hset(key, "data", payload)
+        pipe.execute()
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.memory_usage(key, samples=0)
+        return sum(pipe.execute()) / users
+    finally:
+        client.delete(*keys)
+        client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사용자 데이터 저장 형식 리포트")
+    parser.add_argument("--items", type=int, nargs="+", default=[10, 50, 200], help="아이템 수 목록")
+    parser.add_argument("--number", type=int, default=500, help="측정 반복 횟수")
+    parser.add_argument("--redis-url", default=None, help="MEMORY USAGE를 측정할 Redis URL (생략하면 측정 안 함)")
+    parser.add_argument("--redis-users", type=int, default=100, help="MEMORY USAGE 측정용 키 수")
+    args = parser.parse_args()
+
+    with open(SAMPLE_DATA_PATH, "r", encoding="utf-8") as f:
+        sample = json.load(f)
+
+    codecs = [UserDataCodec(data_format) for data_format in (FORMAT_JSON, FORMAT_JSON_ZLIB, FORMAT_MSGPACK)]
+    rng = random.Random(42)
+
+    memory_header = f" {'redis B/user':>13}" if args.redis_url else ""
+    print(f"{'items':>6} {'format':<10} {'bytes':>8} {'vs json':>8} {'1M users':>10} "
+          f"{'encode µs':>10} {'decode µs':>10}{memory_header}")
+    for item_count in args.items:
+        aggregates = build_aggregates(sample, item_count, rng)
+        baseline = None
+        for codec in codecs:
+            payload = codec.encode(aggregates)
+            if codec.decode(payload) != aggregates:
+                print(f"{codec.write_format}: decoded data differs from the original")
+                sys.exit(1)
+            baseline = baseline or len(payload)
+            encode_us = timeit.timeit(lambda: codec.encode(aggregates), number=args.number) / args.number * 1e6
+            decode_us = timeit.timeit(lambda: codec.decode(payload), number=args.number) / args.number * 1e6
+            memory = ""
+            if args.redis_url:
+                memory = f" {redis_memory_usage(args.redis_url, payload, args.redis_users):>13.0f}"
+            print(f"{item_count:>6} {codec.write_format:<10} {len(payload):>8} {len(payload) / baseline:>8.0%} "
+                  f"{len(payload) * 1_000_000 / 1024 / 1024:>8.0f}MB {encode_us:>10.1f} {decode_us:>10.1f}{memory}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
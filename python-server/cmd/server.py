@@ -5,8 +5,9 @@ JSON RPC 2.0 엔드포인트 제공
 
 import json
 import sys
+import socket
 import argparse
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Union
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.responses import JSONResponse
@@ -14,11 +15,25 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
 from src.api.openrpc_server import OpenRpcServer, setup_openrpc_routes
+from src.api.notification_queue import NotificationQueue, DropPolicy
+from src.api.lane_scheduler import Lane, LaneLimits, LaneScheduler
+from src.api.rate_limiter import RateLimiter, RateLimitRule
+from src.api.openrpc_spec import OpenRpcSpec
+from src.api.response_compression import ResponseCompressor
+from src.api.transports.websocket_transport import WebSocketRpcTransport, setup_websocket_routes
+from src.api.transports.tcp_transport import TcpRpcServer
 from src.application.user.services.user_service import UserService
 from src.application.user.services.user_domain_service import UserDomainService
 from src.domain.user.repositories.redis_user_repository import RedisUserRepository
-from src.config.server_config import ServerConfig
+from src.domain.user.repositories.group_commit_user_repository import GroupCommitUserRepository
+from src.domain.user.repositories.user_data_codec import UserDataCodec
+from src.config.server_config import ServerConfig, ServerInfo
 from src.infrastructure.wasm.wasm_instance import CreateWasmInstance
+from src.infrastructure.metrics.metrics import Metrics
+from src.infrastructure.concurrency.adaptive_limiter import AdaptiveConcurrencyLimiter
+from src.infrastructure.concurrency.keyed_lock import KeyedLock
+from src.infrastructure.idempotency.redis_idempotency_store import RedisIdempotencyStore
+from src.infrastructure.rate_limit.redis_sliding_window import RedisSlidingWindowLimiter
 
 import redis.asyncio as redis
 import os
@@ -27,7 +42,10 @@ from pathlib import Path
 # 전역 변수
 server_config: ServerConfig = None
 openrpc_server: OpenRpcServer = None
+tcp_rpc_server: Optional[TcpRpcServer] = None
 wasm_file_path: Optional[str] = None
+openrpc_spec_path: Optional[str] = None
+listen_sockets: List[socket.socket] = []
 
 # Pydantic 모델 정의
 class JsonRpcRequestBody(BaseModel):
@@ -68,7 +86,7 @@ def init_app():
 @app.on_event("startup")
 async def startup_event():
     """서버 시작시 초기화"""
-    global openrpc_server, server_config
+    global openrpc_server, server_config, tcp_rpc_server
     
     if not server_config:
         raise RuntimeError("Server config not loaded. Please run with --config argument.")
@@ -117,38 +135,165 @@ async def startup_event():
     
     print("✅ WASM instance created successfully")
     
+    # OpenRPC 스펙 로드 (시작 시 한 번, 이후 메모리의 bytes로 응답)
+    openrpc_spec, spec_error = OpenRpcSpec.load(openrpc_spec_path)
+    if spec_error:
+        # 스펙이 없으면 params 검증 없이 메서드가 노출되므로 시작하지 않음
+        print(f"❌ CRITICAL: OpenRPC spec not loaded: {spec_error}")
+        print("💡 Specify the spec path with: --openrpc-spec /path/to/openrpc.json")
+        raise RuntimeError(f"OpenRPC spec not loaded: {spec_error}")
+    
+    print(f"📄 OpenRPC spec loaded from: {openrpc_spec.source}")
+    
     # 의존성 주입
-    user_repository = RedisUserRepository(redis_client)
+    metrics = Metrics()
+    user_lock = KeyedLock(metrics, name="user_lock") if server_config.redis.user_lock.enabled else None
+    user_data_config = server_config.redis.user_data
+    user_data_codec = UserDataCodec(user_data_config.format, zlib_level=user_data_config.zlib_level)
+    # 사용자 데이터는 바이너리 형식일 수 있으므로 응답을 디코딩하지 않는 클라이언트로 읽고 씀
+    user_data_client = redis.Redis(
+        host=server_config.redis.host,
+        port=server_config.redis.port,
+        db=server_config.redis.db,
+        password=server_config.redis.password
+    )
+    user_repository = RedisUserRepository(user_data_client, user_lock=user_lock, codec=user_data_codec)
+    metrics.register_collector("user_repository", user_repository.stats)
+    metrics.register_collector("user_data_codec", user_data_codec.stats)
+    group_commit_config = server_config.redis.group_commit
+    if group_commit_config.enabled:
+        user_repository = GroupCommitUserRepository(user_repository, window_ms=group_commit_config.window_ms)
+        metrics.register_collector("group_commit", user_repository.stats)
     user_domain_service = UserDomainService(wasm_instance)
     user_service = UserService(user_repository, user_domain_service)
-    openrpc_server = OpenRpcServer(user_service)
+    metrics.register_collector("user_aggregates_coalescing", user_service.aggregates_flight.stats)
+    compression_config = server_config.jsonrpc.compression
+    compressor = None
+    if compression_config.enabled:
+        compressor = ResponseCompressor(
+            min_size=compression_config.min_size,
+            level=compression_config.level,
+            cache_size=compression_config.cache_size,
+            metrics=metrics
+        )
+    idempotency_store = None
+    if server_config.jsonrpc.idempotency.enabled:
+        idempotency_store = RedisIdempotencyStore(
+            redis_client,
+            ttl_seconds=server_config.jsonrpc.idempotency.ttl_seconds
+        )
+    lanes_config = server_config.jsonrpc.lanes
+    scheduler = None
+    if lanes_config.enabled:
+        scheduler = LaneScheduler({
+            Lane.READ: LaneLimits(lanes_config.read.concurrency, lanes_config.read.max_queue),
+            Lane.WRITE: LaneLimits(lanes_config.write.concurrency, lanes_config.write.max_queue)
+        }, metrics=metrics)
+    concurrency_limit_config = server_config.jsonrpc.concurrency_limit
+    limiter = None
+    if concurrency_limit_config.enabled:
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=concurrency_limit_config.initial_limit,
+            min_limit=concurrency_limit_config.min_limit,
+            max_limit=concurrency_limit_config.max_limit,
+            latency_threshold_ms=concurrency_limit_config.latency_threshold_ms,
+            backoff_ratio=concurrency_limit_config.backoff_ratio
+        )
+    rate_limit_config = server_config.api.rate_limit
+    rate_limiter = None
+    if rate_limit_config.enabled and not rate_limit_config.client_header:
+        # NGINX 뒤에서는 연결 상대 주소가 모두 프록시 주소이므로 모든 클라이언트가 한도 하나를 나눠 쓰게 됨
+        print("⚠️  api.rate_limit.client_header is not set, per-client rate limiting is disabled")
+    elif rate_limit_config.enabled:
+        rate_limiter = RateLimiter(
+            default_rule=RateLimitRule(rate_limit_config.window_ms, rate_limit_config.max_requests),
+            method_rules={
+                method: RateLimitRule(rule.window_ms, rule.max_requests)
+                for method, rule in rate_limit_config.methods.items()
+            },
+            shared=RedisSlidingWindowLimiter(redis_client),
+            client_header=rate_limit_config.client_header,
+            metrics=metrics
+        )
+    openrpc_server = OpenRpcServer(
+        user_service,
+        batch_limit=server_config.jsonrpc.batch_limit,
+        timeout_ms=server_config.jsonrpc.timeout,
+        method_timeouts=server_config.jsonrpc.method_timeouts,
+        metrics=metrics,
+        openrpc_spec=openrpc_spec,
+        notification_queue=NotificationQueue(
+            max_size=server_config.jsonrpc.notifications.queue_size,
+            concurrency=server_config.jsonrpc.notifications.concurrency,
+            drop_policy=DropPolicy(server_config.jsonrpc.notifications.drop_policy),
+            metrics=metrics
+        ),
+        compressor=compressor,
+        idempotency_store=idempotency_store,
+        scheduler=scheduler,
+        limiter=limiter,
+        rate_limiter=rate_limiter,
+        user_batch_limit=server_config.jsonrpc.user_batch_limit
+    )
+    openrpc_server.start()
     
     # OpenRPC 라우트 설정
     setup_openrpc_routes(app, openrpc_server)
+    
+    # WebSocket 트랜스포트 (하나의 연결에서 요청 다중화)
+    websocket_config = server_config.jsonrpc.websocket
+    if websocket_config.enabled:
+        setup_websocket_routes(app, WebSocketRpcTransport(
+            openrpc_server,
+            max_in_flight=websocket_config.max_in_flight,
+            send_queue_size=websocket_config.send_queue_size
+        ))
+    
+    # 내부 서비스용 TCP 리스너 (uvicorn과 같은 이벤트 루프에서 실행)
+    tcp_config = server_config.jsonrpc.tcp
+    if tcp_config.enabled:
+        tcp_rpc_server = TcpRpcServer(
+            openrpc_server,
+            host=tcp_config.host,
+            port=tcp_config.port,
+            max_connections=tcp_config.max_connections,
+            max_in_flight=tcp_config.max_in_flight,
+            send_queue_size=tcp_config.send_queue_size,
+            max_frame_size=tcp_config.max_frame_size
+        )
+        await tcp_rpc_server.start()
+        print(f"🔌 JSON RPC TCP listener: {tcp_config.host}:{tcp_config.port}")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """서버 종료시 정리"""
+    # TCP 리스너 종료
+    if tcp_rpc_server:
+        await tcp_rpc_server.stop()
+    # 알림 큐 등 백그라운드 작업 종료
+    if openrpc_server:
+        await openrpc_server.stop()
     # Redis 클라이언트 정리 등
-    pass
 
 
-# JSON RPC 엔드포인트는 setup_openrpc_routes에서 처리
+# 운영 트래픽용 JSON RPC 엔드포인트(/api/jsonrpc)는 setup_openrpc_routes에서 처리 (bytes fast path)
 
-# Swagger UI용 JSON-RPC 테스트 엔드포인트 추가
-@app.post("/api/jsonrpc", 
-    summary="JSON-RPC 2.0 Endpoint",
-    description="JSON-RPC 2.0 엔드포인트. 완전한 JSON-RPC 기능은 OpenRPC Playground (/docs)를 사용하세요.",
-    response_model=JsonRpcResponseBody,
+# Swagger UI용 JSON-RPC 테스트 엔드포인트 (문서화 전용 경로)
+@app.post("/api/jsonrpc/swagger", 
+    summary="JSON-RPC 2.0 Endpoint (Swagger)",
+    description="Swagger 문서화/테스트용 JSON-RPC 2.0 엔드포인트. 운영 트래픽은 /api/jsonrpc를 사용하고, 완전한 JSON-RPC 기능은 OpenRPC Playground (/docs)를 사용하세요.",
+    response_model=Union[JsonRpcResponseBody, List[JsonRpcResponseBody]],
     tags=["JSON-RPC"])
-async def swagger_jsonrpc_endpoint(request_body: JsonRpcRequestBody):
+async def swagger_jsonrpc_endpoint(request_body: Union[JsonRpcRequestBody, List[JsonRpcRequestBody]]):
     """
     Swagger UI용 JSON-RPC 엔드포인트
+    요청/응답 Pydantic 모델 검증을 거치므로 운영 트래픽에는 /api/jsonrpc 사용
     
     **사용 가능한 메서드:**
     - `calculator.add`: 두 숫자 덧셈 (Rust WASM)
     - `getUserAggregates`: 사용자 데이터 조회
+    - `getUserAggregatesBatch`: 여러 사용자 데이터 일괄 조회
     
     **calculator.add 예시:**
     - params: `{"a": 10, "b": 20}`
@@ -156,21 +301,65 @@ async def swagger_jsonrpc_endpoint(request_body: JsonRpcRequestBody):
     
     **getUserAggregates 예시:**
     - params: `{"userId": "user123"}`
+    
+    **getUserAggregatesBatch 예시:**
+    - params: `{"userIds": ["user123", "user456"]}`
+    - 결과: `{"users": {"user123": {...}}, "missing": ["user456"]}` (최대 사용자 수는 `jsonrpc.user_batch_limit`)
+    
+    **배치 요청:**
+    - 요청 객체 배열을 보내면 동시에 실행되고 요청 순서대로 응답 배열을 반환
+    - 최대 배치 크기는 설정 파일의 `jsonrpc.batch_limit`
     """
     global openrpc_server
     if not openrpc_server:
         raise HTTPException(status_code=500, detail="OpenRPC server not initialized")
     
     # Pydantic 모델을 dict로 변환
-    request_dict = request_body.model_dump()
-    response_data = await openrpc_server.handle_request(request_dict)
+    if isinstance(request_body, list):
+        request_data = [item.model_dump() for item in request_body]
+    else:
+        request_data = request_body.model_dump()
+    response_data = await openrpc_server.handle_request(request_data)
     return response_data
 
 
+def describe_listeners() -> List[Dict[str, Any]]:
+    """리스너별 상태 (HTTP TCP / Unix 도메인 소켓 / JSON RPC TCP)"""
+    listeners = []
+    for sock in listen_sockets:
+        if sock.family == socket.AF_UNIX:
+            path = sock.getsockname()
+            listeners.append({
+                "type": "unix",
+                "address": path,
+                # 소켓 파일이 지워지면 프록시가 더 이상 연결할 수 없음
+                "ok": sock.fileno() != -1 and Path(path).is_socket()
+            })
+        else:
+            host, port = sock.getsockname()[:2]
+            listeners.append({"type": "tcp", "address": f"{host}:{port}", "ok": sock.fileno() != -1})
+    if tcp_rpc_server:
+        listeners.append({
+            "type": "jsonrpc_tcp",
+            "address": f"{tcp_rpc_server.host}:{tcp_rpc_server.port}",
+            "ok": tcp_rpc_server.is_serving
+        })
+    return listeners
+
+
 @app.get("/health")
 async def health_check():
-    """헬스 체크 엔드포인트"""
-    return {"status": "healthy", "service": "hand-in-hand-game-server"}
+    """헬스 체크 엔드포인트 (모든 리스너 상태 포함, 하나라도 비정상이면 503)"""
+    listeners = describe_listeners()
+    healthy = all(listener["ok"] for listener in listeners)
+    body = {
+        "status": "healthy" if healthy else "unhealthy",
+        "service": "hand-in-hand-game-server",
+        "listeners": listeners
+    }
+    if not healthy:
+        return JSONResponse(status_code=503, content=body)
+    return body
 
 
 @app.get("/")
@@ -183,20 +372,68 @@ async def root():
         "environment": server_config.environment,
         "api": "JSON RPC 2.0",
         "endpoint": "/api/jsonrpc",
+        "swagger_endpoint": "/api/jsonrpc/swagger",
         "documentation": "/docs",
         "openrpc_spec": "/docs/openrpc.json"
     }
 
 
+def bind_unix_socket(path: str, mode: int) -> socket.socket:
+    """
+    Unix 도메인 소켓 생성
+    이전 실행에서 남은 소켓 파일은 제거하고, 파일 권한을 설정값으로 변경
+    
+    Args:
+        path: 소켓 파일 경로
+        mode: 소켓 파일 권한 (예: 0o660)
+        
+    Returns:
+        socket.socket: listen 중인 소켓
+    """
+    socket_path = Path(path)
+    if socket_path.exists():
+        if not socket_path.is_socket():
+            raise RuntimeError(f"Unix socket path exists and is not a socket: {path}")
+        socket_path.unlink()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(socket_path))
+    os.chmod(socket_path, mode)
+    sock.listen(socket.SOMAXCONN)
+    return sock
+
+
+def create_listen_sockets(server_info: ServerInfo) -> List[socket.socket]:
+    """
+    HTTP 리스너 소켓 생성 (TCP, Unix 도메인 소켓 또는 둘 다)
+    
+    Args:
+        server_info: python 서버 설정
+        
+    Returns:
+        List[socket.socket]: uvicorn에 전달할 소켓 목록
+    """
+    sockets = []
+    unix_socket = server_info.unix_socket
+    if unix_socket is None or unix_socket.tcp_enabled:
+        sockets.append(socket.create_server((server_info.host, server_info.port), backlog=socket.SOMAXCONN))
+    if unix_socket:
+        sockets.append(bind_unix_socket(unix_socket.path, unix_socket.mode))
+    return sockets
+
+
 def main():
     """메인 진입점"""
-    global server_config, wasm_file_path
+    global server_config, wasm_file_path, openrpc_spec_path, listen_sockets
     
     # 명령행 인자 파싱
     parser = argparse.ArgumentParser(description="Hand in Hand Game Server - Python")
     parser.add_argument("--config", required=True, help="Config file path")
     parser.add_argument("--wasm", 
                        help="WASM module file path (default: ../shared/domain-rust/pkg-wasmtime/domain_rust.wasm)")
+    parser.add_argument("--openrpc-spec",
+                       help="OpenRPC spec file path (default: ../shared/docs/openrpc.json)")
     args = parser.parse_args()
     
     # 설정 파일 로드
@@ -207,6 +444,7 @@ def main():
     
     server_config = config
     wasm_file_path = args.wasm  # WASM 경로 저장
+    openrpc_spec_path = args.openrpc_spec  # OpenRPC 스펙 경로 저장
     
     # 앱 초기화
     init_app()
@@ -214,14 +452,25 @@ def main():
     # OpenRPC 라우트 설정 (나중에 startup에서 openrpc_server 초기화 후 설정)
     pass
     
-    # 서버 실행
+    # 서버 실행 (미리 생성한 TCP / Unix 도메인 소켓에서 동시에 수신)
     import uvicorn
-    uvicorn.run(
+    listen_sockets = create_listen_sockets(server_config.python_server)
+    for sock in listen_sockets:
+        address = sock.getsockname()
+        print(f"🌐 HTTP listener: {address if sock.family == socket.AF_UNIX else f'{address[0]}:{address[1]}'}")
+    
+    server = uvicorn.Server(uvicorn.Config(
         app,
         host=server_config.python_server.host,
         port=server_config.python_server.port,
         log_level="debug" if server_config.debug else "info"
-    )
+    ))
+    try:
+        server.run(sockets=listen_sockets)
+    finally:
+        unix_socket = server_config.python_server.unix_socket
+        if unix_socket and Path(unix_socket.path).is_socket():
+            Path(unix_socket.path).unlink()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,69 @@
+"""
+HTTP 콘텐츠 인코딩 협상
+Accept-Encoding / If-None-Match 헤더 해석
+"""
+
+from typing import Dict, Optional
+
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """
+    Accept-Encoding 헤더 파싱
+
+    Args:
+        header: Accept-Encoding 헤더 값 (예: "gzip, deflate;q=0.5")
+
+    Returns:
+        Dict[str, float]: 인코딩 -> q 값
+    """
+    encodings: Dict[str, float] = {}
+    if not header:
+        return encodings
+
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        encodings[name] = quality
+    return encodings
+
+
+def accepts_encoding(header: Optional[str], encoding: str) -> bool:
+    """클라이언트가 해당 인코딩을 허용하는지 확인 (q=0은 거부)"""
+    encodings = parse_accept_encoding(header)
+    quality = encodings.get(encoding, encodings.get("*", 0.0))
+    return quality > 0
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교)
+
+    Args:
+        if_none_match: If-None-Match 헤더 값
+        etag: 현재 리소스의 ETag (따옴표 포함)
+
+    Returns:
+        bool: 일치하면 True (304 응답 대상)
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
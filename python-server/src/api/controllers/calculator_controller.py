@@ -18,6 +18,13 @@ from src.domain.user.aggregates.user_aggregates import ProfileEntity
 logger = logging.getLogger(__name__)
 
 
+def _required_exp(level: int) -> int:
+    """해당 레벨을 달성하는 데 필요한 누적 경험치 (레벨 곡선: 100 * level^1.5, 레벨 0 이하는 0)"""
+    if level <= 0:
+        return 0
+    return int(100 * (level ** 1.5))
+
+
 class CalculatorController:
     """계산기 관련 JSON RPC 핸들러 (Go-style naming)"""
     
@@ -38,7 +45,13 @@ class CalculatorController:
                 stderr=subprocess.PIPE
             )
             
-            stdout, stderr = await result.communicate()
+            try:
+                stdout, stderr = await result.communicate()
+            except asyncio.CancelledError:
+                # 요청 타임아웃으로 취소되면 자식 프로세스도 함께 종료 (종료 상태를 회수해야 좀비 프로세스가 남지 않음)
+                result.kill()
+                await asyncio.shield(result.wait())
+                raise
             
             if result.returncode != 0:
                 raise Exception(f"Node.js script failed: {stderr.decode()}")
@@ -70,7 +83,7 @@ class CalculatorController:
             # Basic level up logic: 100 * (level-1)^1.5
             new_level = old_level
             while new_level < 100:
-                required_exp = int(100 * ((new_level) ** 1.5)) if new_level > 1 else 100
+                required_exp = _required_exp(new_level) if new_level > 1 else 100
                 if current_exp >= required_exp:
                     new_level += 1
                 else:
@@ -82,13 +95,13 @@ class CalculatorController:
             level_increased = new_level > old_level
             exp_to_next = 0
             if new_level < 100:
-                required_exp = int(100 * ((new_level) ** 1.5))
+                required_exp = _required_exp(new_level)
                 exp_to_next = max(0, required_exp - current_exp)
             
             progress = 0.0
             if new_level < 100:
-                current_level_exp = int(100 * ((new_level - 1) ** 1.5)) if new_level > 1 else 0
-                next_level_exp = int(100 * ((new_level) ** 1.5))
+                current_level_exp = _required_exp(new_level - 1)
+                next_level_exp = _required_exp(new_level)
                 if next_level_exp > current_level_exp:
                     progress = ((current_exp - current_level_exp) / (next_level_exp - current_level_exp)) * 100
             
@@ -0,0 +1,148 @@
+"""
+JSON RPC 2.0 바이트 인코딩/디코딩
+요청 본문 bytes를 한 번만 파싱하고, 응답은 미리 인코딩된 조각을 이어 붙여 bytes로 직접 생성
+"""
+
+import json
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+JSON_MEDIA_TYPE = "application/json"
+
+# 미리 인코딩된 응답 조각
+_RESULT_PREFIX = b'{"jsonrpc":"2.0","result":'
+_ERROR_PREFIX = b'{"jsonrpc":"2.0","error":'
+_ID_INFIX = b',"id":'
+_SUFFIX = b'}'
+_NULL = b'null'
+
+
+@dataclass(frozen=True)
+class TaggedResult:
+    """
+    버전 태그가 붙은 메서드 결과
+    태그가 같으면 내용도 같으므로 직렬화/압축 결과를 캐시에서 재사용 가능
+    """
+    value: Any
+    tag: str
+
+
+@dataclass(frozen=True)
+class DirectResult:
+    """
+    JSON으로 직접 인코딩하는 메서드 결과
+    JSON 응답은 encode(source)로 중간 dict 없이 bytes를 만들고,
+    MessagePack 응답이나 내부 호출처럼 값이 필요할 때만 to_value(source)로 변환
+    """
+    source: Any
+    encode: Callable[[Any], bytes]
+    to_value: Callable[[Any], Any]
+
+
+def untag(result: Any) -> Any:
+    """TaggedResult/DirectResult면 실제 결과 값 반환"""
+    if isinstance(result, TaggedResult):
+        result = result.value
+    if isinstance(result, DirectResult):
+        return result.to_value(result.source)
+    return result
+
+
+def untag_response(response: Any) -> Any:
+    """응답 dict(또는 배치 배열)의 TaggedResult/DirectResult를 실제 결과 값으로 교체"""
+    if isinstance(response, list):
+        return [untag_response(item) for item in response]
+    if isinstance(response, dict) and isinstance(response.get("result"), (TaggedResult, DirectResult)):
+        return {**response, "result": untag(response["result"])}
+    return response
+
+
+def _default(obj: Any) -> Any:
+    """표준 JSON으로 직렬화되지 않는 도메인 값 변환"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if ORJSON_AVAILABLE:
+    def loads(data: bytes) -> Any:
+        """JSON bytes 파싱 (orjson)"""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """JSON bytes 직렬화 (orjson)"""
+        return orjson.dumps(obj, default=_default)
+else:
+    _encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_default)
+
+    def loads(data: bytes) -> Any:
+        """JSON bytes 파싱 (표준 json)"""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """JSON bytes 직렬화 (표준 json)"""
+        return _encoder.encode(obj).encode("utf-8")
+
+
+def encode_id(request_id: Any) -> bytes:
+    """요청 ID 인코딩 (대부분 정수/문자열이므로 null은 상수로 처리)"""
+    if request_id is None:
+        return _NULL
+    return dumps(request_id)
+
+
+def encode_result(result: Any) -> bytes:
+    """메서드 결과 인코딩 (DirectResult는 전용 인코더 사용)"""
+    if isinstance(result, TaggedResult):
+        result = result.value
+    if isinstance(result, DirectResult):
+        return result.encode(result.source)
+    return dumps(result)
+
+
+def encode_success(result: Any, request_id: Any) -> bytes:
+    """성공 응답을 bytes로 직접 생성"""
+    return b"".join((_RESULT_PREFIX, encode_result(result), _ID_INFIX, encode_id(request_id), _SUFFIX))
+
+
+def success_parts(request_id: Any) -> tuple[bytes, bytes]:
+    """
+    성공 응답에서 result 앞뒤 조각
+    result 조각을 따로 인코딩/압축해 이어 붙일 때 사용
+
+    Returns:
+        tuple[bytes, bytes]: (result 앞 조각, result 뒤 조각)
+    """
+    return _RESULT_PREFIX, b"".join((_ID_INFIX, encode_id(request_id), _SUFFIX))
+
+
+def encode_error(code: int, message: str, request_id: Any) -> bytes:
+    """에러 응답을 bytes로 직접 생성"""
+    error = dumps({"code": code, "message": message})
+    return b"".join((_ERROR_PREFIX, error, _ID_INFIX, encode_id(request_id), _SUFFIX))
+
+
+def encode_response(response: Any) -> bytes:
+    """응답 dict(또는 배치 배열)를 bytes로 인코딩"""
+    if isinstance(response, list):
+        return b"[" + b",".join(encode_response(item) for item in response) + b"]"
+
+    if "error" in response:
+        return b"".join((
+            _ERROR_PREFIX, dumps(response["error"]), _ID_INFIX, encode_id(response.get("id")), _SUFFIX
+        ))
+    return encode_success(response.get("result"), response.get("id"))
@@ -0,0 +1,135 @@
+"""
+읽기/쓰기 메서드 스케줄링 레인
+조회 메서드와 변경 메서드가 서로 다른 동시 실행 한도/대기 큐를 사용하여,
+쓰기 경합(버전 충돌 재시도 등)이 몰려도 가벼운 조회의 대기 시간이 늘어나지 않도록 분리
+
+레인 하나:
+- concurrency: 동시에 실행되는 메서드 수 상한
+- max_queue: 슬롯을 기다리는 요청 수 상한 (초과하면 대기하지 않고 LaneFullError)
+- 대기 요청은 도착 순서대로 슬롯을 받음
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from src.api.rpc_registry import RpcMethod
+from src.infrastructure.metrics.metrics import Metrics, metric_name
+
+
+class Lane(Enum):
+    """스케줄링 레인"""
+    READ = "read"  # 조회 메서드
+    WRITE = "write"  # 변경 메서드 (mutating=True로 등록)
+
+
+@dataclass
+class LaneLimits:
+    """레인 하나의 동시 실행 수/대기 큐 크기"""
+    concurrency: int
+    max_queue: int
+
+
+class LaneFullError(Exception):
+    """레인 대기 큐가 가득 참"""
+
+    def __init__(self, lane: Lane):
+        super().__init__(f"{lane.value} lane queue is full")
+        self.lane = lane
+
+
+@dataclass
+class _LaneState:
+    """레인 실행 상태"""
+    limits: LaneLimits
+    active: int = 0
+    waiters: Deque[asyncio.Future] = field(default_factory=deque)
+    rejected: int = 0
+
+
+class LaneScheduler:
+    """레인별 동시 실행 한도와 FIFO 대기 큐"""
+
+    def __init__(self, limits: Dict[Lane, LaneLimits], metrics: Optional[Metrics] = None):
+        self.metrics = metrics or Metrics()
+        self._lanes = {lane: _LaneState(limits=limits[lane]) for lane in Lane}
+
+        self.metrics.register_collector("lanes", self.stats)
+
+    @staticmethod
+    def lane_for(method: RpcMethod) -> Lane:
+        """메서드 레인 분류 (등록 시 mutating 플래그 기준)"""
+        return Lane.WRITE if method.mutating else Lane.READ
+
+    @asynccontextmanager
+    async def slot(self, lane: Lane, timeout: Optional[float] = None) -> AsyncIterator[None]:
+        """
+        레인 슬롯을 얻어 블록 실행 (블록이 끝나면 다음 대기 요청에 슬롯을 넘김)
+
+        Args:
+            lane: 실행할 레인
+            timeout: 최대 대기 시간 (초, None이면 슬롯이 날 때까지 대기)
+
+        Raises:
+            LaneFullError: 대기 큐가 가득 참
+            asyncio.TimeoutError: timeout 안에 슬롯을 얻지 못함
+        """
+        state = self._lanes[lane]
+        started = time.monotonic()
+        await self._acquire(lane, state, timeout)
+        self.metrics.observe(metric_name("rpc_lane_queue_wait", lane=lane.value), time.monotonic() - started)
+        try:
+            yield
+        finally:
+            self._release(state)
+
+    async def _acquire(self, lane: Lane, state: _LaneState, timeout: Optional[float]):
+        """슬롯 획득 (빈 슬롯이 있고 앞선 대기 요청이 없으면 즉시)"""
+        if state.active < state.limits.concurrency and not state.waiters:
+            state.active += 1
+            return
+
+        if len(state.waiters) >= state.limits.max_queue:
+            state.rejected += 1
+            self.metrics.increment(metric_name("rpc_lane_rejected_total", lane=lane.value))
+            raise LaneFullError(lane)
+
+        waiter = asyncio.get_running_loop().create_future()
+        state.waiters.append(waiter)
+        try:
+            # 슬롯은 _release가 waiter를 완료시키며 active 수를 유지한 채 넘겨줌
+            await asyncio.wait_for(waiter, timeout)
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 넘겨받은 직후 취소됨: 다음 대기 요청에 다시 넘김
+                self._release(state)
+            elif waiter in state.waiters:
+                state.waiters.remove(waiter)
+            raise
+
+    @staticmethod
+    def _release(state: _LaneState):
+        """슬롯 반환 (대기 요청이 있으면 바로 넘김)"""
+        while state.waiters:
+            waiter = state.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        state.active -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """레인별 실행/대기 수 (메트릭 수집기)"""
+        return {
+            lane.value: {
+                "active": state.active,
+                "queued": len(state.waiters),
+                "concurrency": state.limits.concurrency,
+                "max_queue": state.limits.max_queue,
+                "rejected": state.rejected
+            }
+            for lane, state in self._lanes.items()
+        }
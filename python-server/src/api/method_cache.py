@@ -0,0 +1,79 @@
+"""
+JSON RPC 메서드 결과 캐시
+params만으로 결과가 정해지는 순수 메서드는 등록 시 CachePolicy를 지정하여 같은 params의 결과를 재사용
+
+- 키: params를 정렬된 키로 직렬화한 정규 문자열 (dict 조회 시 해시)
+- 만료: 저장 후 ttl_ms가 지나면 미스로 처리
+- 제거: max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+"""
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
+# 캐시 미스 표시 (None도 캐시할 수 있는 결과이므로 별도 객체 사용)
+MISS = object()
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """메서드 결과 캐시 정책"""
+    ttl_ms: int
+    max_entries: int = 1024
+
+
+class MethodResultCache:
+    """TTL + LRU 결과 캐시 (이벤트 루프 단일 스레드에서 사용)"""
+
+    def __init__(self, policy: CachePolicy):
+        self.policy = policy
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key_for(params: Dict[str, Any]) -> str:
+        """params의 정규 키 (키 순서/공백과 무관)"""
+        return json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+
+    def get(self, key: str) -> Any:
+        """
+        캐시 조회
+
+        Returns:
+            Any: 저장된 결과, 없거나 만료되었으면 MISS
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        self.misses += 1
+        return MISS
+
+    def put(self, key: str, value: Any):
+        """결과 저장 (가득 차면 가장 오래 사용되지 않은 항목 제거)"""
+        self._entries[key] = (time.monotonic() + self.policy.ttl_ms / 1000, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.policy.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미스 통계"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.policy.max_entries,
+            "ttl_ms": self.policy.ttl_ms,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
@@ -0,0 +1,66 @@
+"""
+JSON RPC 2.0 MessagePack 인코딩/디코딩
+JSON과 같은 요청/응답 구조를 MessagePack 바이너리로 주고받음
+
+도메인 값 인코딩 규칙 (JSON 응답과 동일한 값이 되도록 정의):
+- datetime: ISO 8601 문자열 (MessagePack timestamp 확장 타입은 사용하지 않음)
+- Enum (Rarity 등): enum 값 (예: "rare")
+- dataclass: 필드 dict
+"""
+
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+from src.api import jsonrpc_codec
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# 요청 Content-Type / Accept에서 MessagePack으로 인식하는 미디어 타입
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack", "application/vnd.msgpack")
+
+
+def _default(obj: Any) -> Any:
+    """MessagePack으로 직렬화되지 않는 도메인 값 변환"""
+    if isinstance(obj, (jsonrpc_codec.TaggedResult, jsonrpc_codec.DirectResult)):
+        return jsonrpc_codec.untag(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not MessagePack serializable")
+
+
+def loads(data: bytes) -> Any:
+    """
+    MessagePack bytes 파싱
+
+    Raises:
+        ValueError: 잘못된 MessagePack 데이터
+    """
+    try:
+        return msgpack.unpackb(data, raw=False)
+    except ValueError:
+        raise
+    except Exception as e:
+        raise ValueError(f"Invalid MessagePack: {e}") from e
+
+
+def dumps(obj: Any) -> bytes:
+    """MessagePack bytes 직렬화"""
+    return msgpack.packb(obj, default=_default, use_bin_type=True)
+
+
+def encode_response(response: Any) -> bytes:
+    """응답 dict(또는 배치 배열)를 MessagePack bytes로 인코딩"""
+    return dumps(jsonrpc_codec.untag_response(response))
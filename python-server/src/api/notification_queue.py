@@ -0,0 +1,114 @@
+"""
+JSON RPC 알림(notification) 백그라운드 큐
+id가 없는 요청은 응답을 기다리지 않으므로 제한된 인메모리 큐에 넣고 별도 워커가 실행
+"""
+
+import asyncio
+import logging
+from collections import deque
+from enum import Enum
+from typing import Awaitable, Callable, Deque, List, Optional
+
+from src.infrastructure.metrics.metrics import Metrics
+
+logger = logging.getLogger(__name__)
+
+NotificationJob = Callable[[], Awaitable[None]]
+
+
+class DropPolicy(Enum):
+    """큐가 가득 찼을 때의 처리 방식"""
+    DROP_NEWEST = "drop_newest"  # 새로 들어온 알림을 버림
+    DROP_OLDEST = "drop_oldest"  # 가장 오래 대기한 알림을 버리고 새 알림을 넣음
+
+
+class NotificationQueue:
+    """크기와 동시 실행 수가 제한된 알림 실행 큐"""
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        concurrency: int = 4,
+        drop_policy: DropPolicy = DropPolicy.DROP_NEWEST,
+        metrics: Optional[Metrics] = None
+    ):
+        self.max_size = max_size
+        self.concurrency = concurrency
+        self.drop_policy = drop_policy
+        self.metrics = metrics or Metrics()
+
+        self._jobs: Deque[NotificationJob] = deque()
+        self._ready: Optional[asyncio.Event] = None
+        self._workers: List[asyncio.Task] = []
+        self._in_flight = 0
+
+        self.metrics.register_collector("notifications", self.stats)
+
+    def start(self):
+        """워커 시작 (이벤트 루프 안에서 호출)"""
+        if self._workers:
+            return
+        self._ready = asyncio.Event()
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def stop(self):
+        """워커 종료 (대기 중인 알림은 버림)"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._jobs.clear()
+
+    def submit(self, job: NotificationJob) -> bool:
+        """
+        알림 작업 등록 (대기하지 않음)
+
+        Args:
+            job: 실행할 비동기 작업
+
+        Returns:
+            bool: 큐에 들어갔으면 True, 드롭 정책에 따라 버려졌으면 False
+        """
+        if not self._workers:
+            self.start()
+
+        if len(self._jobs) >= self.max_size:
+            self.metrics.increment("notifications_dropped_total")
+            if self.drop_policy == DropPolicy.DROP_NEWEST:
+                return False
+            self._jobs.popleft()
+
+        self._jobs.append(job)
+        self._ready.set()
+        return True
+
+    def stats(self) -> dict:
+        """큐 상태 (메트릭 수집기)"""
+        return {
+            "depth": len(self._jobs),
+            "capacity": self.max_size,
+            "in_flight": self._in_flight,
+            "workers": len(self._workers),
+            "drop_policy": self.drop_policy.value
+        }
+
+    async def _worker(self):
+        """큐에서 알림을 꺼내 실행"""
+        while True:
+            if not self._jobs:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+
+            job = self._jobs.popleft()
+            self._in_flight += 1
+            try:
+                await job()
+                self.metrics.increment("notifications_processed_total")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.metrics.increment("notifications_failed_total")
+                logger.warning(f"Notification failed: {e}")
+            finally:
+                self._in_flight -= 1
@@ -4,34 +4,41 @@ OpenRPC 표준 기반 JSON RPC 2.0 서버
 """
 
 import json
-from typing import Any, Dict, Optional
+import time
+import asyncio
+import logging
+from dataclasses import replace
+from typing import Any, Dict, List, Mapping, Optional, Union
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field, ValidationError
 
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from src.application.user.services.user_service import UserService
+from src.domain.user.aggregates import UserAggregates
+from src.domain.user.repositories.user_repository import UserRepositoryManyResult
 from src.api.controllers.calculator_controller import CalculatorController
+from src.api import jsonrpc_codec, rpc_codecs
+from src.api.openrpc_spec import OpenRpcSpec
+from src.api.content_encoding import accepts_encoding, etag_matches
+from src.api.rpc_registry import RpcError, RpcMethod, RpcMethodRegistry, rpc_method
+from src.api.method_cache import MISS, CachePolicy
+from src.api.notification_queue import NotificationQueue
+from src.api.lane_scheduler import LaneFullError, LaneScheduler
+from src.api.response_compression import ResponseCompressor
+from src.api.rpc_codecs import JSON_CODEC, RpcCodec
+from src.api.rpc_context import EMPTY_CONTEXT, RpcContext, parse_deadline
+from src.api.rate_limiter import RateLimiter
+from src.api.user_aggregates_encoder import encode_user_aggregates, encode_user_aggregates_batch
+from src.infrastructure.concurrency.adaptive_limiter import AdaptiveConcurrencyLimiter
+from src.infrastructure.concurrency.deadline import deadline_scope, is_expired, remaining_ms
+from src.infrastructure.metrics.metrics import Metrics, metric_name
+from src.infrastructure.idempotency.redis_idempotency_store import RedisIdempotencyStore, request_fingerprint
 
-
-class JsonRpcRequest(BaseModel):
-    """JSON RPC 2.0 요청 모델"""
-    jsonrpc: str = Field("2.0", description="JSON RPC 버전")
-    method: str = Field(..., description="호출할 메서드명")
-    params: Optional[Dict[str, Any]] = Field(None, description="메서드 파라미터")
-    id: Optional[Any] = Field(None, description="요청 ID")
-
-
-class JsonRpcResponse(BaseModel):
-    """JSON RPC 2.0 응답 모델"""
-    jsonrpc: str = Field("2.0", description="JSON RPC 버전")
-    result: Optional[Any] = Field(None, description="성공 결과")
-    error: Optional[Dict[str, Any]] = Field(None, description="에러 정보")
-    id: Optional[Any] = Field(None, description="요청 ID")
+logger = logging.getLogger(__name__)
 
 
 class JsonRpcError:
@@ -44,91 +51,671 @@ class JsonRpcError:
     
     # 커스텀 에러 코드
     USER_NOT_FOUND = -32001  # 사용자를 찾을 수 없음
+    REQUEST_TIMEOUT = -32002  # 요청 처리 시간 초과
+    IDEMPOTENCY_KEY_REUSED = -32003  # 같은 멱등성 키가 다른 요청에 사용됨
+    DEADLINE_EXCEEDED = -32004  # 클라이언트 데드라인 초과 (응답을 기다리는 클라이언트가 없음)
+    SERVER_OVERLOADED = -32005  # 서버 과부하 (대기 큐 초과, 잠시 후 재시도)
+    RATE_LIMITED = -32006  # 클라이언트 요청 한도 초과 (data.retry_after_ms 후 재시도)
+
+
+# 멱등성 키 선점 유지 시간 = 메서드 타임아웃 + 여유
+IDEMPOTENCY_LOCK_MARGIN_MS = 5000
+
+# 결과가 불확실하여 저장하지 않는 에러 (같은 멱등성 키로 다시 실행 가능)
+RETRYABLE_ERROR_CODES = frozenset({-32603, -32002, -32004})
+
+
+# 자주 쓰이는 고정 응답은 미리 인코딩
+PARSE_ERROR_RESPONSE = jsonrpc_codec.encode_error(JsonRpcError.PARSE_ERROR, "Parse error", None)
+
+# 현재 동시 처리 한도를 알리는 응답 헤더 (NGINX가 다른 서버로 트래픽을 옮기는 판단에 사용)
+CONCURRENCY_LIMIT_HEADER = "X-Concurrency-Limit"
 
 
 class OpenRpcServer:
     """OpenRPC 표준 JSON RPC 2.0 서버"""
     
-    def __init__(self, user_service: UserService):
+    def __init__(
+        self,
+        user_service: UserService,
+        batch_limit: int = 10,
+        timeout_ms: int = 30000,
+        method_timeouts: Optional[Dict[str, int]] = None,
+        metrics: Optional[Metrics] = None,
+        openrpc_spec: Optional[OpenRpcSpec] = None,
+        notification_queue: Optional[NotificationQueue] = None,
+        compressor: Optional[ResponseCompressor] = None,
+        idempotency_store: Optional[RedisIdempotencyStore] = None,
+        scheduler: Optional[LaneScheduler] = None,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        user_batch_limit: int = 100
+    ):
         self.user_service = user_service
+        self.batch_limit = batch_limit
+        # getUserAggregatesBatch 한 번에 조회할 수 있는 최대 사용자 수
+        self.user_batch_limit = user_batch_limit
+        self.timeout_ms = timeout_ms
+        self.method_timeouts = method_timeouts or {}
+        self.metrics = metrics or Metrics()
+        self.notification_queue = notification_queue or NotificationQueue(metrics=self.metrics)
+        # None이면 응답을 압축하지 않음
+        self.compressor = compressor
+        # None이면 Idempotency-Key를 무시
+        self.idempotency_store = idempotency_store
+        # None이면 읽기/쓰기 레인 없이 바로 실행
+        self.scheduler = scheduler
+        # None이면 요청 수락 제한 없음
+        self.limiter = limiter
+        if limiter is not None:
+            self.metrics.register_collector("concurrency_limit", limiter.stats)
+        # None이면 클라이언트별 요청 제한 없음
+        self.rate_limiter = rate_limiter
+        if rate_limiter is not None:
+            self.metrics.register_collector("rate_limit", rate_limiter.stats)
         self.calculator_controller = CalculatorController(user_service.user_domain_service)
-        self.methods = {
-            "getUserAggregates": self._get_user_aggregates,
-            "calculator.add": self._calculator_add,
-            "profile.addExp": self._profile_add_exp
-        }
+        
+        # OpenRPC 스펙은 시작 시 한 번만 로드하여 params 검증 함수로 컴파일
+        # (스펙 없이 시작하면 모든 메서드가 params 검증 없이 노출되므로 시작하지 않음)
+        if openrpc_spec is None:
+            openrpc_spec, error = OpenRpcSpec.load()
+            if error:
+                raise RuntimeError(f"OpenRPC spec not loaded, params validation unavailable: {error}")
+        self.openrpc_spec = openrpc_spec
+        self.registry = RpcMethodRegistry(openrpc_spec.document)
+        self.registry.register_object(self)
+        self.metrics.register_collector("method_cache", self.registry.cache_stats)
+    
+    def start(self):
+        """백그라운드 작업 시작 (이벤트 루프 안에서 호출)"""
+        self.notification_queue.start()
     
-    async def handle_request(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def stop(self):
+        """백그라운드 작업 종료"""
+        await self.notification_queue.stop()
+    
+    async def handle_request(
+        self,
+        request_data: Union[Dict[str, Any], List[Any]],
+        context: Optional[RpcContext] = None
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]], None]:
         """
-        JSON RPC 2.0 요청 처리
+        JSON RPC 2.0 요청 처리 (단일 요청 및 배치 요청)
         
         Args:
-            request_data: JSON RPC 요청 데이터
+            request_data: JSON RPC 요청 데이터 (객체 또는 배치 배열)
+            context: 요청 컨텍스트 (멱등성 키 등)
             
         Returns:
-            Dict[str, Any]: JSON RPC 응답
+            Union[Dict[str, Any], List[Dict[str, Any]], None]: JSON RPC 응답
+                (배치 요청이면 요청 순서대로 정렬된 배열, 알림만 있으면 None,
+                동시 처리 한도를 넘으면 실행하지 않고 SERVER_OVERLOADED 에러)
         """
+        started = self.try_admit()
+        if started is None:
+            return self._overloaded_response(request_data.get("id") if isinstance(request_data, dict) else None)
         try:
-            # 요청 검증
-            rpc_request = JsonRpcRequest(**request_data)
+            return jsonrpc_codec.untag_response(await self._dispatch(request_data, context or EMPTY_CONTEXT))
+        finally:
+            self.finish_admitted(started)
+    
+    def try_admit(self) -> Optional[float]:
+        """
+        적응형 동시 처리 한도에 따라 요청 수락 (대기하지 않음)
+        
+        Returns:
+            Optional[float]: 수락 시 시작 시각 (finish_admitted에 전달), 한도 초과면 None
+        """
+        if self.limiter is None:
+            return time.monotonic()
+        started = self.limiter.try_acquire()
+        if started is None:
+            self.metrics.increment("rpc_overload_rejected_total")
+        return started
+    
+    def finish_admitted(self, started: float):
+        """수락한 요청 완료 (처리 시간으로 동시 처리 한도 조절)"""
+        if self.limiter is not None:
+            self.limiter.release(started)
+    
+    def identify_client(self, headers: Mapping[str, str], peer_host: Optional[str]) -> Optional[str]:
+        """
+        요청 제한 대상 클라이언트 식별 (트랜스포트가 RpcContext.client_id에 설정)
+        
+        Args:
+            headers: 요청 헤더 (TCP처럼 헤더가 없으면 빈 dict)
+            peer_host: 연결 상대 주소
+            
+        Returns:
+            Optional[str]: 클라이언트 ID (요청 제한을 사용하지 않으면 None)
+        """
+        if self.rate_limiter is None:
+            return None
+        return self.rate_limiter.client_id(headers, peer_host)
+    
+    def _overloaded_response(self, request_id: Any) -> Dict[str, Any]:
+        """동시 처리 한도 초과 응답 (요청을 실행하지 않음)"""
+        return self._create_error_response(
+            JsonRpcError.SERVER_OVERLOADED, "Server overloaded: concurrency limit reached", request_id
+        )
+    
+    async def _dispatch(
+        self, request_data: Union[Dict[str, Any], List[Any]], context: RpcContext
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]], None]:
+        """단일/배치 요청 분기 (결과는 TaggedResult일 수 있음)"""
+        if isinstance(request_data, list):
+            return await self._handle_batch(request_data, context)
+        
+        return await self._handle_single(request_data, context)
+    
+    async def _handle_batch(
+        self, batch: List[Any], context: RpcContext
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]], None]:
+        """
+        JSON RPC 2.0 배치 요청 처리
+        배치 내 요청들은 서로 독립적이므로 동시에 실행하고, 응답은 요청 순서를 유지
+        
+        Args:
+            batch: JSON RPC 요청 배열
+            context: 요청 컨텍스트 (멱등성 키는 항목마다 요청 id를 붙여 구분)
             
-            # 메서드 존재 확인
-            if rpc_request.method not in self.methods:
+        Returns:
+            Union[Dict[str, Any], List[Dict[str, Any]], None]: 응답 배열
+                (배치 자체가 잘못된 경우 단일 에러 응답, 모두 알림이면 None)
+        """
+        if not batch:
+            return self._create_error_response(
+                JsonRpcError.INVALID_REQUEST,
+                "Invalid request: empty batch",
+                None
+            )
+        
+        if len(batch) > self.batch_limit:
+            return self._create_error_response(
+                JsonRpcError.INVALID_REQUEST,
+                f"Invalid request: batch size {len(batch)} exceeds limit {self.batch_limit}",
+                None
+            )
+        
+        # asyncio.gather는 입력 순서대로 결과를 반환, 알림에 대한 응답은 제외
+        responses = await asyncio.gather(*(
+            self._handle_single(item, self._batch_item_context(context, item)) for item in batch
+        ))
+        return [response for response in responses if response is not None] or None
+    
+    @staticmethod
+    def _batch_item_context(context: RpcContext, item: Any) -> RpcContext:
+        """배치 항목별 컨텍스트 (멱등성 키를 요청 id로 구분)"""
+        if not context.idempotency_key or not isinstance(item, dict):
+            return context
+        return replace(context, idempotency_key=f"{context.idempotency_key}:{item.get('id')}")
+    
+    async def _handle_single(self, request_data: Any, context: RpcContext = EMPTY_CONTEXT) -> Optional[Dict[str, Any]]:
+        """
+        단일 JSON RPC 2.0 요청 처리
+        
+        Args:
+            request_data: JSON RPC 요청 데이터
+            context: 요청 컨텍스트
+            
+        Returns:
+            Optional[Dict[str, Any]]: JSON RPC 응답 (알림이면 None)
+        """
+        if not isinstance(request_data, dict):
+            return self._create_error_response(
+                JsonRpcError.INVALID_REQUEST,
+                "Invalid request: request must be an object",
+                None
+            )
+        
+        # 요청 검증 (모델 객체를 만들지 않고 필드만 확인)
+        if not isinstance(request_data.get("method"), str):
+            return self._create_error_response(
+                JsonRpcError.INVALID_REQUEST,
+                "Invalid request: method must be a string",
+                None
+            )
+        
+        # id가 없으면 알림: 백그라운드 큐에서 실행하고 응답하지 않음
+        if "id" not in request_data:
+            self._submit_notification(request_data, context)
+            return None
+        
+        return await self._execute(request_data, context)
+    
+    def _submit_notification(self, request_data: Dict[str, Any], context: RpcContext = EMPTY_CONTEXT):
+        """
+        알림을 백그라운드 큐에 등록 (큐가 가득 차면 드롭 정책에 따라 버려짐)
+        
+        Args:
+            request_data: id가 없는 JSON RPC 요청
+            context: 요청 컨텍스트
+        """
+        async def run_notification():
+            response = await self._execute(request_data, context)
+            error = response.get("error")
+            if error:
+                raise RpcError(error["code"], f"{request_data['method']}: {error['message']}", error.get("data"))
+        
+        self.notification_queue.submit(run_notification)
+    
+    async def _execute(self, request_data: Dict[str, Any], context: RpcContext = EMPTY_CONTEXT) -> Dict[str, Any]:
+        """
+        메서드 조회, 파라미터 검증, 실행
+        
+        Args:
+            request_data: 구조 검증이 끝난 JSON RPC 요청
+            context: 요청 컨텍스트
+            
+        Returns:
+            Dict[str, Any]: JSON RPC 응답
+        """
+        request_id = request_data.get("id")
+        method_name = request_data["method"]
+        
+        # 메서드 존재 확인
+        method = self.registry.get(method_name)
+        if method is None:
+            return self._create_error_response(
+                JsonRpcError.METHOD_NOT_FOUND,
+                f"Method '{method_name}' not found",
+                request_id
+            )
+        
+        # 파라미터 검증 (서비스 코드 실행 전, 컴파일된 스펙 검증 함수 사용)
+        params, invalid = method.validator(request_data.get("params"))
+        if invalid:
+            return self._create_error_response(
+                JsonRpcError.INVALID_PARAMS,
+                "Invalid params",
+                request_id,
+                data=invalid
+            )
+        
+        # 큐에서 기다리는 동안 클라이언트 데드라인이 지났으면 Redis/WASM 작업 전에 버림
+        if is_expired(context.deadline):
+            self._count_deadline_exceeded(method.name)
+            return self._create_error_response(
+                JsonRpcError.DEADLINE_EXCEEDED,
+                f"Deadline exceeded: '{method.name}' was not started",
+                request_id
+            )
+        
+        # 클라이언트별 요청 제한 (로컬 토큰 버킷 -> Redis 슬라이딩 윈도우)
+        if self.rate_limiter is not None and context.client_id is not None:
+            retry_after_ms = await self.rate_limiter.check(context.client_id, method.name)
+            if retry_after_ms is not None:
                 return self._create_error_response(
-                    JsonRpcError.METHOD_NOT_FOUND,
-                    f"Method '{rpc_request.method}' not found",
-                    rpc_request.id
+                    JsonRpcError.RATE_LIMITED,
+                    "Rate limit exceeded",
+                    request_id,
+                    data={"retry_after_ms": retry_after_ms}
                 )
+        
+        # 순수 메서드: 같은 params의 결과가 캐시에 있으면 실행하지 않음 (레인 슬롯도 사용하지 않음)
+        cache_key = None
+        if method.cache is not None:
+            cache_key = method.cache.key_for(params)
+            cached = method.cache.get(cache_key)
+            if cached is not MISS:
+                return self._create_success_response(cached, request_id)
+        
+        if self.scheduler is None:
+            response = await self._run(method, params, request_id, context)
+        else:
+            response = await self._run_in_lane(method, params, request_id, context)
+        
+        if cache_key is not None and "result" in response:
+            method.cache.put(cache_key, response["result"])
+        return response
+    
+    async def _run_in_lane(
+        self, method: RpcMethod, params: Dict[str, Any], request_id: Any, context: RpcContext
+    ) -> Dict[str, Any]:
+        """
+        메서드 레인(읽기/쓰기)의 슬롯을 얻어 실행
+        쓰기 경합이 읽기 레인의 대기 시간에 영향을 주지 않도록 레인별로 동시 실행 수를 제한
+        
+        Args:
+            method: 등록된 메서드
+            params: 검증된 메서드 파라미터
+            request_id: 요청 ID
+            context: 요청 컨텍스트
+            
+        Returns:
+            Dict[str, Any]: JSON RPC 응답
+        """
+        lane = self.scheduler.lane_for(method)
+        budget_ms = remaining_ms(context.deadline)
+        acquired = False
+        try:
+            # 슬롯은 클라이언트 데드라인까지만 기다림
+            async with self.scheduler.slot(lane, None if budget_ms is None else max(budget_ms, 0) / 1000):
+                acquired = True
+                return await self._run(method, params, request_id, context)
+        except LaneFullError as e:
+            return self._create_error_response(
+                JsonRpcError.SERVER_OVERLOADED,
+                f"Server overloaded: {e}",
+                request_id
+            )
+        except asyncio.TimeoutError:
+            if acquired:
+                raise
+            self._count_deadline_exceeded(method.name)
+            return self._create_error_response(
+                JsonRpcError.DEADLINE_EXCEEDED,
+                f"Deadline exceeded: '{method.name}' was waiting in the {lane.value} lane",
+                request_id
+            )
+    
+    async def _run(
+        self, method: RpcMethod, params: Dict[str, Any], request_id: Any, context: RpcContext
+    ) -> Dict[str, Any]:
+        """멱등성 키 적용 여부에 따라 메서드 실행"""
+        # 변경 메서드 + 멱등성 키: 같은 키의 재시도는 첫 실행 응답을 재전송
+        if method.mutating and context.idempotency_key and self.idempotency_store:
+            return await self._invoke_idempotent(method, params, request_id, context)
+        
+        return await self._invoke(method, params, request_id, context.deadline)
+    
+    async def _invoke(
+        self, method: RpcMethod, params: Dict[str, Any], request_id: Any, deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        메서드 실행 후 결과/예외를 JSON RPC 응답으로 변환
+        
+        Args:
+            method: 등록된 메서드
+            params: 검증된 메서드 파라미터
+            request_id: 요청 ID
+            deadline: 클라이언트 마감 시각 (time.monotonic() 기준)
             
-            # 메서드 실행
-            method = self.methods[rpc_request.method]
-            result = await method(rpc_request.params or {})
+        Returns:
+            Dict[str, Any]: JSON RPC 응답
+        """
+        try:
+            # 메서드 실행 (타임아웃/데드라인 초과 시 코루틴 취소)
+            result = await self._call_with_deadline(method, params, deadline)
             
-            return self._create_success_response(result, rpc_request.id)
+            return self._create_success_response(result, request_id)
             
-        except ValidationError as e:
+        except RpcError as e:
+            return self._create_error_response(e.code, e.message, request_id, data=e.data)
+        except asyncio.TimeoutError:
             return self._create_error_response(
-                JsonRpcError.INVALID_REQUEST,
-                f"Invalid request: {str(e)}",
-                None
+                JsonRpcError.REQUEST_TIMEOUT,
+                f"Request timeout: '{method.name}' exceeded {self._timeout_ms_for(method.name)}ms",
+                request_id
             )
         except Exception as e:
             return self._create_error_response(
                 JsonRpcError.INTERNAL_ERROR,
                 f"Internal server error: {str(e)}",
-                request_data.get("id")
+                request_id
             )
     
-    async def _get_user_aggregates(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def _invoke_idempotent(
+        self, method: RpcMethod, params: Dict[str, Any], request_id: Any, context: RpcContext
+    ) -> Dict[str, Any]:
         """
-        getUserAggregates 메서드 구현
+        멱등성 키를 적용하여 메서드 실행
+        첫 요청만 실행하고 응답을 저장, 같은 키로 실행 중인 요청이 있으면 완료를 기다려 그 응답을 재전송
+        
+        Args:
+            method: 등록된 변경 메서드
+            params: 검증된 메서드 파라미터
+            request_id: 요청 ID
+            context: 요청 컨텍스트 (멱등성 키, 데드라인, 클라이언트 ID: 멱등성 키를 클라이언트별로 구분)
+            
+        Returns:
+            Dict[str, Any]: JSON RPC 응답
+        """
+        idempotency_key = self.idempotency_store.scoped_key(context.idempotency_key, context.client_id)
+        fingerprint = request_fingerprint(method.name, params)
+        timeout_ms = self._timeout_ms_for(method.name)
+        # 실행 중인 같은 키 요청은 클라이언트 데드라인까지만 기다림
+        budget_ms = remaining_ms(context.deadline)
+        wait_ms = timeout_ms if budget_ms is None else min(timeout_ms, budget_ms)
+        
+        try:
+            claim = await asyncio.wait_for(
+                self.idempotency_store.claim(idempotency_key, fingerprint, timeout_ms + IDEMPOTENCY_LOCK_MARGIN_MS),
+                wait_ms / 1000
+            )
+        except asyncio.TimeoutError:
+            return self._create_error_response(
+                JsonRpcError.REQUEST_TIMEOUT,
+                f"Request timeout: '{method.name}' is still running for this idempotency key",
+                request_id
+            )
+        except Exception as e:
+            # 저장소 장애 시 멱등성 없이 실행 (요청 자체는 실패시키지 않음)
+            logger.warning(f"Idempotency store unavailable, executing without idempotency: {e}")
+            return await self._invoke(method, params, request_id, context.deadline)
+        
+        if claim.conflict:
+            return self._create_error_response(
+                JsonRpcError.IDEMPOTENCY_KEY_REUSED,
+                "Idempotency key was already used for a different request",
+                request_id
+            )
+        if not claim.owner:
+            self.metrics.increment("idempotency_replays_total")
+            return {"jsonrpc": "2.0", **claim.response, "id": request_id}
+        
+        try:
+            response = await self._invoke(method, params, request_id, context.deadline)
+        except BaseException:
+            # 취소 등: 결과를 저장하지 않고 선점 해제 (같은 키로 다시 실행 가능)
+            await self._release_idempotency_key(idempotency_key, claim.token)
+            raise
+        
+        error = response.get("error")
+        if error is not None and error["code"] in RETRYABLE_ERROR_CODES:
+            await self._release_idempotency_key(idempotency_key, claim.token)
+            return response
+        
+        body = {"error": error} if error else {"result": jsonrpc_codec.untag(response["result"])}
+        try:
+            await self.idempotency_store.complete(idempotency_key, fingerprint, body, claim.token)
+        except Exception as e:
+            # 이미 실행된 요청이므로 응답은 그대로 반환 (선점은 만료될 때까지 남아 재시도가 바로 다시 실행하지 않음)
+            logger.warning(f"Failed to store idempotent response for '{method.name}': {e}")
+            self.metrics.increment("idempotency_store_errors_total")
+        return response
+    
+    async def _release_idempotency_key(self, idempotency_key: str, token: str):
+        """멱등성 키 선점 해제 (저장소 장애는 기록만 하고 응답에는 영향 없음)"""
+        try:
+            await asyncio.shield(self.idempotency_store.release(idempotency_key, token))
+        except Exception as e:
+            logger.warning(f"Failed to release idempotency key: {e}")
+            self.metrics.increment("idempotency_store_errors_total")
+    
+    def _timeout_ms_for(self, method_name: str) -> int:
+        """메서드별 타임아웃 (밀리초, 설정이 없으면 jsonrpc.timeout)"""
+        return self.method_timeouts.get(method_name, self.timeout_ms)
+    
+    async def _call_with_deadline(
+        self, method: RpcMethod, params: Dict[str, Any], deadline: Optional[float] = None
+    ) -> Any:
+        """
+        데드라인을 적용하여 메서드 실행
+        메서드 타임아웃과 클라이언트 데드라인 중 먼저 오는 시각에 실행 중인 코루틴을 취소
+        클라이언트 데드라인은 contextvar로 핸들러에 전달되어 Repository 재시도도 그 안에서만 수행
         
         Args:
-            params: 메서드 파라미터
+            method: 등록된 메서드
+            params: 검증된 메서드 파라미터
+            deadline: 클라이언트 마감 시각 (time.monotonic() 기준)
             
         Returns:
-            Dict[str, Any]: 사용자 전체 데이터
+            Any: 메서드 결과
             
         Raises:
-            Exception: 에러 발생 시
+            asyncio.TimeoutError: 메서드 타임아웃 초과
+            RpcError: 클라이언트 데드라인 초과 (DEADLINE_EXCEEDED)
         """
-        # 파라미터 검증
-        user_id = params.get("userId")
-        if not user_id:
-            raise ValueError("userId parameter is required")
+        timeout_ms = self._timeout_ms_for(method.name)
+        budget_ms = remaining_ms(deadline)
+        client_bound = budget_ms is not None and budget_ms < timeout_ms
         
+        try:
+            # wait_for가 만드는 Task는 현재 컨텍스트를 복사하므로 scope 안에서 시작
+            with deadline_scope(deadline):
+                return await asyncio.wait_for(
+                    method.handler(params), (budget_ms if client_bound else timeout_ms) / 1000
+                )
+        except asyncio.TimeoutError:
+            if client_bound:
+                self._count_deadline_exceeded(method.name)
+                raise RpcError(JsonRpcError.DEADLINE_EXCEEDED, f"Deadline exceeded: '{method.name}' was cancelled")
+            self.metrics.increment("rpc_timeouts_total")
+            self.metrics.increment(metric_name("rpc_timeouts_total", method=method.name))
+            raise
+    
+    def _count_deadline_exceeded(self, method_name: str):
+        """클라이언트 데드라인 초과 메트릭"""
+        self.metrics.increment("rpc_deadline_exceeded_total")
+        self.metrics.increment(metric_name("rpc_deadline_exceeded_total", method=method_name))
+    
+    async def handle_raw(self, body: bytes) -> Optional[bytes]:
+        """
+        JSON RPC 2.0 요청 처리 (bytes 입출력 fast path)
+        본문을 한 번만 파싱하고 응답을 bytes로 직접 인코딩
+        
+        Args:
+            body: HTTP 요청 본문
+            
+        Returns:
+            Optional[bytes]: 인코딩된 JSON RPC 응답 (알림만 있으면 None)
+        """
+        content, _ = await self.handle_http(body)
+        return content
+    
+    async def handle_http(
+        self,
+        body: bytes,
+        accept_encoding: Optional[str] = None,
+        request_codec: RpcCodec = JSON_CODEC,
+        response_codec: RpcCodec = JSON_CODEC,
+        context: Optional[RpcContext] = None
+    ) -> tuple[Optional[bytes], Optional[str]]:
+        """
+        HTTP 요청 처리 (협상된 코덱으로 입출력, Accept-Encoding에 따라 응답 압축)
+        
+        Args:
+            body: HTTP 요청 본문
+            accept_encoding: Accept-Encoding 헤더 값
+            request_codec: 요청 본문 코덱 (Content-Type)
+            response_codec: 응답 본문 코덱 (Accept)
+            context: 요청 컨텍스트 (HTTP 헤더에서 추출)
+            
+        Returns:
+            tuple[Optional[bytes], Optional[str]]: (응답 본문, Content-Encoding 값 또는 None)
+        """
+        try:
+            request_data = request_codec.loads(body)
+        except ValueError:
+            if response_codec is JSON_CODEC:
+                return PARSE_ERROR_RESPONSE, None
+            return response_codec.encode_response(
+                self._create_error_response(JsonRpcError.PARSE_ERROR, "Parse error", None)
+            ), None
+        
+        response_data = await self._dispatch(request_data, context or EMPTY_CONTEXT)
+        if response_data is None:
+            return None, None
+        
+        encoding = self.compressor.negotiate(accept_encoding) if self.compressor else None
+        if response_codec is JSON_CODEC:
+            if encoding is None:
+                return jsonrpc_codec.encode_response(response_data), None
+            return self.compressor.encode(response_data, encoding)
+        
+        content = response_codec.encode_response(response_data)
+        if encoding is None:
+            return content, None
+        return self.compressor.compress_if_large(content, encoding)
+    
+    def register_method(
+        self, name: str, handler, mutating: bool = False, cache: Optional[CachePolicy] = None
+    ) -> RpcMethod:
+        """
+        외부 핸들러 등록 (@rpc_method 데코레이터를 쓸 수 없는 경우)
+        
+        Args:
+            name: JSON RPC 메서드명
+            handler: params dict를 받는 비동기 핸들러
+            mutating: 상태를 변경하는 메서드 여부
+            cache: 결과 캐시 정책 (순수 메서드만)
+            
+        Returns:
+            RpcMethod: 등록된 메서드
+        """
+        return self.registry.register(name, handler, mutating=mutating, cache=cache)
+    
+    @staticmethod
+    def _raise_service_error(error: str):
+        """
+        서비스 레이어 에러("코드: 메시지")를 JSON RPC 에러로 변환
+        
+        Args:
+            error: 서비스 레이어 에러 문자열
+            
+        Raises:
+            RpcError: 항상 발생
+        """
+        code, _, message = error.partition(": ")
+        if code == "400":
+            raise RpcError(JsonRpcError.INVALID_PARAMS, message or error)
+        if code == "0x001001":
+            raise RpcError(JsonRpcError.USER_NOT_FOUND, "User not found")
+        if code == "504":
+            raise RpcError(JsonRpcError.DEADLINE_EXCEEDED, message or error)
+        raise RpcError(JsonRpcError.INTERNAL_ERROR, f"Service error: {error}")
+    
+    @rpc_method("getUserAggregates")
+    async def _get_user_aggregates(
+        self, params: Dict[str, Any]
+    ) -> Union[jsonrpc_codec.DirectResult, jsonrpc_codec.TaggedResult]:
+        """
+        getUserAggregates 메서드 구현
+        저장된 사용자는 (user_id, version) 태그를 붙여 같은 버전의 응답 압축 결과를 재사용
+        JSON 응답은 중간 dict 없이 UserAggregates에서 bytes로 직접 인코딩
+        
+        Args:
+            params: 검증된 메서드 파라미터 {"userId": "user123"}
+            
+        Returns:
+            Union[DirectResult, TaggedResult]: 사용자 전체 데이터
+            
+        Raises:
+            RpcError: 서비스 에러 발생 시
+        """
         # 서비스 레이어 호출
-        user_data, error = await self.user_service.get_user_aggregates(user_id)
+        result, error = await self.user_service.get_user_aggregates_with_version(params["userId"])
         
         if error:
-            if error.startswith("400"):
-                raise ValueError(error.split(": ", 1)[1])
-            elif error.startswith("0x001001"):
-                raise Exception("USER_NOT_FOUND")
-            else:
-                raise Exception(f"Service error: {error}")
-        
-        # 응답 데이터 변환
+            self._raise_service_error(error)
+        
+        response = jsonrpc_codec.DirectResult(
+            source=result.data,
+            encode=encode_user_aggregates,
+            to_value=self._user_aggregates_to_dict
+        )
+        if result.version <= 0:
+            # 아직 저장되지 않은 데이터는 버전으로 구분할 수 없으므로 태그를 붙이지 않음
+            return response
+        return jsonrpc_codec.TaggedResult(
+            value=response,
+            tag=f"getUserAggregates:{params['userId'].strip()}:{result.version}"
+        )
+    
+    @staticmethod
+    def _user_aggregates_to_dict(user_data: UserAggregates) -> Dict[str, Any]:
+        """UserAggregates를 응답 데이터로 변환 (MessagePack 응답/내부 호출용, JSON은 encode_user_aggregates와 같은 구조)"""
         return {
             "profile": {
                 "nickname": user_data.profile.nickname,
@@ -138,51 +725,96 @@ class OpenRpcServer:
                 "created_at": user_data.profile.created_at.isoformat()
             },
             "inventory": {
-                "items": user_data.inventory.items,
+                "items": [item.to_schema().to_dict() for item in user_data.inventory.items],
                 "gold": user_data.inventory.gold,
                 "gems": user_data.inventory.gems,
                 "capacity": user_data.inventory.capacity
             }
         }
     
+    @rpc_method("getUserAggregatesBatch")
+    async def _get_user_aggregates_batch(self, params: Dict[str, Any]) -> jsonrpc_codec.DirectResult:
+        """
+        getUserAggregatesBatch 메서드 구현
+        여러 사용자를 Redis 왕복 1회로 조회 (친구 목록, 길드원, 매칭 로비 등)
+        
+        Args:
+            params: 검증된 메서드 파라미터 {"userIds": ["user123", "user456"]}
+            
+        Returns:
+            DirectResult: {"users": {userId: UserAggregates}, "missing": [저장되지 않은 userId]}
+            
+        Raises:
+            RpcError: user_batch_limit를 넘거나 서비스 에러 발생 시
+        """
+        user_ids = params["userIds"]
+        if len(user_ids) > self.user_batch_limit:
+            raise RpcError(
+                JsonRpcError.INVALID_PARAMS,
+                "Invalid params",
+                {"field": "userIds", "reason": f"userIds must contain <= {self.user_batch_limit} items"}
+            )
+        
+        result, error = await self.user_service.get_many_user_aggregates(user_ids)
+        
+        if error:
+            self._raise_service_error(error)
+        
+        return jsonrpc_codec.DirectResult(
+            source=result,
+            encode=encode_user_aggregates_batch,
+            to_value=self._user_aggregates_batch_to_dict
+        )
+    
+    @classmethod
+    def _user_aggregates_batch_to_dict(cls, many: UserRepositoryManyResult) -> Dict[str, Any]:
+        """여러 사용자 조회 결과를 응답 데이터로 변환 (MessagePack 응답/내부 호출용)"""
+        return {
+            "users": {user_id: cls._user_aggregates_to_dict(result.data) for user_id, result in many.found.items()},
+            "missing": list(many.missing)
+        }
+    
+    @rpc_method("calculator.add", cache=CachePolicy(ttl_ms=300000, max_entries=4096))
     async def _calculator_add(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         calculator.add 메서드 구현 (Rust WASM 사용)
+        params만으로 결과가 정해지므로 결과를 캐시하여 같은 params는 WASM 프로세스를 다시 실행하지 않음
         
         Args:
-            params: 메서드 파라미터 {"a": 10, "b": 20}
+            params: 검증된 메서드 파라미터 {"a": 10, "b": 20}
             
         Returns:
             Dict[str, Any]: 계산 결과
             
         Raises:
-            Exception: 에러 발생 시
+            RpcError: 에러 발생 시
         """
         result, error = await self.calculator_controller.Add(params)
         
         if error:
-            raise ValueError(error.split(": ", 1)[1] if ": " in error else error)
+            self._raise_service_error(error)
         
         return result
     
+    @rpc_method("profile.addExp", mutating=True)
     async def _profile_add_exp(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         profile.addExp 메서드 구현 (Rust WASM 사용)
         내부에서 기본 프로파일을 생성하고 경험치만 추가
         
         Args:
-            params: 메서드 파라미터 {"exp_to_add": 100}
+            params: 검증된 메서드 파라미터 {"exp_to_add": 100}
             
         Returns:
             Dict[str, Any]: 경험치 추가 결과
             
         Raises:
-            Exception: 에러 발생 시
+            RpcError: 에러 발생 시
         """
         result, error = await self.calculator_controller.AddExpToProfile(params)
         
         if error:
-            raise ValueError(error.split(": ", 1)[1] if ": " in error else error)
+            self._raise_service_error(error)
         
         return result
     
@@ -194,187 +826,26 @@ class OpenRpcServer:
             "id": request_id
         }
     
-    def _create_error_response(self, code: int, message: str, request_id: Any) -> Dict[str, Any]:
+    def _create_error_response(
+        self, code: int, message: str, request_id: Any, data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """에러 응답 생성"""
-        # 커스텀 에러 매핑
-        if message == "USER_NOT_FOUND":
-            code = JsonRpcError.USER_NOT_FOUND
-            message = "User not found"
-        elif "userId parameter is required" in message:
-            code = JsonRpcError.INVALID_PARAMS
+        error: Dict[str, Any] = {
+            "code": code,
+            "message": message
+        }
+        if data is not None:
+            error["data"] = data
         
         return {
             "jsonrpc": "2.0",
-            "error": {
-                "code": code,
-                "message": message
-            },
+            "error": error,
             "id": request_id
         }
     
     def get_openrpc_spec(self) -> Dict[str, Any]:
-        """OpenRPC 스펙 반환"""
-        try:
-            # 공용 OpenRPC 스펙 파일 로드
-            spec_path = "/Users/danghamo/Documents/gituhb/handinhand/shared/docs/openrpc.json"
-            with open(spec_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            # 기본 스펙 반환
-            return {
-                "openrpc": "1.2.6",
-                "info": {
-                    "title": "Hand in Hand Game Server API",
-                    "version": "1.0.0",
-                    "description": "게임 서버 JSON RPC 2.0 API"
-                },
-                "methods": [
-                    {
-                        "name": "getUserAggregates",
-                        "summary": "사용자 전체 데이터 조회",
-                        "params": [
-                            {
-                                "name": "userId",
-                                "schema": {"type": "string"},
-                                "required": True
-                            }
-                        ],
-                        "result": {
-                            "name": "UserAggregates",
-                            "schema": {"type": "object"}
-                        }
-                    },
-                    {
-                        "name": "calculator.add",
-                        "summary": "두 숫자를 더하는 계산기 함수 (Rust WASM)",
-                        "description": "Rust WebAssembly 모듈을 사용하여 두 숫자를 더합니다. WASM이 사용 불가능한 경우 Python fallback을 사용합니다.",
-                        "params": [
-                            {
-                                "name": "a",
-                                "schema": {"type": "number"},
-                                "required": True,
-                                "description": "첫 번째 숫자"
-                            },
-                            {
-                                "name": "b", 
-                                "schema": {"type": "number"},
-                                "required": True,
-                                "description": "두 번째 숫자"
-                            }
-                        ],
-                        "result": {
-                            "name": "CalculatorResult",
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "result": {
-                                        "type": "number",
-                                        "description": "계산 결과"
-                                    },
-                                    "implementation": {
-                                        "type": "string",
-                                        "enum": ["rust_wasm", "python_fallback"],
-                                        "description": "사용된 구현체"
-                                    },
-                                    "wasm_enabled": {
-                                        "type": "boolean",
-                                        "description": "WASM 사용 가능 여부"
-                                    }
-                                },
-                                "required": ["result", "implementation", "wasm_enabled"]
-                            }
-                        },
-                        "examples": [
-                            {
-                                "name": "Simple Addition",
-                                "params": {
-                                    "a": 10,
-                                    "b": 20
-                                },
-                                "result": {
-                                    "result": 30,
-                                    "implementation": "rust_wasm",
-                                    "wasm_enabled": True
-                                }
-                            }
-                        ]
-                    },
-                    {
-                        "name": "profile.addExp",
-                        "summary": "프로필에 경험치를 추가하고 레벨업 처리 (Rust WASM)",
-                        "description": "기본 프로필에 경험치를 추가하고 레벨업, 진행도 등을 계산합니다. Rust WebAssembly 모듈을 사용하여 게임 로직을 처리합니다. 내부에서 기본 프로파일(레벨1, 경험치0)을 생성합니다.",
-                        "params": [
-                            {
-                                "name": "exp_to_add", 
-                                "schema": {"type": "integer", "minimum": 0},
-                                "required": True,
-                                "description": "추가할 경험치 양"
-                            }
-                        ],
-                        "result": {
-                            "name": "ProfileExpResult",
-                            "schema": {
-                                "type": "object",
-                                "properties": {
-                                    "profile": {
-                                        "type": "object",
-                                        "description": "업데이트된 프로필 데이터"
-                                    },
-                                    "level_increased": {
-                                        "type": "boolean",
-                                        "description": "레벨이 상승했는지 여부"
-                                    },
-                                    "exp_to_next_level": {
-                                        "type": "integer",
-                                        "description": "다음 레벨까지 필요한 경험치"
-                                    },
-                                    "level_progress_percentage": {
-                                        "type": "number",
-                                        "description": "현재 레벨의 진행도 (0-100%)"
-                                    },
-                                    "implementation": {
-                                        "type": "string",
-                                        "enum": ["rust_wasm", "python_fallback"],
-                                        "description": "사용된 구현체"
-                                    },
-                                    "wasm_enabled": {
-                                        "type": "boolean",
-                                        "description": "WASM 사용 가능 여부"
-                                    },
-                                    "success": {
-                                        "type": "boolean",
-                                        "description": "작업 성공 여부"
-                                    }
-                                },
-                                "required": ["profile", "level_increased", "exp_to_next_level", "level_progress_percentage", "implementation", "wasm_enabled", "success"]
-                            }
-                        },
-                        "examples": [
-                            {
-                                "name": "Add 500 EXP to Default Profile",
-                                "params": {
-                                    "exp_to_add": 500
-                                },
-                                "result": {
-                                    "profile": {
-                                        "nickname": "TestPlayer",
-                                        "level": 3,
-                                        "exp": 500,
-                                        "avatar": "default_avatar",
-                                        "created_at": "2024-08-02T15:30:00Z"
-                                    },
-                                    "level_increased": True,
-                                    "exp_to_next_level": 19,
-                                    "level_progress_percentage": 96.3,
-                                    "implementation": "rust_wasm",
-                                    "wasm_enabled": True,
-                                    "success": True
-                                }
-                            }
-                        ]
-                    }
-                ]
-            }
+        """OpenRPC 스펙 반환 (시작 시 로드된 문서)"""
+        return self.openrpc_spec.document
 
 
 def setup_openrpc_routes(app: FastAPI, openrpc_server: OpenRpcServer):
@@ -382,43 +853,80 @@ def setup_openrpc_routes(app: FastAPI, openrpc_server: OpenRpcServer):
     
     @app.post("/api/jsonrpc")
     async def jsonrpc_endpoint(request: Request):
-        """JSON RPC 2.0 엔드포인트"""
-        try:
-            body = await request.body()
-            request_data = json.loads(body)
-            
-            response_data = await openrpc_server.handle_request(request_data)
-            return JSONResponse(content=response_data)
-            
-        except json.JSONDecodeError:
-            return JSONResponse(
-                content={
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": JsonRpcError.PARSE_ERROR,
-                        "message": "Parse error"
-                    },
-                    "id": None
-                },
-                status_code=200
-            )
-        except Exception as e:
-            return JSONResponse(
-                content={
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": JsonRpcError.INTERNAL_ERROR,
-                        "message": f"Internal server error: {str(e)}"
-                    },
-                    "id": None
-                },
-                status_code=200
+        """JSON RPC 2.0 엔드포인트 (bytes fast path)"""
+        request_codec, response_codec = rpc_codecs.negotiate(
+            request.headers.get("content-type"), request.headers.get("accept")
+        )
+        if request_codec is None:
+            return Response(status_code=415, content=f"Unsupported Content-Type: {request.headers.get('content-type')}")
+        
+        # 동시 처리 한도 초과: 본문도 읽지 않고 503 (실행하지 않았으므로 NGINX가 다른 서버로 재시도 가능)
+        started = openrpc_server.try_admit()
+        if started is None:
+            return Response(
+                status_code=503,
+                content=response_codec.encode_response(openrpc_server._overloaded_response(None)),
+                media_type=response_codec.media_type,
+                headers={CONCURRENCY_LIMIT_HEADER: str(openrpc_server.limiter.limit), "Retry-After": "1"}
             )
+        try:
+            return await _handle_jsonrpc_post(request, request_codec, response_codec)
+        finally:
+            openrpc_server.finish_admitted(started)
+    
+    async def _handle_jsonrpc_post(request: Request, request_codec: RpcCodec, response_codec: RpcCodec) -> Response:
+        """수락된 JSON RPC HTTP 요청 처리"""
+        # 상대 데드라인(X-Request-Timeout-Ms)은 본문을 읽기 전에 계산
+        context = RpcContext(
+            idempotency_key=request.headers.get("idempotency-key") or None,
+            deadline=parse_deadline(request.headers),
+            client_id=openrpc_server.identify_client(request.headers, request.client.host if request.client else None)
+        )
+        body = await request.body()
+        content, content_encoding = await openrpc_server.handle_http(
+            body,
+            request.headers.get("accept-encoding"),
+            request_codec=request_codec,
+            response_codec=response_codec,
+            context=context
+        )
+        if content is None:
+            # 알림(notification)은 응답 본문 없이 즉시 반환
+            return Response(status_code=204)
+        
+        headers = {"Vary": "Accept, Accept-Encoding"}
+        if content_encoding:
+            headers["Content-Encoding"] = content_encoding
+        if openrpc_server.limiter is not None:
+            headers[CONCURRENCY_LIMIT_HEADER] = str(openrpc_server.limiter.limit)
+        return Response(content=content, media_type=response_codec.media_type, headers=headers)
+    
+    @app.get("/metrics")
+    async def metrics_endpoint():
+        """서버 메트릭 스냅샷"""
+        return openrpc_server.metrics.snapshot()
     
     @app.get("/docs/openrpc.json")
-    async def openrpc_spec():
-        """OpenRPC 스펙 파일"""
-        return openrpc_server.get_openrpc_spec()
+    async def openrpc_spec(request: Request):
+        """OpenRPC 스펙 파일 (미리 직렬화/압축된 bytes, ETag 지원)"""
+        spec = openrpc_server.openrpc_spec
+        # 표현(identity/gzip)을 먼저 고르고 그 표현의 ETag로 조건부 요청 확인
+        use_gzip = accepts_encoding(request.headers.get("accept-encoding"), "gzip")
+        etag = spec.gzip_etag if use_gzip else spec.etag
+        headers = {
+            "ETag": etag,
+            "Cache-Control": "no-cache",
+            "Vary": "Accept-Encoding"
+        }
+        
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        
+        if use_gzip:
+            headers["Content-Encoding"] = "gzip"
+            return Response(content=spec.gzipped, media_type=jsonrpc_codec.JSON_MEDIA_TYPE, headers=headers)
+        
+        return Response(content=spec.raw, media_type=jsonrpc_codec.JSON_MEDIA_TYPE, headers=headers)
     
     @app.get("/docs", response_class=HTMLResponse)
     async def openrpc_playground():
@@ -0,0 +1,90 @@
+"""
+OpenRPC 스펙 문서 로드
+4개 언어 서버가 공유하는 shared/docs/openrpc.json을 기본값으로 사용
+서버 시작 시 한 번 로드하여 직렬화/압축된 bytes와 ETag를 메모리에 보관
+"""
+
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.api import jsonrpc_codec
+
+# python-server/src/api/openrpc_spec.py -> 프로젝트 루트/shared/docs/openrpc.json
+DEFAULT_OPENRPC_SPEC_PATH = Path(__file__).resolve().parents[3] / "shared" / "docs" / "openrpc.json"
+
+
+def load_openrpc_document(spec_path: Optional[str] = None) -> tuple[Dict[str, Any] | None, str | None]:
+    """
+    OpenRPC 스펙 문서 로드
+
+    Args:
+        spec_path: 스펙 파일 경로 (없으면 shared/docs/openrpc.json)
+
+    Returns:
+        tuple[Dict[str, Any] | None, str | None]: (스펙 문서, 에러)
+    """
+    path = Path(spec_path) if spec_path else DEFAULT_OPENRPC_SPEC_PATH
+
+    if not path.exists():
+        return None, f"404: OpenRPC spec not found: {path}"
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f), None
+    except json.JSONDecodeError as e:
+        return None, f"400: Invalid JSON in OpenRPC spec: {str(e)}"
+    except OSError as e:
+        return None, f"500: Failed to read OpenRPC spec: {str(e)}"
+
+
+@dataclass
+class OpenRpcSpec:
+    """미리 직렬화된 OpenRPC 스펙 (요청마다 파일 I/O나 직렬화를 하지 않음)"""
+    document: Dict[str, Any]
+    raw: bytes
+    gzipped: bytes
+    etag: str  # raw (identity) 표현의 ETag
+    gzip_etag: str  # gzip 표현의 ETag (bytes가 다르므로 강한 ETag를 공유하지 않음)
+    source: str
+
+    @classmethod
+    def from_document(cls, document: Dict[str, Any], source: str = "memory") -> 'OpenRpcSpec':
+        """스펙 문서에서 bytes/gzip/표현별 ETag 생성"""
+        raw = jsonrpc_codec.dumps(document)
+        digest = hashlib.sha256(raw).hexdigest()[:32]
+        return cls(
+            document=document,
+            raw=raw,
+            # mtime=0: 같은 내용이면 항상 같은 압축 결과
+            gzipped=gzip.compress(raw, compresslevel=9, mtime=0),
+            etag=f'"{digest}"',
+            gzip_etag=f'"{digest}-gzip"',
+            source=source
+        )
+
+    @classmethod
+    def load(cls, spec_path: Optional[str] = None) -> tuple['OpenRpcSpec | None', str | None]:
+        """
+        OpenRPC 스펙 로드
+        지정한 경로에서 읽지 못하면 shared/docs/openrpc.json으로 대체
+
+        Args:
+            spec_path: 스펙 파일 경로 (설정/명령행 인자)
+
+        Returns:
+            tuple[OpenRpcSpec | None, str | None]: (스펙, 에러)
+        """
+        if spec_path:
+            document, error = load_openrpc_document(spec_path)
+            if not error:
+                return cls.from_document(document, source=str(spec_path)), None
+            print(f"⚠️  {error}, falling back to {DEFAULT_OPENRPC_SPEC_PATH}")
+
+        document, error = load_openrpc_document()
+        if error:
+            return None, error
+        return cls.from_document(document, source=str(DEFAULT_OPENRPC_SPEC_PATH)), None
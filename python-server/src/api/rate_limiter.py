@@ -0,0 +1,130 @@
+"""
+JSON RPC 클라이언트별 요청 제한 (api.rate_limit)
+2단계로 검사:
+1. 프로세스 내 토큰 버킷: 한 서버에 몰리는 남용 요청을 I/O 없이 거절
+2. Redis 슬라이딩 윈도우: NGINX 뒤의 모든 서버가 공유하는 한도
+
+모든 메서드에 적용되는 기본 규칙과 메서드별 규칙을 모두 확인한 뒤에만 한도에 기록하며 (거절된 요청은 어느 규칙의 한도도 사용하지 않음),
+Redis 장애 시에는 1단계만 적용 (요청을 실패시키지 않음)
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from src.infrastructure.metrics.metrics import Metrics, metric_name
+from src.infrastructure.rate_limit.redis_sliding_window import RedisSlidingWindowLimiter
+from src.infrastructure.rate_limit.token_bucket import TokenBucketLimiter
+
+logger = logging.getLogger(__name__)
+
+# 기본 규칙의 키 범위 (메서드별 규칙은 메서드명)
+ALL_METHODS_SCOPE = "all"
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """window_ms 동안 max_requests개까지 허용"""
+    window_ms: int
+    max_requests: int
+
+
+class RateLimiter:
+    """클라이언트별 요청 제한"""
+
+    def __init__(
+        self,
+        default_rule: Optional[RateLimitRule],
+        method_rules: Optional[Dict[str, RateLimitRule]] = None,
+        shared: Optional[RedisSlidingWindowLimiter] = None,
+        local: Optional[TokenBucketLimiter] = None,
+        client_header: Optional[str] = None,
+        metrics: Optional[Metrics] = None
+    ):
+        self.default_rule = default_rule
+        self.method_rules = method_rules or {}
+        self.shared = shared
+        # 버킷이 없는 limiter는 len()이 0이므로 or로 대체하지 않음
+        self.local = local if local is not None else TokenBucketLimiter()
+        self.client_header = client_header.lower() if client_header else None
+        self.metrics = metrics or Metrics()
+
+    def client_id(self, headers: Mapping[str, str], peer_host: Optional[str]) -> Optional[str]:
+        """
+        요청 클라이언트 식별
+        client_header(예: NGINX가 설정하는 X-Real-IP)가 요청에 있으면 그 값, 없으면 연결 상대 주소 (프록시를 거치지 않은 직접 연결)
+
+        Args:
+            headers: 요청 헤더 (소문자 키로 조회 가능)
+            peer_host: 연결 상대 주소
+
+        Returns:
+            Optional[str]: 클라이언트 ID (식별할 수 없으면 None: 제한하지 않음)
+        """
+        if self.client_header:
+            value = headers.get(self.client_header)
+            if value:
+                # X-Forwarded-For처럼 여러 값이면 가장 가까운 프록시가 추가한 마지막 값 사용
+                return value.rsplit(",", 1)[-1].strip()
+        return peer_host
+
+    async def check(self, client_id: str, method_name: str) -> Optional[int]:
+        """
+        요청 하나 허용 여부 확인 (허용되면 한도에 기록)
+
+        Args:
+            client_id: 클라이언트 ID
+            method_name: JSON RPC 메서드명
+
+        Returns:
+            Optional[int]: 허용되면 None, 거절되면 다시 허용될 때까지 남은 밀리초
+        """
+        rules = self._rules_for(method_name)
+        if not rules:
+            return None
+
+        # 1단계: 프로세스 내 토큰 버킷 (I/O 없음, 모든 규칙을 확인한 뒤에만 토큰 사용)
+        wait_ms = max(
+            self.local.wait_ms((scope, client_id), rule.max_requests, rule.window_ms)
+            for scope, rule in rules
+        )
+        if wait_ms:
+            self._count_rejected("local", method_name)
+            return math.ceil(wait_ms)
+        for scope, _ in rules:
+            self.local.take((scope, client_id))
+
+        if self.shared is None:
+            return None
+
+        # 2단계: 서버 간 공유 슬라이딩 윈도우 (모든 규칙을 한 번에 확인하고 전부 허용될 때만 기록)
+        try:
+            allowed, retry_after_ms = await self.shared.hit(
+                [(f"{scope}:{client_id}", rule.window_ms, rule.max_requests) for scope, rule in rules]
+            )
+        except Exception as e:
+            logger.warning(f"Shared rate limit unavailable, using local limit only: {e}")
+            return None
+        if not allowed:
+            self._count_rejected("redis", method_name)
+            return retry_after_ms
+        return None
+
+    def _rules_for(self, method_name: str) -> List[Tuple[str, RateLimitRule]]:
+        """메서드에 적용되는 (키 범위, 규칙) 목록"""
+        rules = []
+        if self.default_rule is not None:
+            rules.append((ALL_METHODS_SCOPE, self.default_rule))
+        method_rule = self.method_rules.get(method_name)
+        if method_rule is not None:
+            rules.append((method_name, method_rule))
+        return rules
+
+    def _count_rejected(self, tier: str, method_name: str):
+        self.metrics.increment(metric_name("rate_limited_total", tier=tier))
+        self.metrics.increment(metric_name("rate_limited_total", method=method_name))
+
+    def stats(self) -> Dict[str, int]:
+        """로컬 버킷 수 (메트릭 수집기)"""
+        return {"local_buckets": len(self.local)}
@@ -0,0 +1,175 @@
+"""
+JSON RPC 응답 압축
+Accept-Encoding으로 gzip/deflate를 협상하고 임계 크기 이상인 응답만 압축
+버전 태그가 붙은 결과(TaggedResult)는 압축된 조각을 캐시하여 같은 버전을 다시 조회할 때 재압축하지 않음
+
+캐시된 result 조각은 독립된 raw deflate 블록(다른 조각을 참조하지 않음)이므로
+요청마다 달라지는 앞뒤 조각(id 등)만 새로 압축해 이어 붙이고 체크섬만 다시 계산
+"""
+
+import gzip
+import struct
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from src.api import jsonrpc_codec
+from src.api.content_encoding import parse_accept_encoding
+from src.infrastructure.metrics.metrics import Metrics
+
+GZIP = "gzip"
+DEFLATE = "deflate"
+
+# 같은 q 값이면 앞쪽 인코딩 우선
+SUPPORTED_ENCODINGS = (GZIP, DEFLATE)
+
+# mtime=0, 플래그 없음, OS=unknown
+_GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+# CM=8(deflate), 32K window, 기본 압축 레벨
+_ZLIB_HEADER = b"\x78\x9c"
+
+
+@dataclass
+class _CachedResult:
+    """캐시된 result 조각"""
+    raw: bytes  # 직렬화된 result
+    deflated: bytes  # result만 독립적으로 압축한 raw deflate 조각 (마지막 블록 아님)
+
+
+class ResponseCompressor:
+    """크기 임계값과 버전 태그 캐시를 가진 JSON RPC 응답 압축기"""
+
+    def __init__(
+        self,
+        min_size: int = 1024,
+        level: int = 6,
+        cache_size: int = 256,
+        metrics: Optional[Metrics] = None
+    ):
+        self.min_size = min_size
+        self.level = level
+        self.cache_size = cache_size
+        self.metrics = metrics or Metrics()
+
+        self._cache: "OrderedDict[str, _CachedResult]" = OrderedDict()
+        result_prefix, _ = jsonrpc_codec.success_parts(None)
+        self._deflated_result_prefix = self._deflate(result_prefix)
+
+        self.metrics.register_collector("response_compression", self.stats)
+
+    def negotiate(self, accept_encoding: Optional[str]) -> Optional[str]:
+        """
+        Accept-Encoding 헤더로 압축 방식 선택
+
+        Args:
+            accept_encoding: Accept-Encoding 헤더 값
+
+        Returns:
+            Optional[str]: "gzip", "deflate" 또는 None (압축하지 않음)
+        """
+        encodings = parse_accept_encoding(accept_encoding)
+        selected, selected_quality = None, 0.0
+        for encoding in SUPPORTED_ENCODINGS:
+            quality = encodings.get(encoding, encodings.get("*", 0.0))
+            if quality > selected_quality:
+                selected, selected_quality = encoding, quality
+        return selected
+
+    def encode(self, response: Any, encoding: Optional[str]) -> tuple[bytes, Optional[str]]:
+        """
+        응답 dict(또는 배치 배열)를 bytes로 인코딩하고 임계 크기 이상이면 압축
+
+        Args:
+            response: JSON RPC 응답
+            encoding: negotiate()로 선택한 압축 방식 (None이면 압축하지 않음)
+
+        Returns:
+            tuple[bytes, Optional[str]]: (응답 본문, Content-Encoding 값 또는 None)
+        """
+        if (
+            encoding is not None
+            and self.cache_size > 0
+            and isinstance(response, dict)
+            and isinstance(response.get("result"), jsonrpc_codec.TaggedResult)
+        ):
+            return self._encode_tagged(response["result"], response.get("id"), encoding)
+
+        return self.compress_if_large(jsonrpc_codec.encode_response(response), encoding)
+
+    def compress_if_large(self, body: bytes, encoding: Optional[str]) -> tuple[bytes, Optional[str]]:
+        """
+        이미 인코딩된 본문을 임계 크기 이상일 때만 압축 (MessagePack 등)
+
+        Returns:
+            tuple[bytes, Optional[str]]: (응답 본문, Content-Encoding 값 또는 None)
+        """
+        if encoding is None or len(body) < self.min_size:
+            return body, None
+        return self.compress(body, encoding), encoding
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """본문 전체 압축 (캐시 없음)"""
+        self.metrics.increment("response_compression_total")
+        if encoding == GZIP:
+            return gzip.compress(body, compresslevel=self.level, mtime=0)
+        return zlib.compress(body, self.level)
+
+    def stats(self) -> Dict[str, Any]:
+        """압축 캐시 상태 (메트릭 수집기)"""
+        return {
+            "min_size": self.min_size,
+            "level": self.level,
+            "cache_entries": len(self._cache),
+            "cache_capacity": self.cache_size
+        }
+
+    def _encode_tagged(
+        self,
+        tagged: jsonrpc_codec.TaggedResult,
+        request_id: Any,
+        encoding: str
+    ) -> tuple[bytes, Optional[str]]:
+        """버전 태그 결과를 캐시된 압축 조각으로 응답 생성"""
+        prefix, suffix = jsonrpc_codec.success_parts(request_id)
+
+        cached = self._cache.get(tagged.tag)
+        if cached is not None:
+            self._cache.move_to_end(tagged.tag)
+            self.metrics.increment("response_compression_cache_hits_total")
+        else:
+            raw = jsonrpc_codec.encode_result(tagged)
+            if len(prefix) + len(raw) + len(suffix) < self.min_size:
+                # 작은 응답은 압축/캐시하지 않음
+                return b"".join((prefix, raw, suffix)), None
+
+            self.metrics.increment("response_compression_cache_misses_total")
+            self.metrics.increment("response_compression_total")
+            cached = _CachedResult(raw=raw, deflated=self._deflate(raw))
+            self._cache[tagged.tag] = cached
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        body = b"".join((prefix, cached.raw, suffix))
+        deflated = b"".join((
+            self._deflated_result_prefix,
+            cached.deflated,
+            self._deflate(suffix, final=True)
+        ))
+        return self._wrap(deflated, body, encoding), encoding
+
+    def _deflate(self, data: bytes, final: bool = False) -> bytes:
+        """
+        독립된 raw deflate 조각 생성
+        final이 아니면 Z_FULL_FLUSH로 바이트 경계에서 끝내 다른 조각과 이어 붙일 수 있게 함
+        """
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush(zlib.Z_FINISH if final else zlib.Z_FULL_FLUSH)
+
+    @staticmethod
+    def _wrap(deflated: bytes, body: bytes, encoding: str) -> bytes:
+        """raw deflate 스트림에 gzip/zlib 헤더와 원본 체크섬 추가"""
+        if encoding == GZIP:
+            trailer = struct.pack("<II", zlib.crc32(body) & 0xFFFFFFFF, len(body) & 0xFFFFFFFF)
+            return b"".join((_GZIP_HEADER, deflated, trailer))
+        return b"".join((_ZLIB_HEADER, deflated, struct.pack(">I", zlib.adler32(body) & 0xFFFFFFFF)))
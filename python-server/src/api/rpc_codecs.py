@@ -0,0 +1,87 @@
+"""
+JSON RPC 본문 코덱 선택
+Content-Type으로 요청 코덱을, Accept로 응답 코덱을 결정 (JSON / MessagePack)
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from src.api import jsonrpc_codec, msgpack_codec
+
+
+@dataclass(frozen=True)
+class RpcCodec:
+    """요청/응답 본문 코덱"""
+    name: str
+    media_type: str
+    loads: Callable[[bytes], Any]
+    encode_response: Callable[[Any], bytes]
+
+
+JSON_CODEC = RpcCodec(
+    name="json",
+    media_type=jsonrpc_codec.JSON_MEDIA_TYPE,
+    loads=jsonrpc_codec.loads,
+    encode_response=jsonrpc_codec.encode_response
+)
+
+MSGPACK_CODEC = RpcCodec(
+    name="msgpack",
+    media_type=msgpack_codec.MSGPACK_MEDIA_TYPE,
+    loads=msgpack_codec.loads,
+    encode_response=msgpack_codec.encode_response
+) if msgpack_codec.MSGPACK_AVAILABLE else None
+
+
+def _media_types(header: Optional[str]) -> list[tuple[str, float]]:
+    """Content-Type / Accept 헤더에서 (미디어 타입, q 값) 목록 추출"""
+    media_types = []
+    for part in (header or "").split(","):
+        media_type, *params = part.split(";")
+        media_type = media_type.strip().lower()
+        if not media_type:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        media_types.append((media_type, quality))
+    return media_types
+
+
+def _codec_for(media_type: str) -> RpcCodec | None:
+    if media_type in msgpack_codec.MSGPACK_MEDIA_TYPES:
+        return MSGPACK_CODEC
+    if media_type == jsonrpc_codec.JSON_MEDIA_TYPE:
+        return JSON_CODEC
+    return None
+
+
+def negotiate(content_type: Optional[str], accept: Optional[str]) -> tuple[RpcCodec | None, RpcCodec]:
+    """
+    요청/응답 코덱 결정
+
+    Args:
+        content_type: 요청 Content-Type 헤더 (MessagePack이 아니면 JSON으로 처리)
+        accept: 요청 Accept 헤더 (없거나 */*이면 요청과 같은 코덱으로 응답)
+
+    Returns:
+        tuple[RpcCodec | None, RpcCodec]: (요청 코덱, 응답 코덱)
+            요청 코덱이 None이면 지원하지 않는 Content-Type (msgpack 미설치)
+    """
+    request_codec: RpcCodec | None = JSON_CODEC
+    for media_type, _ in _media_types(content_type):
+        if media_type in msgpack_codec.MSGPACK_MEDIA_TYPES:
+            request_codec = MSGPACK_CODEC
+
+    # Accept에서 q 값이 가장 높은 지원 코덱 (같으면 먼저 나온 것)
+    response_codec, response_quality = request_codec or JSON_CODEC, 0.0
+    for media_type, quality in _media_types(accept):
+        codec = _codec_for(media_type)
+        if codec is not None and quality > response_quality:
+            response_codec, response_quality = codec, quality
+    return request_codec, response_codec
@@ -0,0 +1,97 @@
+"""
+JSON RPC 요청 컨텍스트
+요청 본문 밖(HTTP 헤더 등)에서 전달된 요청 단위 정보
+"""
+
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+from src.infrastructure.concurrency.deadline import deadline_after_ms, deadline_from_wall_clock
+
+logger = logging.getLogger(__name__)
+
+# 데드라인 헤더
+# - X-Request-Deadline: 절대 마감 시각 (Unix epoch 밀리초)
+# - X-Request-Timeout-Ms: 남은 시간 예산 (밀리초), X-Request-Start가 있으면 그 시각부터, 없으면 수신 시각부터 계산
+# - X-Request-Start: 프록시가 요청을 받은 시각 (NGINX: proxy_set_header X-Request-Start "t=${msec}")
+DEADLINE_HEADER = "x-request-deadline"
+TIMEOUT_HEADER = "x-request-timeout-ms"
+REQUEST_START_HEADER = "x-request-start"
+
+
+@dataclass(frozen=True)
+class RpcContext:
+    """요청 단위 전송 계층 정보"""
+    idempotency_key: Optional[str] = None  # Idempotency-Key 헤더 (변경 메서드에만 적용)
+    deadline: Optional[float] = None  # 클라이언트 마감 시각 (time.monotonic() 기준, 지나면 실행하지 않음)
+    client_id: Optional[str] = None  # 요청 제한 대상 클라이언트 (None이면 제한하지 않음)
+
+
+EMPTY_CONTEXT = RpcContext()
+
+
+def parse_deadline(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    데드라인 헤더를 마감 시각으로 변환
+    두 헤더가 모두 있으면 더 이른 쪽을 사용하고, 형식이 잘못된 헤더는 무시
+
+    Args:
+        headers: HTTP 요청 헤더 (소문자 키로 조회 가능)
+
+    Returns:
+        Optional[float]: time.monotonic() 기준 마감 시각 (헤더가 없으면 None)
+    """
+    deadlines = []
+
+    absolute = _parse_number(headers.get(DEADLINE_HEADER), DEADLINE_HEADER)
+    if absolute is not None:
+        deadlines.append(deadline_from_wall_clock(absolute / 1000))
+
+    budget_ms = _parse_number(headers.get(TIMEOUT_HEADER), TIMEOUT_HEADER)
+    if budget_ms is not None:
+        start = _parse_request_start(headers.get(REQUEST_START_HEADER))
+        if start is None:
+            deadlines.append(deadline_after_ms(budget_ms))
+        else:
+            deadlines.append(deadline_from_wall_clock(start + budget_ms / 1000))
+
+    return min(deadlines) if deadlines else None
+
+
+def _parse_number(value: Optional[str], header: str) -> Optional[float]:
+    """숫자 헤더 파싱 (없거나 잘못되면 None, float()가 받아들이는 inf/nan도 잘못된 값으로 처리)"""
+    if value is None:
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        number = None
+    if number is None or not math.isfinite(number):
+        logger.debug(f"Ignoring malformed {header} header: {value!r}")
+        return None
+    return number
+
+
+def _parse_request_start(value: Optional[str]) -> Optional[float]:
+    """
+    X-Request-Start 파싱 ("t=1697500000.123" 또는 "1697500000.123", 초 단위)
+    밀리초/마이크로초 단위로 보낸 값도 허용하며, 미래 시각은 수신 시각으로 간주
+
+    Returns:
+        Optional[float]: Unix 시각 (초)
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.startswith("t="):
+        value = value[2:]
+    start = _parse_number(value, REQUEST_START_HEADER)
+    if start is None:
+        return None
+    # 초 단위 현재 시각은 1e10 미만: 그보다 크면 밀리초/마이크로초 단위
+    while start > 1e10:
+        start /= 1000
+    return min(start, time.time())
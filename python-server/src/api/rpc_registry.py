@@ -0,0 +1,375 @@
+"""
+JSON RPC 메서드 레지스트리
+데코레이터로 핸들러를 등록하고, OpenRPC 스펙의 params 스키마를 시작 시 한 번 검증 함수로 컴파일
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from src.api.method_cache import CachePolicy, MethodResultCache
+
+RpcHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+# 검증 함수: 값을 받아 실패 사유(문자열) 또는 None 반환
+SchemaCheck = Callable[[Any], Optional[str]]
+
+# 파라미터 검증 함수: (정규화된 params dict, 에러 data {"field", "reason"})
+ParamsValidator = Callable[[Any], tuple[Dict[str, Any] | None, Dict[str, Any] | None]]
+
+
+class RpcError(Exception):
+    """JSON RPC 에러 응답으로 그대로 변환되는 에러"""
+
+    def __init__(self, code: int, message: str, data: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+
+@dataclass
+class RpcMethod:
+    """등록된 JSON RPC 메서드"""
+    name: str
+    handler: RpcHandler
+    validator: ParamsValidator
+    mutating: bool = False  # 상태를 변경하는 메서드 (멱등성 키 적용 대상)
+    cache: Optional[MethodResultCache] = None  # 순수 메서드 결과 캐시
+
+
+def rpc_method(name: str, mutating: bool = False, cache: Optional[CachePolicy] = None):
+    """
+    JSON RPC 메서드 등록 데코레이터
+    RpcMethodRegistry.register_object()가 표시된 메서드를 찾아 등록
+
+    Args:
+        name: JSON RPC 메서드명 (예: "getUserAggregates")
+        mutating: 상태를 변경하는 메서드 여부
+        cache: 결과 캐시 정책 (params만으로 결과가 정해지는 순수 메서드에만 지정)
+    """
+    def decorator(func):
+        func.__rpc_method_name__ = name
+        func.__rpc_method_mutating__ = mutating
+        func.__rpc_method_cache__ = cache
+        return func
+    return decorator
+
+
+# === 스키마 컴파일 === #
+
+def _is_integer(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return True
+    return isinstance(value, float) and value.is_integer()
+
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, str),
+    "integer": _is_integer,
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "null": lambda v: v is None,
+}
+
+
+class SchemaCompiler:
+    """JSON Schema(OpenRPC 사용 범위)를 검증 함수로 컴파일"""
+
+    def __init__(self, document: Optional[Dict[str, Any]] = None):
+        self.document = document or {}
+        self._ref_cache: Dict[str, SchemaCheck] = {}
+
+    def compile(self, schema: Dict[str, Any]) -> SchemaCheck:
+        """
+        스키마를 검증 함수로 컴파일
+
+        Args:
+            schema: JSON Schema
+
+        Returns:
+            SchemaCheck: 값을 받아 실패 사유 또는 None을 반환하는 함수
+        """
+        if "$ref" in schema:
+            return self._compile_ref(schema["$ref"])
+
+        checks: List[SchemaCheck] = []
+
+        schema_type = schema.get("type")
+        if schema_type:
+            type_names = [schema_type] if isinstance(schema_type, str) else list(schema_type)
+            type_checks = [_TYPE_CHECKS[t] for t in type_names if t in _TYPE_CHECKS]
+            expected = " or ".join(type_names)
+
+            def check_type(value, type_checks=type_checks, expected=expected):
+                if not any(check(value) for check in type_checks):
+                    return f"must be {expected}"
+                return None
+            checks.append(check_type)
+
+        if "enum" in schema:
+            allowed = list(schema["enum"])
+
+            def check_enum(value):
+                return None if value in allowed else f"must be one of {allowed}"
+            checks.append(check_enum)
+
+        checks.extend(self._string_checks(schema))
+        checks.extend(self._number_checks(schema))
+        checks.extend(self._array_checks(schema))
+        checks.extend(self._object_checks(schema))
+
+        if not checks:
+            return lambda value: None
+        if len(checks) == 1:
+            return checks[0]
+
+        def check_all(value):
+            for check in checks:
+                reason = check(value)
+                if reason:
+                    return reason
+            return None
+        return check_all
+
+    def _compile_ref(self, ref: str) -> SchemaCheck:
+        """$ref 컴파일 (재귀 참조를 위해 지연 바인딩)"""
+        if ref in self._ref_cache:
+            return self._ref_cache[ref]
+
+        resolved: List[SchemaCheck] = []
+
+        def check_ref(value):
+            return resolved[0](value)
+        self._ref_cache[ref] = check_ref
+
+        target: Any = self.document
+        for part in ref.lstrip("#/").split("/"):
+            target = target.get(part, {}) if isinstance(target, dict) else {}
+        resolved.append(self.compile(target))
+        return check_ref
+
+    def _string_checks(self, schema: Dict[str, Any]) -> List[SchemaCheck]:
+        checks: List[SchemaCheck] = []
+        min_length = schema.get("minLength")
+        max_length = schema.get("maxLength")
+        pattern = re.compile(schema["pattern"]) if "pattern" in schema else None
+
+        if min_length is not None:
+            checks.append(lambda v: f"length must be >= {min_length}"
+                          if isinstance(v, str) and len(v) < min_length else None)
+        if max_length is not None:
+            checks.append(lambda v: f"length must be <= {max_length}"
+                          if isinstance(v, str) and len(v) > max_length else None)
+        if pattern is not None:
+            checks.append(lambda v: f"must match pattern {pattern.pattern}"
+                          if isinstance(v, str) and not pattern.search(v) else None)
+        return checks
+
+    def _number_checks(self, schema: Dict[str, Any]) -> List[SchemaCheck]:
+        checks: List[SchemaCheck] = []
+
+        def is_number(v):
+            return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+        minimum = schema.get("minimum")
+        maximum = schema.get("maximum")
+        exclusive_minimum = schema.get("exclusiveMinimum")
+        exclusive_maximum = schema.get("exclusiveMaximum")
+
+        if minimum is not None:
+            checks.append(lambda v: f"must be >= {minimum}" if is_number(v) and v < minimum else None)
+        if maximum is not None:
+            checks.append(lambda v: f"must be <= {maximum}" if is_number(v) and v > maximum else None)
+        if exclusive_minimum is not None:
+            checks.append(lambda v: f"must be > {exclusive_minimum}"
+                          if is_number(v) and v <= exclusive_minimum else None)
+        if exclusive_maximum is not None:
+            checks.append(lambda v: f"must be < {exclusive_maximum}"
+                          if is_number(v) and v >= exclusive_maximum else None)
+        return checks
+
+    def _array_checks(self, schema: Dict[str, Any]) -> List[SchemaCheck]:
+        checks: List[SchemaCheck] = []
+        min_items = schema.get("minItems")
+        max_items = schema.get("maxItems")
+
+        if min_items is not None:
+            checks.append(lambda v: f"must contain >= {min_items} items"
+                          if isinstance(v, list) and len(v) < min_items else None)
+        if max_items is not None:
+            checks.append(lambda v: f"must contain <= {max_items} items"
+                          if isinstance(v, list) and len(v) > max_items else None)
+
+        if isinstance(schema.get("items"), dict):
+            item_check = self.compile(schema["items"])
+
+            def check_items(value):
+                if not isinstance(value, list):
+                    return None
+                for index, item in enumerate(value):
+                    reason = item_check(item)
+                    if reason:
+                        return f"[{index}] {reason}"
+                return None
+            checks.append(check_items)
+        return checks
+
+    def _object_checks(self, schema: Dict[str, Any]) -> List[SchemaCheck]:
+        properties = schema.get("properties") or {}
+        required = list(schema.get("required") or [])
+        if not properties and not required:
+            return []
+
+        property_checks = [(name, self.compile(sub_schema)) for name, sub_schema in properties.items()]
+
+        def check_object(value):
+            if not isinstance(value, dict):
+                return None
+            for name in required:
+                if name not in value:
+                    return f"{name} is required"
+            for name, check in property_checks:
+                if name in value:
+                    reason = check(value[name])
+                    if reason:
+                        return f"{name} {reason}"
+            return None
+        return [check_object]
+
+
+def _accept_any_params(params: Any) -> tuple[Dict[str, Any] | None, Dict[str, Any] | None]:
+    """스펙이 없는 메서드용 검증 함수 (이름 기반 params만 허용)"""
+    if params is None:
+        return {}, None
+    if isinstance(params, dict):
+        return params, None
+    return None, {"field": "params", "reason": "must be an object"}
+
+
+def compile_params_validator(
+    param_specs: List[Dict[str, Any]],
+    compiler: SchemaCompiler
+) -> ParamsValidator:
+    """
+    OpenRPC 메서드의 params 정의를 검증 함수로 컴파일
+
+    Args:
+        param_specs: OpenRPC method.params 배열
+        compiler: 스키마 컴파일러 (components 참조 해석용)
+
+    Returns:
+        ParamsValidator: params(dict 또는 위치 기반 배열)를 받아 (정규화된 dict, 에러 data) 반환
+    """
+    compiled = [
+        (spec["name"], bool(spec.get("required")), compiler.compile(spec.get("schema") or {}))
+        for spec in param_specs
+    ]
+    names = [name for name, _, _ in compiled]
+
+    def validate(params: Any) -> tuple[Dict[str, Any] | None, Dict[str, Any] | None]:
+        if params is None:
+            params = {}
+        elif isinstance(params, list):
+            # 위치 기반 params를 스펙 순서대로 이름에 매핑
+            if len(params) > len(names):
+                return None, {"field": "params", "reason": f"expected at most {len(names)} positional params"}
+            params = dict(zip(names, params))
+        elif not isinstance(params, dict):
+            return None, {"field": "params", "reason": "must be an object or array"}
+
+        for name, required, check in compiled:
+            if name not in params:
+                if required:
+                    return None, {"field": name, "reason": f"{name} parameter is required"}
+                continue
+            reason = check(params[name])
+            if reason:
+                return None, {"field": name, "reason": f"{name} {reason}"}
+        return params, None
+
+    return validate
+
+
+class RpcMethodRegistry:
+    """JSON RPC 메서드 레지스트리 (메서드명 -> 핸들러 + 컴파일된 params 검증 함수)"""
+
+    def __init__(self, openrpc_document: Optional[Dict[str, Any]] = None):
+        self._compiler = SchemaCompiler(openrpc_document)
+        self._param_specs: Dict[str, List[Dict[str, Any]]] = {
+            method["name"]: method.get("params") or []
+            for method in (openrpc_document or {}).get("methods", [])
+            if "name" in method
+        }
+        self._methods: Dict[str, RpcMethod] = {}
+
+    def register(
+        self, name: str, handler: RpcHandler, mutating: bool = False, cache: Optional[CachePolicy] = None
+    ) -> RpcMethod:
+        """
+        메서드 등록
+        OpenRPC 스펙에 정의된 메서드면 params 검증 함수를 함께 컴파일
+
+        Args:
+            name: JSON RPC 메서드명
+            handler: params dict를 받는 비동기 핸들러
+            mutating: 상태를 변경하는 메서드 여부
+            cache: 결과 캐시 정책
+
+        Returns:
+            RpcMethod: 등록된 메서드
+
+        Raises:
+            ValueError: 변경 메서드에 결과 캐시를 지정한 경우
+        """
+        if mutating and cache is not None:
+            raise ValueError(f"Method '{name}' is mutating and cannot cache its results")
+
+        param_specs = self._param_specs.get(name)
+        validator = (
+            compile_params_validator(param_specs, self._compiler)
+            if param_specs is not None else _accept_any_params
+        )
+        method = RpcMethod(
+            name=name,
+            handler=handler,
+            validator=validator,
+            mutating=mutating,
+            cache=MethodResultCache(cache) if cache is not None else None
+        )
+        self._methods[name] = method
+        return method
+
+    def register_object(self, obj: Any):
+        """
+        @rpc_method 데코레이터가 붙은 객체 메서드를 모두 등록
+
+        Args:
+            obj: 핸들러 메서드를 가진 객체
+        """
+        for attr_name in dir(type(obj)):
+            func = getattr(type(obj), attr_name, None)
+            name = getattr(func, "__rpc_method_name__", None)
+            if name:
+                self.register(
+                    name,
+                    getattr(obj, attr_name),
+                    mutating=getattr(func, "__rpc_method_mutating__", False),
+                    cache=getattr(func, "__rpc_method_cache__", None)
+                )
+
+    def get(self, name: str) -> Optional[RpcMethod]:
+        """메서드 조회"""
+        return self._methods.get(name)
+
+    def names(self) -> List[str]:
+        """등록된 메서드명 목록"""
+        return list(self._methods)
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """메서드별 결과 캐시 통계 (메트릭 수집기)"""
+        return {name: method.cache.stats() for name, method in self._methods.items() if method.cache is not None}
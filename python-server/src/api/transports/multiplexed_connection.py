@@ -0,0 +1,171 @@
+"""
+다중화 JSON RPC 연결
+하나의 연결에서 여러 요청을 동시에 처리하고, 응답은 완료 순서대로 보냄 (클라이언트는 id로 매칭)
+
+역압(backpressure):
+- 동시 처리 수가 max_in_flight에 도달하면 다음 프레임을 읽지 않음
+- 송신 큐가 가득 차면(클라이언트가 느리게 읽으면) 처리 완료된 요청이 슬롯을 반환하지 않음
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Set
+
+from src.api import jsonrpc_codec
+from src.api.openrpc_server import JsonRpcError, OpenRpcServer, PARSE_ERROR_RESPONSE
+from src.api.rpc_context import EMPTY_CONTEXT, RpcContext
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionLost(Exception):
+    """연결이 끊겨 응답을 보낼 수 없음 (receive_frame에서 발생)"""
+
+
+class MultiplexedRpcConnection(ABC):
+    """프레임 단위 송수신만 구현하면 되는 다중화 JSON RPC 연결 기반 클래스"""
+
+    def __init__(
+        self,
+        openrpc_server: OpenRpcServer,
+        max_in_flight: int = 32,
+        send_queue_size: int = 64,
+        context: RpcContext = EMPTY_CONTEXT
+    ):
+        self.openrpc_server = openrpc_server
+        self.max_in_flight = max_in_flight
+        # 연결 단위 요청 컨텍스트 (클라이언트 ID 등)
+        self.context = context
+
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._outbox: asyncio.Queue = asyncio.Queue(maxsize=send_queue_size)
+        self._tasks: Set[asyncio.Task] = set()
+        self._in_flight_ids: Set[Any] = set()
+
+    @abstractmethod
+    async def receive_frame(self) -> Optional[tuple[bytes, Any]]:
+        """
+        요청 프레임 수신
+
+        Returns:
+            Optional[tuple[bytes, Any]]: (프레임 본문, 응답 시 돌려줄 프레임 정보)
+                클라이언트가 요청을 다 보냈으면(읽기 EOF) None: 처리 중인 요청의 응답은 모두 보낸 뒤 종료
+
+        Raises:
+            ConnectionLost: 연결이 끊겨 응답을 보낼 수 없음 (처리 중인 요청 취소)
+        """
+
+    @abstractmethod
+    async def send_frame(self, payload: bytes, frame_info: Any):
+        """응답 프레임 송신"""
+
+    async def serve(self):
+        """연결이 끝날 때까지 요청 처리"""
+        writer = asyncio.create_task(self._write_loop())
+        try:
+            while True:
+                # 동시 처리 수 제한: 슬롯이 날 때까지 다음 프레임을 읽지 않음
+                await self._slots.acquire()
+                try:
+                    frame = await self.receive_frame()
+                except ConnectionLost:
+                    self._slots.release()
+                    return
+                if frame is None:
+                    self._slots.release()
+                    break
+
+                task = asyncio.create_task(self._process(*frame))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+            # 읽기 EOF: 더 받을 요청은 없지만 처리 중인 요청과 송신 큐의 응답은 모두 보냄
+            if await self._until_writer_fails(asyncio.gather(*self._tasks, return_exceptions=True), writer):
+                await self._until_writer_fails(self._outbox.join(), writer)
+        finally:
+            # 연결이 끊기면(또는 응답을 다 보냈으면) 남은 작업 취소
+            tasks = list(self._tasks) + [writer]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    async def _until_writer_fails(awaitable, writer: asyncio.Task) -> bool:
+        """
+        awaitable 완료 대기 (송신 중 연결이 끊겨 writer가 끝나면 중단)
+
+        Returns:
+            bool: awaitable이 완료되면 True, writer가 먼저 끝나면 False
+        """
+        waiter = asyncio.ensure_future(awaitable)
+        await asyncio.wait([waiter, writer], return_when=asyncio.FIRST_COMPLETED)
+        if waiter.done():
+            return True
+        waiter.cancel()
+        return False
+
+    @property
+    def in_flight(self) -> int:
+        """처리 중인 요청 수"""
+        return len(self._tasks)
+
+    async def _process(self, payload: bytes, frame_info: Any):
+        """요청 하나를 처리하고 응답을 송신 큐에 넣음 (송신 큐가 가득 차면 대기)"""
+        try:
+            response = await self._respond(payload)
+            if response is not None:
+                await self._outbox.put((response, frame_info))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to process multiplexed request: {e}")
+        finally:
+            self._slots.release()
+
+    async def _respond(self, payload: bytes) -> Optional[bytes]:
+        """
+        요청 프레임 처리
+        같은 연결에서 처리 중인 id를 다시 쓰면 응답을 구분할 수 없으므로 거부 (거부 응답의 id는 null)
+
+        Args:
+            payload: 요청 프레임 본문
+
+        Returns:
+            Optional[bytes]: 인코딩된 응답 (알림이면 None)
+        """
+        try:
+            request_data = jsonrpc_codec.loads(payload)
+        except ValueError:
+            return PARSE_ERROR_RESPONSE
+
+        request_id = request_data.get("id") if isinstance(request_data, dict) else None
+        tracked = isinstance(request_id, (str, int)) and not isinstance(request_id, bool)
+        if tracked:
+            if request_id in self._in_flight_ids:
+                # 같은 id로 응답하면 클라이언트가 처리 중인 요청의 응답으로 오인하므로 id null로 응답
+                return jsonrpc_codec.encode_error(
+                    JsonRpcError.INVALID_REQUEST,
+                    f"Invalid request: id {request_id!r} is already in flight on this connection",
+                    None
+                )
+            self._in_flight_ids.add(request_id)
+
+        try:
+            response_data = await self.openrpc_server.handle_request(request_data, self.context)
+        finally:
+            if tracked:
+                self._in_flight_ids.discard(request_id)
+
+        if response_data is None:
+            return None
+        return jsonrpc_codec.encode_response(response_data)
+
+    async def _write_loop(self):
+        """송신 큐의 응답을 한 번에 하나씩 송신 (프레임이 섞이지 않도록)"""
+        while True:
+            payload, frame_info = await self._outbox.get()
+            try:
+                await self.send_frame(payload, frame_info)
+            finally:
+                self._outbox.task_done()
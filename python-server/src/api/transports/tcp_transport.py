@@ -0,0 +1,156 @@
+"""
+길이 접두 TCP JSON RPC 트랜스포트 (내부 서비스 간 호출용)
+ASGI/HTTP 스택을 거치지 않고 같은 OpenRpcServer 메서드 테이블로 바로 디스패치
+
+프레임 형식: 4바이트 big-endian 본문 길이 + JSON RPC 요청/응답 본문(UTF-8 JSON)
+응답을 기다리지 않고 여러 요청을 연속으로 보낼 수 있으며(파이프라이닝), 응답은 완료 순서대로 오므로 id로 매칭
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from src.api import jsonrpc_codec
+from src.api.openrpc_server import JsonRpcError, OpenRpcServer
+from src.api.transports.multiplexed_connection import ConnectionLost, MultiplexedRpcConnection
+
+logger = logging.getLogger(__name__)
+
+FRAME_HEADER_SIZE = 4
+
+
+def encode_frame(payload: bytes) -> bytes:
+    """본문 앞에 길이 헤더를 붙여 프레임 생성"""
+    return len(payload).to_bytes(FRAME_HEADER_SIZE, "big") + payload
+
+
+class TcpRpcConnection(MultiplexedRpcConnection):
+    """TCP 연결 하나"""
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        openrpc_server: OpenRpcServer,
+        max_in_flight: int,
+        send_queue_size: int,
+        max_frame_size: int
+    ):
+        super().__init__(openrpc_server, max_in_flight=max_in_flight, send_queue_size=send_queue_size)
+        self.reader = reader
+        self.writer = writer
+        self.max_frame_size = max_frame_size
+
+    async def receive_frame(self) -> Optional[tuple[bytes, Any]]:
+        try:
+            header = await self.reader.readexactly(FRAME_HEADER_SIZE)
+        except asyncio.IncompleteReadError as e:
+            if e.partial:
+                raise ConnectionLost("connection closed in the middle of a frame header") from e
+            # 프레임 경계에서 EOF: 클라이언트가 요청을 다 보내고 쓰기를 닫음(write_eof), 응답은 계속 받음
+            return None
+        except ConnectionError as e:
+            raise ConnectionLost(str(e)) from e
+
+        try:
+            length = int.from_bytes(header, "big")
+            if length > self.max_frame_size:
+                # 길이 접두 스트림은 본문을 건너뛰고 다시 동기화할 수 없으므로 에러 응답 후 읽기 종료 (처리 중인 응답은 보냄)
+                self.writer.write(encode_frame(jsonrpc_codec.encode_error(
+                    JsonRpcError.INVALID_REQUEST,
+                    f"Invalid request: frame size {length} exceeds limit {self.max_frame_size}",
+                    None
+                )))
+                await self.writer.drain()
+                return None
+            return await self.reader.readexactly(length), None
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            raise ConnectionLost(str(e)) from e
+
+    async def send_frame(self, payload: bytes, frame_info: Any):
+        self.writer.write(encode_frame(payload))
+        # 클라이언트가 읽지 않으면 소켓 버퍼가 찰 때까지 대기 (송신 큐로 역압 전달)
+        await self.writer.drain()
+
+
+class TcpRpcServer:
+    """길이 접두 프레임 TCP 리스너 (uvicorn과 같은 이벤트 루프에서 실행)"""
+
+    def __init__(
+        self,
+        openrpc_server: OpenRpcServer,
+        host: str = "127.0.0.1",
+        port: int = 3102,
+        max_connections: int = 256,
+        max_in_flight: int = 64,
+        send_queue_size: int = 128,
+        max_frame_size: int = 1024 * 1024
+    ):
+        self.openrpc_server = openrpc_server
+        self.host = host
+        self.port = port
+        self.max_connections = max_connections
+        self.max_in_flight = max_in_flight
+        self.send_queue_size = send_queue_size
+        self.max_frame_size = max_frame_size
+
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Dict[TcpRpcConnection, asyncio.Task] = {}
+
+        openrpc_server.metrics.register_collector("tcp", self.stats)
+
+    async def start(self):
+        """리스너 시작"""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+
+    async def stop(self):
+        """리스너 종료 (연결 중인 클라이언트도 끊음)"""
+        if self._server is None:
+            return
+        self._server.close()
+        tasks = list(self._connections.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+
+    @property
+    def is_serving(self) -> bool:
+        """리스너가 연결을 받고 있는지 여부"""
+        return self._server is not None and self._server.is_serving()
+
+    def stats(self) -> Dict[str, Any]:
+        """연결 상태 (메트릭 수집기)"""
+        return {
+            "address": f"{self.host}:{self.port}",
+            "connections": len(self._connections),
+            "max_connections": self.max_connections,
+            "in_flight": sum(connection.in_flight for connection in self._connections)
+        }
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        연결 하나 처리 (연결 수 제한 초과 시 즉시 종료)
+        내부 서비스 전용 리스너이므로 클라이언트별 요청 제한(api.rate_limit)은 적용하지 않음
+        """
+        if len(self._connections) >= self.max_connections:
+            self.openrpc_server.metrics.increment("tcp_connections_rejected_total")
+            writer.close()
+            return
+
+        connection = TcpRpcConnection(
+            reader, writer, self.openrpc_server,
+            max_in_flight=self.max_in_flight,
+            send_queue_size=self.send_queue_size,
+            max_frame_size=self.max_frame_size
+        )
+        self._connections[connection] = asyncio.current_task()
+        self.openrpc_server.metrics.increment("tcp_connections_total")
+        try:
+            await connection.serve()
+        except Exception as e:
+            logger.warning(f"TCP connection failed: {e}")
+        finally:
+            del self._connections[connection]
+            writer.close()
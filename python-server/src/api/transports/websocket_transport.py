@@ -0,0 +1,93 @@
+"""
+WebSocket JSON RPC 트랜스포트
+장시간 유지되는 게임 세션이 요청마다 HTTP 요청/응답 사이클을 거치지 않도록 하나의 소켓에서 요청을 다중화
+텍스트 프레임으로 받은 요청은 텍스트로, 바이너리 프레임으로 받은 요청은 바이너리로 응답
+"""
+
+from typing import Any, Dict, Optional
+
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+
+from src.api.openrpc_server import OpenRpcServer
+from src.api.rpc_context import RpcContext
+from src.api.transports.multiplexed_connection import ConnectionLost, MultiplexedRpcConnection
+
+
+class WebSocketRpcConnection(MultiplexedRpcConnection):
+    """WebSocket 연결 하나"""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        openrpc_server: OpenRpcServer,
+        max_in_flight: int,
+        send_queue_size: int,
+        context: RpcContext
+    ):
+        super().__init__(openrpc_server, max_in_flight=max_in_flight, send_queue_size=send_queue_size, context=context)
+        self.websocket = websocket
+
+    async def receive_frame(self) -> Optional[tuple[bytes, Any]]:
+        # WebSocket에는 읽기만 닫는 방법이 없음: close 프레임을 받으면 서버도 더 보낼 수 없으므로 연결 끊김으로 처리
+        try:
+            message = await self.websocket.receive()
+        except WebSocketDisconnect as e:
+            raise ConnectionLost(f"websocket closed ({e.code})") from e
+        if message["type"] == "websocket.disconnect":
+            raise ConnectionLost(f"websocket closed ({message.get('code')})")
+
+        text = message.get("text")
+        if text is not None:
+            return text.encode("utf-8"), True
+        return message.get("bytes") or b"", False
+
+    async def send_frame(self, payload: bytes, is_text: Any):
+        if is_text:
+            await self.websocket.send_text(payload.decode("utf-8"))
+        else:
+            await self.websocket.send_bytes(payload)
+
+
+class WebSocketRpcTransport:
+    """WebSocket 엔드포인트 (연결별 동시 처리 수/송신 큐 제한)"""
+
+    def __init__(self, openrpc_server: OpenRpcServer, max_in_flight: int = 32, send_queue_size: int = 64):
+        self.openrpc_server = openrpc_server
+        self.max_in_flight = max_in_flight
+        self.send_queue_size = send_queue_size
+        self._connections: set[WebSocketRpcConnection] = set()
+
+        openrpc_server.metrics.register_collector("websocket", self.stats)
+
+    async def handle(self, websocket: WebSocket):
+        """WebSocket 연결 처리"""
+        await websocket.accept()
+        context = RpcContext(client_id=self.openrpc_server.identify_client(
+            websocket.headers, websocket.client.host if websocket.client else None
+        ))
+        connection = WebSocketRpcConnection(
+            websocket, self.openrpc_server, self.max_in_flight, self.send_queue_size, context
+        )
+        self._connections.add(connection)
+        self.openrpc_server.metrics.increment("websocket_connections_total")
+        try:
+            await connection.serve()
+        finally:
+            self._connections.discard(connection)
+
+    def stats(self) -> Dict[str, Any]:
+        """연결 상태 (메트릭 수집기)"""
+        return {
+            "connections": len(self._connections),
+            "in_flight": sum(connection.in_flight for connection in self._connections),
+            "max_in_flight_per_connection": self.max_in_flight
+        }
+
+
+def setup_websocket_routes(app: FastAPI, transport: WebSocketRpcTransport, path: str = "/api/jsonrpc/ws"):
+    """FastAPI 앱에 WebSocket JSON RPC 라우트 설정"""
+
+    @app.websocket(path)
+    async def jsonrpc_websocket(websocket: WebSocket):
+        """JSON RPC 2.0 WebSocket 엔드포인트 (요청 다중화, 응답은 id로 매칭)"""
+        await transport.handle(websocket)
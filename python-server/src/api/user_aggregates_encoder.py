@@ -0,0 +1,87 @@
+"""
+UserAggregates JSON 직접 인코더
+중간 dict를 만들지 않고 UserAggregates(프로필, 인벤토리, 아이템)를 한 번 순회하며
+getUserAggregates / getUserAggregatesBatch 응답 JSON bytes를 생성
+
+OpenRpcServer._user_aggregates_to_dict 결과를 jsonrpc_codec.dumps로 직렬화한 것과 같은 bytes를 생성:
+- 키 순서: 응답 dict와 동일 (아이템은 Item.to_dict와 동일하게 None인 선택 필드 생략)
+- datetime: isoformat 문자열
+- Rarity: enum 값 (미리 인코딩된 조각 사용)
+- properties: 임의 값이므로 jsonrpc_codec.dumps 사용
+"""
+
+from json.encoder import encode_basestring
+from typing import List
+
+from src.api import jsonrpc_codec
+from src.domain.user.aggregates import Item, Rarity, UserAggregates
+from src.domain.user.repositories.user_repository import UserRepositoryManyResult
+
+_RARITY_FRAGMENTS = {rarity: f',"rarity":"{rarity.value}"' for rarity in Rarity}
+
+
+def _encode_item(item: Item, parts: List[str]):
+    """아이템 하나를 JSON 조각으로 추가"""
+    parts.append(f'{{"id":{encode_basestring(item.id)},"quantity":{item.quantity:d}')
+    if item.level is not None:
+        parts.append(f',"level":{item.level:d}')
+    if item.properties is not None:
+        parts.append(',"properties":')
+        parts.append(jsonrpc_codec.dumps(item.properties).decode("utf-8"))
+    if item.rarity is not None:
+        parts.append(_RARITY_FRAGMENTS[item.rarity])
+    parts.append("}")
+
+
+def _encode_user(user: UserAggregates, parts: List[str]):
+    """사용자 하나를 JSON 조각으로 추가"""
+    profile = user.profile
+    inventory = user.inventory
+    parts.append(
+        f'{{"profile":{{"nickname":{encode_basestring(profile.nickname)}'
+        f',"level":{profile.level:d},"exp":{profile.exp:d}'
+        f',"avatar":{encode_basestring(profile.avatar)}'
+        f',"created_at":"{profile.created_at.isoformat()}"}}'
+        ',"inventory":{"items":['
+    )
+    for index, item in enumerate(inventory.items):
+        if index:
+            parts.append(",")
+        _encode_item(item, parts)
+    parts.append(f'],"gold":{inventory.gold:d},"gems":{inventory.gems:d},"capacity":{inventory.capacity:d}}}}}')
+
+
+def encode_user_aggregates(user: UserAggregates) -> bytes:
+    """
+    UserAggregates를 getUserAggregates 응답 JSON bytes로 인코딩
+
+    Args:
+        user: 사용자 전체 데이터
+
+    Returns:
+        bytes: UTF-8 JSON
+    """
+    parts: List[str] = []
+    _encode_user(user, parts)
+    return "".join(parts).encode("utf-8")
+
+
+def encode_user_aggregates_batch(many: UserRepositoryManyResult) -> bytes:
+    """
+    여러 사용자 조회 결과를 getUserAggregatesBatch 응답 JSON bytes로 인코딩
+    {"users": {userId: UserAggregates, ...}, "missing": [userId, ...]}
+
+    Args:
+        many: 사용자별 조회 결과와 없는 사용자 ID
+
+    Returns:
+        bytes: UTF-8 JSON
+    """
+    parts = ['{"users":{']
+    for index, (user_id, result) in enumerate(many.found.items()):
+        parts.append(f'{"," if index else ""}{encode_basestring(user_id)}:')
+        _encode_user(result.data, parts)
+    parts.append('},"missing":[')
+    parts.append(",".join(encode_basestring(user_id) for user_id in many.missing))
+    parts.append("]}")
+    return "".join(parts).encode("utf-8")
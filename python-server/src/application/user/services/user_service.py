@@ -3,11 +3,18 @@
 비즈니스 유스케이스 조합 및 흐름 제어
 """
 
-from typing import Optional
+from typing import List, Optional
 
-from src.domain.user.repositories.user_repository import UserRepository
+from src.domain.user.repositories.user_repository import (
+    UserRepository,
+    UserRepositoryManyResult,
+    UserRepositoryOptions,
+    UserRepositoryResult
+)
 from src.domain.user.aggregates import UserAggregates
 from src.application.user.services.user_domain_service import UserDomainService
+from src.infrastructure.concurrency.deadline import current_deadline
+from src.infrastructure.concurrency.singleflight import SingleFlight
 
 
 class UserService:
@@ -16,10 +23,13 @@ class UserService:
     def __init__(self, user_repository: UserRepository, user_domain_service: Optional[UserDomainService] = None):
         self.user_repository = user_repository
         self.user_domain_service = user_domain_service
+        # 같은 사용자에 대한 동시 조회는 하나의 Repository 호출로 병합
+        self.aggregates_flight = SingleFlight()
     
     async def get_user_aggregates(self, user_id: str) -> tuple[UserAggregates | None, str | None]:
         """
         사용자 전체 데이터 조회
+        같은 user_id로 동시에 들어온 조회는 진행 중인 조회 결과를 공유 (반환된 객체는 읽기 전용으로 사용)
         
         Args:
             user_id: 사용자 ID
@@ -27,12 +37,64 @@ class UserService:
         Returns:
             tuple[UserAggregates | None, str | None]: (사용자 데이터, 에러)
         """
+        result, error = await self.get_user_aggregates_with_version(user_id)
+        
+        if error:
+            return None, error
+        
+        return result.data, None
+    
+    async def get_user_aggregates_with_version(self, user_id: str) -> tuple[UserRepositoryResult | None, str | None]:
+        """
+        사용자 전체 데이터와 저장 버전 조회
+        버전은 저장할 때마다 증가하므로 (user_id, version)으로 응답 캐시를 구분할 수 있음
+        
+        Args:
+            user_id: 사용자 ID
+            
+        Returns:
+            tuple[UserRepositoryResult | None, str | None]: (사용자 데이터와 버전, 에러)
+        """
         # 입력 검증
         if not user_id or not user_id.strip():
             return None, "400: user_id is required"
         
+        user_id = user_id.strip()
+        return await self.aggregates_flight.do(user_id, lambda: self._load_user_aggregates(user_id))
+    
+    async def get_many_user_aggregates(self, user_ids: List[str]) -> tuple[UserRepositoryManyResult | None, str | None]:
+        """
+        여러 사용자 전체 데이터 조회 (친구 목록, 길드원, 매칭 로비 등)
+        중복 ID는 한 번만 조회하며, 결과는 처음 나온 순서를 유지
+        
+        Args:
+            user_ids: 사용자 ID 목록
+            
+        Returns:
+            tuple[UserRepositoryManyResult | None, str | None]: (사용자별 데이터와 없는 사용자 ID, 에러)
+        """
+        # 입력 검증
+        if not user_ids:
+            return None, "400: user_ids is required"
+        
+        stripped = [user_id.strip() if user_id else "" for user_id in user_ids]
+        if not all(stripped):
+            return None, "400: user_ids must not contain empty ids"
+        
+        return await self.user_repository.find_many(list(dict.fromkeys(stripped)))
+    
+    async def _load_user_aggregates(self, user_id: str) -> tuple[UserRepositoryResult | None, str | None]:
+        """
+        Repository에서 사용자 전체 데이터 조회
+        
+        Args:
+            user_id: 사용자 ID (공백 제거됨)
+            
+        Returns:
+            tuple[UserRepositoryResult | None, str | None]: (사용자 데이터와 버전, 에러)
+        """
         # Repository 호출
-        result, error = await self.user_repository.find_one(user_id.strip())
+        result, error = await self.user_repository.find_one(user_id)
         
         if error:
             # Repository 에러를 그대로 전파
@@ -42,7 +104,7 @@ class UserService:
             # 사용자를 찾을 수 없음
             return None, "0x001001: User not found"
         
-        return result.data, None
+        return result, None
     
     async def create_new_user(self, user_id: str, nickname: str) -> tuple[UserAggregates | None, str | None]:
         """
@@ -68,8 +130,10 @@ class UserService:
         # 새 사용자 생성
         new_user = UserAggregates.create_new_user(user_id.strip(), nickname.strip())
         
-        # Repository에 저장
-        result, error = await self.user_repository.upsert_one(user_id.strip(), new_user)
+        # Repository에 저장 (버전 충돌 재시도는 요청 데드라인 안에서만)
+        result, error = await self.user_repository.upsert_one(
+            user_id.strip(), new_user, self._repository_options()
+        )
         
         if error:
             return None, error
@@ -77,4 +141,9 @@ class UserService:
         if not result or not result.data:
             return None, "500: Failed to create user"
         
-        return result.data, None
\ No newline at end of file
+        return result.data, None
+    
+    @staticmethod
+    def _repository_options() -> UserRepositoryOptions:
+        """현재 요청의 데드라인을 전달하는 Repository 옵션"""
+        return UserRepositoryOptions(deadline=current_deadline())
@@ -5,8 +5,8 @@ JSON Schema 기반 설정 로드 및 관리
 
 import json
 import os
-from typing import Optional
-from dataclasses import dataclass
+from typing import Dict, Optional
+from dataclasses import dataclass, field
 
 from .server_config_schema import (
     ServerConfigSchema as SchemaServerConfig,
@@ -14,12 +14,41 @@ from .server_config_schema import (
 )
 
 
+@dataclass
+class UnixSocketConfig:
+    """Unix 도메인 소켓 리스너 설정"""
+    path: str
+    mode: int = 0o660
+    tcp_enabled: bool = True
+
+
 @dataclass
 class ServerInfo:
     """서버 정보"""
     port: int
     host: str
     name: str
+    unix_socket: Optional[UnixSocketConfig] = None
+
+
+@dataclass
+class GroupCommitConfig:
+    """같은 사용자 동시 업데이트 그룹 커밋 설정"""
+    enabled: bool = False
+    window_ms: int = 5
+
+
+@dataclass
+class UserDataConfig:
+    """user:{id}:data 저장 형식 설정"""
+    format: str = "json"
+    zlib_level: int = 6
+
+
+@dataclass
+class UserLockConfig:
+    """사용자별 프로세스 내 저장 락 설정"""
+    enabled: bool = True
 
 
 @dataclass
@@ -31,6 +60,118 @@ class RedisConfig:
     password: Optional[str] = None
     retry_delay_on_failover: Optional[int] = None
     max_retries_per_request: Optional[int] = None
+    group_commit: GroupCommitConfig = field(default_factory=GroupCommitConfig)
+    user_lock: UserLockConfig = field(default_factory=UserLockConfig)
+    user_data: UserDataConfig = field(default_factory=UserDataConfig)
+
+
+@dataclass
+class RateLimitRuleConfig:
+    """window_ms 동안 max_requests개까지 허용"""
+    window_ms: int
+    max_requests: int
+
+
+@dataclass
+class RateLimitConfig:
+    """클라이언트별 요청 제한 설정 (api.rate_limit)"""
+    window_ms: int = 900000
+    max_requests: int = 1000
+    enabled: bool = True
+    client_header: Optional[str] = None
+    methods: Dict[str, RateLimitRuleConfig] = field(default_factory=dict)
+
+
+@dataclass
+class ApiConfig:
+    """API 설정"""
+    rate_limit: RateLimitConfig = field(default_factory=RateLimitConfig)
+
+
+@dataclass
+class NotificationQueueConfig:
+    """JSON RPC 알림 백그라운드 큐 설정"""
+    queue_size: int = 1000
+    concurrency: int = 4
+    drop_policy: str = "drop_newest"
+
+
+@dataclass
+class CompressionConfig:
+    """JSON RPC 응답 압축 설정"""
+    enabled: bool = True
+    min_size: int = 1024
+    level: int = 6
+    cache_size: int = 256
+
+
+@dataclass
+class WebSocketConfig:
+    """WebSocket JSON RPC 트랜스포트 설정"""
+    enabled: bool = True
+    max_in_flight: int = 32
+    send_queue_size: int = 64
+
+
+@dataclass
+class TcpTransportConfig:
+    """길이 접두 TCP JSON RPC 리스너 설정 (내부 서비스용, 기본 비활성)"""
+    enabled: bool = False
+    host: str = "127.0.0.1"
+    port: int = 3102
+    max_connections: int = 256
+    max_in_flight: int = 64
+    send_queue_size: int = 128
+    max_frame_size: int = 1024 * 1024
+
+
+@dataclass
+class IdempotencyConfig:
+    """멱등성 키 설정"""
+    enabled: bool = True
+    ttl_seconds: int = 86400
+
+
+@dataclass
+class ConcurrencyLimitConfig:
+    """적응형 동시 처리 한도 설정"""
+    enabled: bool = True
+    initial_limit: int = 100
+    min_limit: int = 10
+    max_limit: int = 1000
+    latency_threshold_ms: int = 500
+    backoff_ratio: float = 0.9
+
+
+@dataclass
+class LaneLimitsConfig:
+    """스케줄링 레인 하나의 동시 실행 수/대기 큐 크기"""
+    concurrency: int
+    max_queue: int
+
+
+@dataclass
+class LanesConfig:
+    """읽기/쓰기 메서드 스케줄링 레인 설정"""
+    enabled: bool = True
+    read: LaneLimitsConfig = field(default_factory=lambda: LaneLimitsConfig(concurrency=256, max_queue=1024))
+    write: LaneLimitsConfig = field(default_factory=lambda: LaneLimitsConfig(concurrency=32, max_queue=256))
+
+
+@dataclass
+class JsonRpcConfig:
+    """JSON RPC 설정"""
+    batch_limit: int = 10
+    user_batch_limit: int = 100
+    timeout: int = 30000
+    method_timeouts: Dict[str, int] = field(default_factory=dict)
+    notifications: NotificationQueueConfig = field(default_factory=NotificationQueueConfig)
+    compression: CompressionConfig = field(default_factory=CompressionConfig)
+    websocket: WebSocketConfig = field(default_factory=WebSocketConfig)
+    tcp: TcpTransportConfig = field(default_factory=TcpTransportConfig)
+    idempotency: IdempotencyConfig = field(default_factory=IdempotencyConfig)
+    lanes: LanesConfig = field(default_factory=LanesConfig)
+    concurrency_limit: ConcurrencyLimitConfig = field(default_factory=ConcurrencyLimitConfig)
 
 
 @dataclass
@@ -40,32 +181,214 @@ class ServerConfig:
     debug: bool
     python_server: ServerInfo
     redis: RedisConfig
+    jsonrpc: JsonRpcConfig = field(default_factory=JsonRpcConfig)
+    api: ApiConfig = field(default_factory=ApiConfig)
     
     @classmethod
     def from_schema(cls, schema_config: SchemaServerConfig) -> 'ServerConfig':
         """스키마 객체에서 비즈니스 객체로 변환"""
         # Python 서버 정보 추출
+        unix_socket_config = None
+        schema_unix_socket = getattr(schema_config.servers.python, 'unix_socket', None)
+        if schema_unix_socket:
+            unix_socket_config = UnixSocketConfig(path=schema_unix_socket.path)
+            if schema_unix_socket.mode:
+                unix_socket_config.mode = int(schema_unix_socket.mode, 8)
+            if schema_unix_socket.tcp_enabled is not None:
+                unix_socket_config.tcp_enabled = schema_unix_socket.tcp_enabled
+        
         python_server = ServerInfo(
             port=schema_config.servers.python.port,
             host=schema_config.servers.python.host,
-            name=schema_config.servers.python.name
+            name=schema_config.servers.python.name,
+            unix_socket=unix_socket_config
         )
         
         # Redis 설정 추출
+        group_commit_config = GroupCommitConfig()
+        schema_group_commit = getattr(schema_config.redis, 'group_commit', None)
+        if schema_group_commit:
+            group_commit_config = GroupCommitConfig(
+                enabled=(
+                    schema_group_commit.enabled
+                    if schema_group_commit.enabled is not None else group_commit_config.enabled
+                ),
+                window_ms=(
+                    schema_group_commit.window_ms
+                    if schema_group_commit.window_ms is not None else group_commit_config.window_ms
+                )
+            )
+        
+        user_lock_config = UserLockConfig()
+        schema_user_lock = getattr(schema_config.redis, 'user_lock', None)
+        if schema_user_lock and schema_user_lock.enabled is not None:
+            user_lock_config = UserLockConfig(enabled=schema_user_lock.enabled)
+        
+        user_data_config = UserDataConfig()
+        schema_user_data = getattr(schema_config.redis, 'user_data', None)
+        if schema_user_data:
+            user_data_config = UserDataConfig(
+                format=(
+                    schema_user_data.format.value
+                    if schema_user_data.format else user_data_config.format
+                ),
+                zlib_level=(
+                    schema_user_data.zlib_level
+                    if schema_user_data.zlib_level is not None else user_data_config.zlib_level
+                )
+            )
+        
         redis_config = RedisConfig(
             host=schema_config.redis.host,
             port=schema_config.redis.port,
             db=schema_config.redis.db,
             password=getattr(schema_config.redis, 'password', None),
             retry_delay_on_failover=getattr(schema_config.redis, 'retry_delay_on_failover', None),
-            max_retries_per_request=getattr(schema_config.redis, 'max_retries_per_request', None)
+            max_retries_per_request=getattr(schema_config.redis, 'max_retries_per_request', None),
+            group_commit=group_commit_config,
+            user_lock=user_lock_config,
+            user_data=user_data_config
+        )
+        
+        # API 설정 추출
+        schema_rate_limit = schema_config.api.rate_limit
+        rate_limit_config = RateLimitConfig(
+            window_ms=schema_rate_limit.window_ms,
+            max_requests=schema_rate_limit.max_requests,
+            enabled=schema_rate_limit.enabled if schema_rate_limit.enabled is not None else True,
+            client_header=schema_rate_limit.client_header,
+            methods={
+                method: RateLimitRuleConfig(window_ms=rule.window_ms, max_requests=rule.max_requests)
+                for method, rule in (schema_rate_limit.methods or {}).items()
+            }
+        )
+        api_config = ApiConfig(rate_limit=rate_limit_config)
+        
+        # JSON RPC 설정 추출
+        notifications_config = NotificationQueueConfig()
+        schema_notifications = getattr(schema_config.jsonrpc, 'notifications', None)
+        if schema_notifications:
+            notifications_config = NotificationQueueConfig(
+                queue_size=schema_notifications.queue_size or notifications_config.queue_size,
+                concurrency=schema_notifications.concurrency or notifications_config.concurrency,
+                drop_policy=(
+                    schema_notifications.drop_policy.value
+                    if schema_notifications.drop_policy else notifications_config.drop_policy
+                )
+            )
+        
+        compression_config = CompressionConfig()
+        schema_compression = getattr(schema_config.jsonrpc, 'compression', None)
+        if schema_compression:
+            compression_config = CompressionConfig(
+                enabled=(
+                    schema_compression.enabled
+                    if schema_compression.enabled is not None else compression_config.enabled
+                ),
+                min_size=(
+                    schema_compression.min_size
+                    if schema_compression.min_size is not None else compression_config.min_size
+                ),
+                level=schema_compression.level or compression_config.level,
+                cache_size=(
+                    schema_compression.cache_size
+                    if schema_compression.cache_size is not None else compression_config.cache_size
+                )
+            )
+        
+        websocket_config = WebSocketConfig()
+        schema_websocket = getattr(schema_config.jsonrpc, 'websocket', None)
+        if schema_websocket:
+            websocket_config = WebSocketConfig(
+                enabled=(
+                    schema_websocket.enabled
+                    if schema_websocket.enabled is not None else websocket_config.enabled
+                ),
+                max_in_flight=schema_websocket.max_in_flight or websocket_config.max_in_flight,
+                send_queue_size=schema_websocket.send_queue_size or websocket_config.send_queue_size
+            )
+        
+        tcp_config = TcpTransportConfig()
+        schema_tcp = getattr(schema_config.jsonrpc, 'tcp', None)
+        if schema_tcp:
+            tcp_config = TcpTransportConfig(
+                enabled=schema_tcp.enabled if schema_tcp.enabled is not None else tcp_config.enabled,
+                host=schema_tcp.host or tcp_config.host,
+                port=schema_tcp.port or tcp_config.port,
+                max_connections=schema_tcp.max_connections or tcp_config.max_connections,
+                max_in_flight=schema_tcp.max_in_flight or tcp_config.max_in_flight,
+                send_queue_size=schema_tcp.send_queue_size or tcp_config.send_queue_size,
+                max_frame_size=schema_tcp.max_frame_size or tcp_config.max_frame_size
+            )
+        
+        idempotency_config = IdempotencyConfig()
+        schema_idempotency = getattr(schema_config.jsonrpc, 'idempotency', None)
+        if schema_idempotency:
+            idempotency_config = IdempotencyConfig(
+                enabled=(
+                    schema_idempotency.enabled
+                    if schema_idempotency.enabled is not None else idempotency_config.enabled
+                ),
+                ttl_seconds=schema_idempotency.ttl_seconds or idempotency_config.ttl_seconds
+            )
+        
+        lanes_config = LanesConfig()
+        schema_lanes = getattr(schema_config.jsonrpc, 'lanes', None)
+        if schema_lanes:
+            lanes_config = LanesConfig(
+                enabled=schema_lanes.enabled if schema_lanes.enabled is not None else lanes_config.enabled,
+                read=cls._lane_limits_from_schema(schema_lanes.read, lanes_config.read),
+                write=cls._lane_limits_from_schema(schema_lanes.write, lanes_config.write)
+            )
+        
+        concurrency_limit_config = ConcurrencyLimitConfig()
+        schema_concurrency_limit = getattr(schema_config.jsonrpc, 'concurrency_limit', None)
+        if schema_concurrency_limit:
+            concurrency_limit_config = ConcurrencyLimitConfig(
+                enabled=(
+                    schema_concurrency_limit.enabled
+                    if schema_concurrency_limit.enabled is not None else concurrency_limit_config.enabled
+                ),
+                initial_limit=schema_concurrency_limit.initial_limit or concurrency_limit_config.initial_limit,
+                min_limit=schema_concurrency_limit.min_limit or concurrency_limit_config.min_limit,
+                max_limit=schema_concurrency_limit.max_limit or concurrency_limit_config.max_limit,
+                latency_threshold_ms=(
+                    schema_concurrency_limit.latency_threshold_ms or concurrency_limit_config.latency_threshold_ms
+                ),
+                backoff_ratio=schema_concurrency_limit.backoff_ratio or concurrency_limit_config.backoff_ratio
+            )
+        
+        jsonrpc_config = JsonRpcConfig(
+            batch_limit=schema_config.jsonrpc.batch_limit,
+            user_batch_limit=getattr(schema_config.jsonrpc, 'user_batch_limit', None) or JsonRpcConfig.user_batch_limit,
+            timeout=schema_config.jsonrpc.timeout,
+            method_timeouts=getattr(schema_config.jsonrpc, 'method_timeouts', None) or {},
+            notifications=notifications_config,
+            compression=compression_config,
+            websocket=websocket_config,
+            tcp=tcp_config,
+            idempotency=idempotency_config,
+            lanes=lanes_config,
+            concurrency_limit=concurrency_limit_config
         )
         
         return cls(
             environment=schema_config.environment,
             debug=schema_config.debug,
             python_server=python_server,
-            redis=redis_config
+            redis=redis_config,
+            jsonrpc=jsonrpc_config,
+            api=api_config
+        )
+    
+    @staticmethod
+    def _lane_limits_from_schema(schema_limits, default: LaneLimitsConfig) -> LaneLimitsConfig:
+        """레인 설정 변환 (없는 값은 기본값 사용)"""
+        if not schema_limits:
+            return default
+        return LaneLimitsConfig(
+            concurrency=schema_limits.concurrency or default.concurrency,
+            max_queue=schema_limits.max_queue if schema_limits.max_queue is not None else default.max_queue
         )
     
     @classmethod
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, List, Optional, TypeVar, Type, cast, Callable
+from typing import Any, List, Optional, Dict, TypeVar, Type, cast, Callable
 from enum import Enum
 
 
@@ -22,6 +22,16 @@ def from_bool(x: Any) -> bool:
     return x
 
 
+def from_float(x: Any) -> float:
+    assert isinstance(x, (float, int)) and not isinstance(x, bool)
+    return float(x)
+
+
+def to_float(x: Any) -> float:
+    assert isinstance(x, (int, float))
+    return x
+
+
 def to_class(c: Type[T], x: Any) -> dict:
     assert isinstance(x, c)
     return cast(Any, x).to_dict()
@@ -42,6 +52,11 @@ def from_none(x: Any) -> Any:
     return x
 
 
+def from_dict(f: Callable[[Any], T], x: Any) -> Dict[str, T]:
+    assert isinstance(x, dict)
+    return { k: f(v) for (k, v) in x.items() }
+
+
 def from_union(fs, x):
     for f in fs:
         try:
@@ -51,6 +66,28 @@ def from_union(fs, x):
     assert False
 
 
+@dataclass
+class RateLimitRule:
+    max_requests: int
+    """Maximum requests per window"""
+
+    window_ms: int
+    """Rate limit window in milliseconds"""
+
+    @staticmethod
+    def from_dict(obj: Any) -> 'RateLimitRule':
+        assert isinstance(obj, dict)
+        max_requests = from_int(obj.get("max_requests"))
+        window_ms = from_int(obj.get("window_ms"))
+        return RateLimitRule(max_requests, window_ms)
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        result["max_requests"] = from_int(self.max_requests)
+        result["window_ms"] = from_int(self.window_ms)
+        return result
+
+
 @dataclass
 class RateLimit:
     max_requests: int
@@ -59,17 +96,35 @@ class RateLimit:
     window_ms: int
     """Rate limit window in milliseconds"""
 
+    client_header: Optional[str] = None
+    """Request header identifying the client (e.g. X-Real-IP set by NGINX); the peer address is used when absent"""
+
+    enabled: Optional[bool] = None
+    """Enforce the per-client rate limit on JSON-RPC calls"""
+
+    methods: Optional[Dict[str, RateLimitRule]] = None
+    """Per-method limits applied in addition to the default limit"""
+
     @staticmethod
     def from_dict(obj: Any) -> 'RateLimit':
         assert isinstance(obj, dict)
         max_requests = from_int(obj.get("max_requests"))
         window_ms = from_int(obj.get("window_ms"))
-        return RateLimit(max_requests, window_ms)
+        client_header = from_union([from_str, from_none], obj.get("client_header"))
+        enabled = from_union([from_bool, from_none], obj.get("enabled"))
+        methods = from_union([lambda x: from_dict(RateLimitRule.from_dict, x), from_none], obj.get("methods"))
+        return RateLimit(max_requests, window_ms, client_header, enabled, methods)
 
     def to_dict(self) -> dict:
         result: dict = {}
         result["max_requests"] = from_int(self.max_requests)
         result["window_ms"] = from_int(self.window_ms)
+        if self.client_header is not None:
+            result["client_header"] = from_union([from_str, from_none], self.client_header)
+        if self.enabled is not None:
+            result["enabled"] = from_union([from_bool, from_none], self.enabled)
+        if self.methods is not None:
+            result["methods"] = from_union([lambda x: from_dict(lambda x: to_class(RateLimitRule, x), x), from_none], self.methods)
         return result
 
 
@@ -153,6 +208,302 @@ class Environment(Enum):
     TESTING = "testing"
 
 
+class DropPolicy(Enum):
+    """Which notification to drop when the queue is full"""
+
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+
+
+@dataclass
+class Notifications:
+    """Background queue for JSON-RPC notifications (requests without id)"""
+
+    concurrency: Optional[int] = None
+    """Number of notifications executed concurrently"""
+
+    drop_policy: Optional[DropPolicy] = None
+    """Which notification to drop when the queue is full"""
+
+    queue_size: Optional[int] = None
+    """Maximum number of queued notifications"""
+
+    @staticmethod
+    def from_dict(obj: Any) -> 'Notifications':
+        assert isinstance(obj, dict)
+        concurrency = from_union([from_int, from_none], obj.get("concurrency"))
+        drop_policy = from_union([DropPolicy, from_none], obj.get("drop_policy"))
+        queue_size = from_union([from_int, from_none], obj.get("queue_size"))
+        return Notifications(concurrency, drop_policy, queue_size)
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        if self.concurrency is not None:
+            result["concurrency"] = from_union([from_int, from_none], self.concurrency)
+        if self.drop_policy is not None:
+            result["drop_policy"] = from_union([lambda x: to_enum(DropPolicy, x), from_none], self.drop_policy)
+        if self.queue_size is not None:
+            result["queue_size"] = from_union([from_int, from_none], self.queue_size)
+        return result
+
+
+@dataclass
+class Compression:
+    """HTTP response compression for the JSON-RPC endpoint (negotiated from Accept-Encoding)"""
+
+    cache_size: Optional[int] = None
+    """Maximum number of compressed results cached by version tag (0 disables the cache)"""
+
+    enabled: Optional[bool] = None
+    """Enable gzip/deflate compression of JSON-RPC responses"""
+
+    level: Optional[int] = None
+    """zlib compression level"""
+
+    min_size: Optional[int] = None
+    """Responses smaller than this many bytes are sent uncompressed"""
+
+    @staticmethod
+    def from_dict(obj: Any) -> 'Compression':
+        assert isinstance(obj, dict)
+        cache_size = from_union([from_int, from_none], obj.get("cache_size"))
+        enabled = from_union([from_bool, from_none], obj.get("enabled"))
+        level = from_union([from_int, from_none], obj.get("level"))
+        min_size = from_union([from_int, from_none], obj.get("min_size"))
+        return Compression(cache_size, enabled, level, min_size)
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        if self.cache_size is not None:
+            result["cache_size"] = from_union([from_int, from_none], self.cache_size)
+        if self.enabled is not None:
+            result["enabled"] = from_union([from_bool, from_none], self.enabled)
+        if self.level is not None:
+            result["level"] = from_union([from_int, from_none], self.level)
+        if self.min_size is not None:
+            result["min_size"] = from_union([from_int, from_none], self.min_size)
+        return result
+
+
+@dataclass
+class ConcurrencyLimit:
+    """Adaptive (AIMD) limit on concurrently processed JSON-RPC requests; requests over the limit fail fast"""
+
+    backoff_ratio: Optional[float] = None
+    """Factor applied to the limit when a slow request is observed"""
+
+    enabled: Optional[bool] = None
+    """Reject requests over the adaptive concurrency limit instead of queueing them"""
+
+    initial_limit: Optional[int] = None
+    """Concurrency limit at startup"""
+
+    latency_threshold_ms: Optional[int] = None
+    """Requests slower than this shrink the limit; faster ones grow it"""
+
+    max_limit: Optional[int] = None
+    """Upper bound of the concurrency limit"""
+
+    min_limit: Optional[int] = None
+    """Lower bound of the concurrency limit"""
+
+    @staticmethod
+    def from_dict(obj: Any) -> 'ConcurrencyLimit':
+        assert isinstance(obj, dict)
+        backoff_ratio = from_union([from_float, from_none], obj.get("backoff_ratio"))
+        enabled = from_union([from_bool, from_none], obj.get("enabled"))
+        initial_limit = from_union([from_int, from_none], obj.get("initial_limit"))
+        latency_threshold_ms = from_union([from_int, from_none], obj.get("latency_threshold_ms"))
+        max_limit = from_union([from_int, from_none], obj.get("max_limit"))
+        min_limit = from_union([from_int, from_none], obj.get("min_limit"))
+        return ConcurrencyLimit(backoff_ratio, enabled, initial_limit, latency_threshold_ms, max_limit, min_limit)
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        if self.backoff_ratio is not None:
+            result["backoff_ratio"] = from_union([to_float, from_none], self.backoff_ratio)
+        if self.enabled is not None:
+            result["enabled"] = from_union([from_bool, from_none], self.enabled)
+        if self.initial_limit is not None:
+            result["initial_limit"] = from_union([from_int, from_none], self.initial_limit)
+        if self.latency_threshold_ms is not None:
+            result["latency_threshold_ms"] = from_union([from_int, from_none], self.latency_threshold_ms)
+        if self.max_limit is not None:
+            result["max_limit"] = from_union([from_int, from_none], self.max_limit)
+        if self.min_limit is not None:
+            result["min_limit"] = from_union([from_int, from_none], self.min_limit)
+        return result
+
+
+@dataclass
+class Idempotency:
+    """Idempotency-Key support for mutating JSON-RPC methods"""
+
+    enabled: Optional[bool] = None
+    """Honour the Idempotency-Key header on mutating methods"""
+
+    ttl_seconds: Optional[int] = None
+    """How long a stored response is replayed for duplicate keys"""
+
+    @staticmethod
+    def from_dict(obj: Any) -> 'Idempotency':
+        assert isinstance(obj, dict)
+        enabled = from_union([from_bool, from_none], obj.get("enabled"))
+        ttl_seconds = from_union([from_int, from_none], obj.get("ttl_seconds"))
+        return Idempotency(enabled, ttl_seconds)
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        if self.enabled is not None:
+            result["enabled"] = from_union([from_bool, from_none], self.enabled)
+        if self.ttl_seconds is not None:
+            result["ttl_seconds"] = from_union([from_int, from_none], self.ttl_seconds)
+        return result
+
+
+@dataclass
+class Websocket:
+    """WebSocket JSON-RPC transport (/api/jsonrpc/ws)"""
+
+    enabled: Optional[bool] = None
+    """Enable the WebSocket JSON-RPC endpoint"""
+
+    max_in_flight: Optional[int] = None
+    """Maximum concurrent requests per connection (further frames are not read until a slot frees)"""
+
+    send_queue_size: Optional[int] = None
+    """Maximum responses waiting to be written per connection"""
+
+    @staticmethod
+    def from_dict(obj: Any) -> 'Websocket':
+        assert isinstance(obj, dict)
+        enabled = from_union([from_bool, from_none], obj.get("enabled"))
+        max_in_flight = from_union([from_int, from_none], obj.get("max_in_flight"))
+        send_queue_size = from_union([from_int, from_none], obj.get("send_queue_size"))
+        return Websocket(enabled, max_in_flight, send_queue_size)
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        if self.enabled is not None:
+            result["enabled"] = from_union([from_bool, from_none], self.enabled)
+        if self.max_in_flight is not None:
+            result["max_in_flight"] = from_union([from_int, from_none], self.max_in_flight)
+        if self.send_queue_size is not None:
+            result["send_queue_size"] = from_union([from_int, from_none], self.send_queue_size)
+        return result
+
+
+@dataclass
+class TCP:
+    """Length-prefixed TCP JSON-RPC listener for internal service-to-service calls"""
+
+    enabled: Optional[bool] = None
+    """Start the TCP listener alongside the HTTP server"""
+
+    host: Optional[str] = None
+    """TCP listener bind address"""
+
+    max_connections: Optional[int] = None
+    """Maximum concurrent TCP connections"""
+
+    max_frame_size: Optional[int] = None
+    """Maximum request frame size in bytes"""
+
+    max_in_flight: Optional[int] = None
+    """Maximum concurrent requests per connection"""
+
+    port: Optional[int] = None
+    """TCP listener port"""
+
+    send_queue_size: Optional[int] = None
+    """Maximum responses waiting to be written per connection"""
+
+    @staticmethod
+    def from_dict(obj: Any) -> 'TCP':
+        assert isinstance(obj, dict)
+        enabled = from_union([from_bool, from_none], obj.get("enabled"))
+        host = from_union([from_str, from_none], obj.get("host"))
+        max_connections = from_union([from_int, from_none], obj.get("max_connections"))
+        max_frame_size = from_union([from_int, from_none], obj.get("max_frame_size"))
+        max_in_flight = from_union([from_int, from_none], obj.get("max_in_flight"))
+        port = from_union([from_int, from_none], obj.get("port"))
+        send_queue_size = from_union([from_int, from_none], obj.get("send_queue_size"))
+        return TCP(enabled, host, max_connections, max_frame_size, max_in_flight, port, send_queue_size)
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        if self.enabled is not None:
+            result["enabled"] = from_union([from_bool, from_none], self.enabled)
+        if self.host is not None:
+            result["host"] = from_union([from_str, from_none], self.host)
+        if self.max_connections is not None:
+            result["max_connections"] = from_union([from_int, from_none], self.max_connections)
+        if self.max_frame_size is not None:
+            result["max_frame_size"] = from_union([from_int, from_none], self.max_frame_size)
+        if self.max_in_flight is not None:
+            result["max_in_flight"] = from_union([from_int, from_none], self.max_in_flight)
+        if self.port is not None:
+            result["port"] = from_union([from_int, from_none], self.port)
+        if self.send_queue_size is not None:
+            result["send_queue_size"] = from_union([from_int, from_none], self.send_queue_size)
+        return result
+
+
+@dataclass
+class LaneLimits:
+    """Concurrency limit and wait queue of one scheduling lane"""
+
+    concurrency: Optional[int] = None
+    """Maximum methods of this lane executing concurrently"""
+
+    max_queue: Optional[int] = None
+    """Maximum requests waiting for a slot (further requests fail with a server overloaded error)"""
+
+    @staticmethod
+    def from_dict(obj: Any) -> 'LaneLimits':
+        assert isinstance(obj, dict)
+        concurrency = from_union([from_int, from_none], obj.get("concurrency"))
+        max_queue = from_union([from_int, from_none], obj.get("max_queue"))
+        return LaneLimits(concurrency, max_queue)
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        if self.concurrency is not None:
+            result["concurrency"] = from_union([from_int, from_none], self.concurrency)
+        if self.max_queue is not None:
+            result["max_queue"] = from_union([from_int, from_none], self.max_queue)
+        return result
+
+
+@dataclass
+class Lanes:
+    """Separate scheduling lanes for read-only and mutating JSON-RPC methods"""
+
+    enabled: Optional[bool] = None
+    """Schedule method execution through per-lane concurrency limits and queues"""
+
+    read: Optional[LaneLimits] = None
+    write: Optional[LaneLimits] = None
+
+    @staticmethod
+    def from_dict(obj: Any) -> 'Lanes':
+        assert isinstance(obj, dict)
+        enabled = from_union([from_bool, from_none], obj.get("enabled"))
+        read = from_union([LaneLimits.from_dict, from_none], obj.get("read"))
+        write = from_union([LaneLimits.from_dict, from_none], obj.get("write"))
+        return Lanes(enabled, read, write)
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        if self.enabled is not None:
+            result["enabled"] = from_union([from_bool, from_none], self.enabled)
+        if self.read is not None:
+            result["read"] = from_union([lambda x: to_class(LaneLimits, x), from_none], self.read)
+        if self.write is not None:
+            result["write"] = from_union([lambda x: to_class(LaneLimits, x), from_none], self.write)
+        return result
+
+
 class Version(Enum):
     """JSON-RPC version"""
 
@@ -170,19 +521,73 @@ class Jsonrpc:
     version: Version
     """JSON-RPC version"""
 
+    compression: Optional[Compression] = None
+    """HTTP response compression for the JSON-RPC endpoint (negotiated from Accept-Encoding)"""
+
+    concurrency_limit: Optional[ConcurrencyLimit] = None
+    """Adaptive (AIMD) limit on concurrently processed JSON-RPC requests; requests over the limit fail fast"""
+
+    idempotency: Optional[Idempotency] = None
+    """Idempotency-Key support for mutating JSON-RPC methods"""
+
+    lanes: Optional[Lanes] = None
+    """Separate scheduling lanes for read-only and mutating JSON-RPC methods"""
+
+    method_timeouts: Optional[Dict[str, int]] = None
+    """Per-method request timeout overrides in milliseconds"""
+
+    notifications: Optional[Notifications] = None
+    """Background queue for JSON-RPC notifications (requests without id)"""
+
+    tcp: Optional[TCP] = None
+    """Length-prefixed TCP JSON-RPC listener for internal service-to-service calls"""
+
+    user_batch_limit: Optional[int] = None
+    """Maximum number of users per getUserAggregatesBatch call"""
+
+    websocket: Optional[Websocket] = None
+    """WebSocket JSON-RPC transport (/api/jsonrpc/ws)"""
+
     @staticmethod
     def from_dict(obj: Any) -> 'Jsonrpc':
         assert isinstance(obj, dict)
         batch_limit = from_int(obj.get("batch_limit"))
         timeout = from_int(obj.get("timeout"))
         version = Version(obj.get("version"))
-        return Jsonrpc(batch_limit, timeout, version)
+        compression = from_union([Compression.from_dict, from_none], obj.get("compression"))
+        concurrency_limit = from_union([ConcurrencyLimit.from_dict, from_none], obj.get("concurrency_limit"))
+        idempotency = from_union([Idempotency.from_dict, from_none], obj.get("idempotency"))
+        lanes = from_union([Lanes.from_dict, from_none], obj.get("lanes"))
+        method_timeouts = from_union([lambda x: from_dict(from_int, x), from_none], obj.get("method_timeouts"))
+        notifications = from_union([Notifications.from_dict, from_none], obj.get("notifications"))
+        tcp = from_union([TCP.from_dict, from_none], obj.get("tcp"))
+        user_batch_limit = from_union([from_int, from_none], obj.get("user_batch_limit"))
+        websocket = from_union([Websocket.from_dict, from_none], obj.get("websocket"))
+        return Jsonrpc(batch_limit, timeout, version, compression, concurrency_limit, idempotency, lanes, method_timeouts, notifications, tcp, user_batch_limit, websocket)
 
     def to_dict(self) -> dict:
         result: dict = {}
         result["batch_limit"] = from_int(self.batch_limit)
         result["timeout"] = from_int(self.timeout)
         result["version"] = to_enum(Version, self.version)
+        if self.compression is not None:
+            result["compression"] = from_union([lambda x: to_class(Compression, x), from_none], self.compression)
+        if self.concurrency_limit is not None:
+            result["concurrency_limit"] = from_union([lambda x: to_class(ConcurrencyLimit, x), from_none], self.concurrency_limit)
+        if self.idempotency is not None:
+            result["idempotency"] = from_union([lambda x: to_class(Idempotency, x), from_none], self.idempotency)
+        if self.lanes is not None:
+            result["lanes"] = from_union([lambda x: to_class(Lanes, x), from_none], self.lanes)
+        if self.method_timeouts is not None:
+            result["method_timeouts"] = from_union([lambda x: from_dict(from_int, x), from_none], self.method_timeouts)
+        if self.notifications is not None:
+            result["notifications"] = from_union([lambda x: to_class(Notifications, x), from_none], self.notifications)
+        if self.tcp is not None:
+            result["tcp"] = from_union([lambda x: to_class(TCP, x), from_none], self.tcp)
+        if self.user_batch_limit is not None:
+            result["user_batch_limit"] = from_union([from_int, from_none], self.user_batch_limit)
+        if self.websocket is not None:
+            result["websocket"] = from_union([lambda x: to_class(Websocket, x), from_none], self.websocket)
         return result
 
 
@@ -261,6 +666,86 @@ class Nginx:
         return result
 
 
+@dataclass
+class GroupCommit:
+    """Coalesce concurrent updates to the same user into one version-checked write"""
+
+    enabled: Optional[bool] = None
+    """Group concurrent find_one_and_update calls per user"""
+
+    window_ms: Optional[int] = None
+    """How long a group collects updates before committing (updates also join while the previous write is in flight)"""
+
+    @staticmethod
+    def from_dict(obj: Any) -> 'GroupCommit':
+        assert isinstance(obj, dict)
+        enabled = from_union([from_bool, from_none], obj.get("enabled"))
+        window_ms = from_union([from_int, from_none], obj.get("window_ms"))
+        return GroupCommit(enabled, window_ms)
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        if self.enabled is not None:
+            result["enabled"] = from_union([from_bool, from_none], self.enabled)
+        if self.window_ms is not None:
+            result["window_ms"] = from_union([from_int, from_none], self.window_ms)
+        return result
+
+
+class Format(Enum):
+    """Format used when writing user data"""
+
+    JSON = "json"
+    JSON_ZLIB = "json_zlib"
+    MSGPACK = "msgpack"
+
+
+@dataclass
+class UserData:
+    """Storage format of user:{id}:data (reads accept every format, writes migrate data to the configured one)"""
+
+    format: Optional[Format] = None
+    """Format used when writing user data"""
+
+    zlib_level: Optional[int] = None
+    """Compression level for the json_zlib format"""
+
+    @staticmethod
+    def from_dict(obj: Any) -> 'UserData':
+        assert isinstance(obj, dict)
+        format = from_union([Format, from_none], obj.get("format"))
+        zlib_level = from_union([from_int, from_none], obj.get("zlib_level"))
+        return UserData(format, zlib_level)
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        if self.format is not None:
+            result["format"] = from_union([lambda x: to_enum(Format, x), from_none], self.format)
+        if self.zlib_level is not None:
+            result["zlib_level"] = from_union([from_int, from_none], self.zlib_level)
+        return result
+
+
+@dataclass
+class UserLock:
+    """In-process per-user lock around version-checked saves"""
+
+    enabled: Optional[bool] = None
+    """Queue same-process saves to the same user instead of retrying on version conflicts (other servers still rely on the version check)"""
+
+    @staticmethod
+    def from_dict(obj: Any) -> 'UserLock':
+        assert isinstance(obj, dict)
+        enabled = from_union([from_bool, from_none], obj.get("enabled"))
+        return UserLock(enabled)
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        if self.enabled is not None:
+            result["enabled"] = from_union([from_bool, from_none], self.enabled)
+        return result
+
+
 @dataclass
 class Redis:
     db: int
@@ -272,6 +757,9 @@ class Redis:
     port: int
     """Redis port number"""
 
+    group_commit: Optional[GroupCommit] = None
+    """Coalesce concurrent updates to the same user into one version-checked write"""
+
     max_retries_per_request: Optional[int] = None
     """Maximum retry attempts per request"""
 
@@ -281,28 +769,74 @@ class Redis:
     retry_delay_on_failover: Optional[int] = None
     """Retry delay in milliseconds"""
 
+    user_data: Optional[UserData] = None
+    """Storage format of user:{id}:data (reads accept every format, writes migrate data to the configured one)"""
+
+    user_lock: Optional[UserLock] = None
+    """In-process per-user lock around version-checked saves"""
+
     @staticmethod
     def from_dict(obj: Any) -> 'Redis':
         assert isinstance(obj, dict)
         db = from_int(obj.get("db"))
         host = from_str(obj.get("host"))
         port = from_int(obj.get("port"))
+        group_commit = from_union([GroupCommit.from_dict, from_none], obj.get("group_commit"))
         max_retries_per_request = from_union([from_int, from_none], obj.get("max_retries_per_request"))
         password = from_union([from_str, from_none], obj.get("password"))
         retry_delay_on_failover = from_union([from_int, from_none], obj.get("retry_delay_on_failover"))
-        return Redis(db, host, port, max_retries_per_request, password, retry_delay_on_failover)
+        user_data = from_union([UserData.from_dict, from_none], obj.get("user_data"))
+        user_lock = from_union([UserLock.from_dict, from_none], obj.get("user_lock"))
+        return Redis(db, host, port, group_commit, max_retries_per_request, password, retry_delay_on_failover, user_data, user_lock)
 
     def to_dict(self) -> dict:
         result: dict = {}
         result["db"] = from_int(self.db)
         result["host"] = from_str(self.host)
         result["port"] = from_int(self.port)
+        if self.group_commit is not None:
+            result["group_commit"] = from_union([lambda x: to_class(GroupCommit, x), from_none], self.group_commit)
         if self.max_retries_per_request is not None:
             result["max_retries_per_request"] = from_union([from_int, from_none], self.max_retries_per_request)
         if self.password is not None:
             result["password"] = from_union([from_str, from_none], self.password)
         if self.retry_delay_on_failover is not None:
             result["retry_delay_on_failover"] = from_union([from_int, from_none], self.retry_delay_on_failover)
+        if self.user_data is not None:
+            result["user_data"] = from_union([lambda x: to_class(UserData, x), from_none], self.user_data)
+        if self.user_lock is not None:
+            result["user_lock"] = from_union([lambda x: to_class(UserLock, x), from_none], self.user_lock)
+        return result
+
+
+@dataclass
+class UnixSocket:
+    """Unix domain socket listener (for a reverse proxy on the same host)"""
+
+    path: str
+    """Unix domain socket file path"""
+
+    mode: Optional[str] = None
+    """Socket file permissions in octal (e.g. 0660)"""
+
+    tcp_enabled: Optional[bool] = None
+    """Keep listening on host:port as well (false serves only the Unix socket)"""
+
+    @staticmethod
+    def from_dict(obj: Any) -> 'UnixSocket':
+        assert isinstance(obj, dict)
+        path = from_str(obj.get("path"))
+        mode = from_union([from_str, from_none], obj.get("mode"))
+        tcp_enabled = from_union([from_bool, from_none], obj.get("tcp_enabled"))
+        return UnixSocket(path, mode, tcp_enabled)
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        result["path"] = from_str(self.path)
+        if self.mode is not None:
+            result["mode"] = from_union([from_str, from_none], self.mode)
+        if self.tcp_enabled is not None:
+            result["tcp_enabled"] = from_union([from_bool, from_none], self.tcp_enabled)
         return result
 
 
@@ -317,19 +851,25 @@ class ServerInfo:
     port: int
     """Server port number"""
 
+    unix_socket: Optional[UnixSocket] = None
+    """Unix domain socket listener (for a reverse proxy on the same host)"""
+
     @staticmethod
     def from_dict(obj: Any) -> 'ServerInfo':
         assert isinstance(obj, dict)
         host = from_str(obj.get("host"))
         name = from_str(obj.get("name"))
         port = from_int(obj.get("port"))
-        return ServerInfo(host, name, port)
+        unix_socket = from_union([UnixSocket.from_dict, from_none], obj.get("unix_socket"))
+        return ServerInfo(host, name, port, unix_socket)
 
     def to_dict(self) -> dict:
         result: dict = {}
         result["host"] = from_str(self.host)
         result["name"] = from_str(self.name)
         result["port"] = from_int(self.port)
+        if self.unix_socket is not None:
+            result["unix_socket"] = from_union([lambda x: to_class(UnixSocket, x), from_none], self.unix_socket)
         return result
 
 
@@ -0,0 +1,237 @@
+"""
+그룹 커밋 UserRepository
+같은 사용자에 대한 find_one_and_update 호출을 모아 한 번 조회한 데이터에 순서대로 적용하고 버전 체크 저장 1회로 커밋
+
+경험치 획득, 아이템 줍기처럼 한 사용자에게 변경이 연달아 들어오면 호출마다 같은 버전 키로 경쟁하여
+매 라운드 하나만 성공하고 나머지는 재시도/백오프를 반복함. 그룹 커밋은 다음 호출을 하나의 쓰기로 병합:
+- window_ms 안에 들어온 호출
+- 같은 사용자의 이전 쓰기가 진행 중일 때 들어온 호출 (이전 쓰기가 끝나면 다음 그룹으로 커밋)
+
+그 외 메서드는 내부 Repository에 그대로 위임
+"""
+
+import asyncio
+import copy
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .user_repository import (
+    UserRepository,
+    UserRepositoryResult,
+    UserRepositoryManyResult,
+    UserRepositoryOptions,
+    UserRepositoryBulkOptions,
+    UserUpsert,
+    UserUpsertResult
+)
+from ..aggregates import UserAggregates
+
+
+@dataclass
+class _Update:
+    """그룹에 참여한 호출 하나"""
+    update_fn: Callable[[UserAggregates, str], UserAggregates]
+    future: asyncio.Future
+
+
+@dataclass
+class _Group:
+    """아직 커밋을 시작하지 않은 사용자별 그룹"""
+    updates: List[_Update] = field(default_factory=list)
+    options: List[UserRepositoryOptions] = field(default_factory=list)
+    task: Optional[asyncio.Task] = None
+    # 쓰기 시작 여부 (시작 후에는 호출자가 취소되어도 변경이 그룹과 함께 커밋됨)
+    applying: bool = False
+
+
+class _UpdateFailed(Exception):
+    """그룹 안의 update_fn 하나가 예외를 발생시킴 (해당 호출만 제외하고 다시 커밋)"""
+
+    def __init__(self, update: _Update, error: BaseException):
+        super().__init__(str(error))
+        self.update = update
+        self.error = error
+
+
+class GroupCommitUserRepository(UserRepository):
+    """사용자별 그룹 커밋을 적용하는 UserRepository 데코레이터 (이벤트 루프 단일 스레드에서 사용)"""
+
+    def __init__(self, inner: UserRepository, window_ms: int = 5):
+        self.inner = inner
+        self.window = window_ms / 1000
+        # 사용자별: 호출을 모으는 중인 그룹 / 가장 마지막에 시작된 그룹의 커밋 작업
+        self._open: Dict[str, _Group] = {}
+        self._tails: Dict[str, asyncio.Task] = {}
+        self.calls = 0
+        self.commits = 0
+
+    async def find_one(self, user_id: str) -> tuple[UserRepositoryResult | None, str | None]:
+        return await self.inner.find_one(user_id)
+
+    async def find_many(self, user_ids: List[str]) -> tuple[UserRepositoryManyResult | None, str | None]:
+        return await self.inner.find_many(user_ids)
+
+    async def find_one_and_upsert(
+        self,
+        user_id: str,
+        create_fn: Callable[[str], UserAggregates],
+        update_fn: Callable[[UserAggregates, str], UserAggregates],
+        options: Optional[UserRepositoryOptions] = None
+    ) -> tuple[UserRepositoryResult | None, str | None]:
+        return await self.inner.find_one_and_upsert(user_id, create_fn, update_fn, options)
+
+    async def upsert_one(
+        self,
+        user_id: str,
+        aggregates: UserAggregates,
+        options: Optional[UserRepositoryOptions] = None
+    ) -> tuple[UserRepositoryResult | None, str | None]:
+        return await self.inner.upsert_one(user_id, aggregates, options)
+
+    async def upsert_many(
+        self,
+        entries: List[UserUpsert],
+        options: Optional[UserRepositoryBulkOptions] = None
+    ) -> tuple[List[UserUpsertResult] | None, str | None]:
+        return await self.inner.upsert_many(entries, options)
+
+    async def find_one_and_update(
+        self,
+        user_id: str,
+        update_fn: Callable[[UserAggregates, str], UserAggregates],
+        options: Optional[UserRepositoryOptions] = None
+    ) -> tuple[UserRepositoryResult | None, str | None]:
+        """
+        기존 사용자 데이터만 업데이트 (같은 사용자의 동시 호출은 그룹 커밋)
+        update_fn은 그룹 안에서 도착 순서대로 이전 호출의 결과에 적용되며, 버전 충돌 시 그룹 전체가 다시 적용됨
+
+        Args:
+            user_id: 사용자 ID
+            update_fn: 업데이트 함수: (current_aggregates, user_id) -> UserAggregates
+            options: 추가 옵션 (그룹의 재시도 횟수와 마감 시각은 참여한 호출 중 가장 여유 있는 값 사용)
+
+        Returns:
+            tuple[UserRepositoryResult | None, str | None]: (결과, 에러)
+                결과 data는 그룹에서 이 호출의 update_fn까지 적용된 데이터, version은 그룹이 커밋된 버전
+
+        Raises:
+            Exception: update_fn이 발생시킨 예외 (해당 호출만 실패하고 그룹의 다른 변경은 커밋)
+        """
+        self.calls += 1
+        group = self._open.get(user_id)
+        if group is None:
+            group = _Group()
+            self._open[user_id] = group
+            group.task = asyncio.ensure_future(self._commit(user_id, group, self._tails.get(user_id)))
+            self._tails[user_id] = group.task
+            group.task.add_done_callback(lambda task: self._forget(user_id, task))
+
+        update = _Update(update_fn=update_fn, future=asyncio.get_running_loop().create_future())
+        group.updates.append(update)
+        group.options.append(options or UserRepositoryOptions())
+        try:
+            return await asyncio.shield(update.future)
+        except asyncio.CancelledError:
+            # 쓰기 시작 전에 취소되면 그룹에서 제외, 시작 후에는 변경이 다른 호출자와 함께 커밋됨
+            if not group.applying:
+                update.future.cancel()
+            raise
+
+    async def _commit(self, user_id: str, group: _Group, previous: Optional[asyncio.Task]):
+        """그룹 수집 -> 이전 쓰기 완료 대기 -> 모은 변경을 저장 1회로 커밋"""
+        try:
+            try:
+                await asyncio.sleep(self.window)
+                if previous is not None:
+                    await asyncio.wait([previous])
+            finally:
+                # 여기부터 들어오는 호출은 다음 그룹으로
+                if self._open.get(user_id) is group:
+                    del self._open[user_id]
+
+            await self._apply_group(user_id, group)
+        except asyncio.CancelledError:
+            for update in group.updates:
+                update.future.cancel()
+            raise
+
+    async def _apply_group(self, user_id: str, group: _Group):
+        """그룹의 update_fn을 순서대로 적용하여 커밋하고 호출자별 결과 전달"""
+        # 쓰기 시작 전에 취소된 호출은 제외
+        group.applying = True
+        pending = [update for update in group.updates if not update.future.cancelled()]
+        if not pending:
+            return
+
+        self.commits += 1
+        options = self._group_options(group.options)
+        while pending:
+            # 호출별로 자신의 update_fn까지 적용된 데이터 (버전 충돌로 다시 적용되면 새로 기록)
+            snapshots: Dict[int, UserAggregates] = {}
+
+            def apply_all(current: UserAggregates, uid: str) -> UserAggregates:
+                snapshots.clear()
+                for update in pending:
+                    try:
+                        current = update.update_fn(current, uid)
+                    except Exception as e:
+                        raise _UpdateFailed(update, e)
+                    # 이후 update_fn이 같은 객체를 수정할 수 있으므로 복사
+                    snapshots[id(update)] = copy.deepcopy(current)
+                return current
+
+            try:
+                result, error = await self.inner.find_one_and_update(user_id, apply_all, options)
+            except _UpdateFailed as failed:
+                # 실패한 호출만 제외하고 최신 데이터로 다시 커밋
+                pending.remove(failed.update)
+                self._settle(failed.update, error=failed.error)
+                continue
+            except Exception as e:
+                for update in pending:
+                    self._settle(update, error=e)
+                return
+
+            for update in pending:
+                self._settle(update, value=(
+                    UserRepositoryResult(
+                        data=snapshots.get(id(update), result.data),
+                        version=result.version,
+                        created=result.created
+                    ) if result else None,
+                    error
+                ))
+            return
+
+    @staticmethod
+    def _group_options(options: List[UserRepositoryOptions]) -> UserRepositoryOptions:
+        """그룹 옵션: 가장 많은 재시도 횟수와 가장 늦은 마감 시각 (마감 없는 호출이 있으면 마감 없음)"""
+        deadlines = [option.deadline for option in options]
+        return UserRepositoryOptions(
+            retries=max(option.retries for option in options),
+            deadline=None if None in deadlines else max(deadlines)
+        )
+
+    @staticmethod
+    def _settle(update: _Update, value: Any = None, error: Optional[BaseException] = None):
+        """호출자에게 결과 전달 (이미 취소된 호출은 무시)"""
+        if update.future.done():
+            return
+        if error is not None:
+            update.future.set_exception(error)
+        else:
+            update.future.set_result(value)
+
+    def _forget(self, user_id: str, task: asyncio.Task):
+        """마지막 그룹의 커밋이 끝나면 사용자 상태 제거"""
+        if self._tails.get(user_id) is task:
+            del self._tails[user_id]
+
+    def stats(self) -> Dict[str, Any]:
+        """그룹 커밋 통계 (메트릭 수집기)"""
+        return {
+            "calls": self.calls,
+            "commits": self.commits,
+            "coalesced": self.calls - self.commits,
+            "open_groups": len(self._open)
+        }
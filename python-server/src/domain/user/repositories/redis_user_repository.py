@@ -3,9 +3,10 @@ Redis 기반 UserRepository 구현체
 아키텍처 문서의 IoC 패턴과 낙관적 동시성 제어 구현
 """
 
-import json
+import time
+import random
 import asyncio
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, List
 from datetime import datetime
 
 import redis.asyncio as redis
@@ -13,16 +14,61 @@ import redis.asyncio as redis
 from .user_repository import (
     UserRepository, 
     UserRepositoryResult, 
-    UserRepositoryOptions
+    UserRepositoryManyResult,
+    UserRepositoryOptions,
+    UserRepositoryBulkOptions,
+    UserUpsert,
+    UserUpsertResult
 )
+from .user_data_codec import UserDataCodec
 from ..aggregates import UserAggregates
+from src.infrastructure.concurrency.keyed_lock import KeyedLock
+
+# 버전 체크 저장 (compare-and-set): 요청 1회로 버전 확인과 데이터/버전/메타데이터 저장을 원자적으로 수행
+# KEYS[1]: user:{id}:data, KEYS[2]: user:{id}:version, KEYS[3]: user:{id}:metadata
+# ARGV[1]: 예상 버전 (새 사용자는 0, 빈 문자열이면 버전과 관계없이 저장), ARGV[2]: 코덱으로 인코딩한 데이터, ARGV[3]: lastModified
+# ARGV[4]: "0"이면 버전 충돌 시 현재 데이터를 반환하지 않음 (대량 저장용)
+# 반환: 성공 {1, 새 버전} / 버전 충돌 {0, 현재 버전, 현재 데이터} (호출자가 다시 조회하지 않고 재시도)
+SAVE_WITH_VERSION_CHECK_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[2]) or '0')
+if ARGV[1] ~= '' and current ~= tonumber(ARGV[1]) then
+    if ARGV[4] == '0' then
+        return {0, current}
+    end
+    return {0, current, redis.call('HGET', KEYS[1], 'data')}
+end
+
+local new_version = current + 1
+redis.call('HSET', KEYS[1], 'data', ARGV[2])
+redis.call('SET', KEYS[2], new_version)
+redis.call('HSET', KEYS[3], 'lastModified', ARGV[3])
+return {1, new_version}
+"""
 
 
 class RedisUserRepository(UserRepository):
     """Redis 기반 UserRepository 구현체"""
     
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        decode_chunk_size: int = 32,
+        user_lock: Optional[KeyedLock] = None,
+        codec: Optional[UserDataCodec] = None
+    ):
+        # 저장 데이터가 바이너리 형식일 수 있으므로 decode_responses=False 클라이언트 사용
         self.redis = redis_client
+        # 저장 데이터 코덱: 읽기는 모든 형식, 쓰기는 설정된 형식 (기본 JSON)
+        self.codec = codec or UserDataCodec()
+        # find_many에서 이벤트 루프에 양보하기 전까지 연속으로 역직렬화하는 사용자 수
+        self.decode_chunk_size = max(1, decode_chunk_size)
+        # 사용자별 프로세스 내 락: 같은 프로세스의 동시 저장은 버전 충돌/재시도 대신 순서대로 대기
+        # (다른 서버와의 경쟁은 그대로 버전 체크 저장으로 처리)
+        self.user_lock = user_lock
+        self.saves = 0
+        self.version_conflicts = 0
+        # EVALSHA로 실행 (서버에 스크립트가 없으면 redis-py가 다시 로드)
+        self._save_script = redis_client.register_script(SAVE_WITH_VERSION_CHECK_SCRIPT)
     
     async def find_one(self, user_id: str) -> tuple[UserRepositoryResult | None, str | None]:
         """
@@ -32,7 +78,8 @@ class RedisUserRepository(UserRepository):
             user_id: 사용자 ID
             
         Returns:
-            UserRepositoryResult: data는 UserAggregates 또는 None, version은 현재 버전
+            tuple[UserRepositoryResult | None, str | None]: (결과, 에러)
+                저장된 적 없는 사용자는 version 0 (data는 테스트용 더미 사용자)
         """
         try:
             # Pipeline을 사용하여 원자적으로 데이터와 버전 조회
@@ -41,36 +88,65 @@ class RedisUserRepository(UserRepository):
             pipe.get(f"user:{user_id}:version")
             
             results = await pipe.execute()
-            data_json = results[0]
             version = int(results[1]) if results[1] else 0
-            
-            user_aggregates = None
-            if data_json:
-                # JSON 문자열을 파싱하여 UserAggregates 객체로 변환
-                data_dict = json.loads(data_json)
-                user_aggregates = UserAggregates.from_dict(data_dict)
-            else:
-                # 테스트용: 사용자가 없으면 더미 사용자 생성
-                user_aggregates = UserAggregates.create_new_user(user_id, f"TestUser_{user_id}")
-            
-            result = UserRepositoryResult(
-                data=user_aggregates,
-                version=version
-            )
-            return result, None
+            return self._to_result(user_id, results[0], version), None
             
         except Exception as e:
             # 로그 기록 (실제 운영에서는 proper logging 사용)
             print(f"Error in find_one for user {user_id}: {e}")
             return None, f"500: Database error: {str(e)}"
     
+    async def find_many(self, user_ids: List[str]) -> tuple[UserRepositoryManyResult | None, str | None]:
+        """
+        여러 사용자 데이터를 한 번에 조회
+        모든 사용자의 데이터와 버전을 파이프라인 1회(MULTI/EXEC)로 읽고,
+        역직렬화는 decode_chunk_size명마다 이벤트 루프에 양보하여 다른 요청이 오래 기다리지 않게 함
+        
+        Args:
+            user_ids: 사용자 ID 목록 (중복 없음)
+            
+        Returns:
+            tuple[UserRepositoryManyResult | None, str | None]: (사용자별 결과와 없는 사용자 ID, 에러)
+                find_one과 달리 저장되지 않은 사용자는 더미 데이터 없이 missing으로 반환
+        """
+        try:
+            pipe = self.redis.pipeline()
+            for user_id in user_ids:
+                pipe.hget(f"user:{user_id}:data", "data")
+                pipe.get(f"user:{user_id}:version")
+            results = await pipe.execute()
+            
+            many = UserRepositoryManyResult()
+            for index, user_id in enumerate(user_ids):
+                payload, version = results[2 * index], results[2 * index + 1]
+                if not payload:
+                    many.missing.append(user_id)
+                    continue
+                many.found[user_id] = self._to_result(user_id, payload, int(version) if version else 0)
+                if (index + 1) % self.decode_chunk_size == 0:
+                    await asyncio.sleep(0)
+            return many, None
+            
+        except Exception as e:
+            print(f"Error in find_many for {len(user_ids)} users: {e}")
+            return None, f"500: Database error: {str(e)}"
+    
+    def _to_result(self, user_id: str, payload: Optional[bytes], version: int) -> UserRepositoryResult:
+        """저장된 데이터와 버전을 조회 결과로 변환"""
+        if payload:
+            user_aggregates = self.codec.decode(payload)
+        else:
+            # 테스트용: 사용자가 없으면 더미 사용자 생성
+            user_aggregates = UserAggregates.create_new_user(user_id, f"TestUser_{user_id}")
+        return UserRepositoryResult(data=user_aggregates, version=version)
+    
     async def find_one_and_upsert(
         self,
         user_id: str,
         create_fn: Callable[[str], UserAggregates],
         update_fn: Callable[[UserAggregates, str], UserAggregates],
         options: Optional[UserRepositoryOptions] = None
-    ) -> UserRepositoryResult:
+    ) -> tuple[UserRepositoryResult | None, str | None]:
         """
         사용자 데이터 생성 또는 업데이트 (IoC 패턴)
         
@@ -78,273 +154,267 @@ class RedisUserRepository(UserRepository):
             user_id: 사용자 ID
             create_fn: 새 사용자 생성 함수: (user_id) -> UserAggregates
             update_fn: 기존 사용자 업데이트 함수: (current_aggregates, user_id) -> UserAggregates
-            options: 추가 옵션 (재시도 횟수 등)
+            options: 추가 옵션 (재시도 횟수, 마감 시각)
             
         Returns:
-            UserRepositoryResult: success, data, version 포함
+            tuple[UserRepositoryResult | None, str | None]: (결과, 에러)
         """
-        if options is None:
-            options = UserRepositoryOptions()
-        
-        max_retries = options.retries
+        def build(current: UserRepositoryResult) -> UserAggregates:
+            if current.version == 0:
+                # 새 사용자 - createFn 실행
+                return create_fn(user_id)
+            # 기존 사용자 - updateFn 실행
+            return update_fn(current.data, user_id)
         
-        for attempt in range(max_retries):
-            try:
-                # 현재 데이터 조회
-                current_data = await self.find_one(user_id)
-                expected_version = current_data.version
-                
-                if current_data.data:
-                    # 기존 사용자 - updateFn 실행
-                    new_aggregates = update_fn(current_data.data, user_id)
-                else:
-                    # 새 사용자 - createFn 실행
-                    new_aggregates = create_fn(user_id)
-                    expected_version = 0
-                
-                # 버전 체크와 함께 저장
-                result = await self._save_with_version_check(
-                    user_id, new_aggregates, expected_version
-                )
-                
-                if result.success:
-                    return UserRepositoryResult(
-                        success=True,
-                        data=new_aggregates,
-                        version=result.version,
-                        created=current_data.data is None
-                    )
-                
-            except Exception as e:
-                print(f"Error in find_one_and_upsert attempt {attempt + 1} for user {user_id}: {e}")
-                if attempt == max_retries - 1:
-                    return UserRepositoryResult(
-                        success=False,
-                        data=None,
-                        version=0
-                    )
-            
-            # 재시도 전 지수 백오프 대기
-            await self._delay(2 ** attempt * 50 + __import__('random').randint(0, 100))
-        
-        return UserRepositoryResult(
-            success=False,
-            data=None,
-            version=0
-        )
+        return await self._save_with_retries("find_one_and_upsert", user_id, build, options)
     
     async def find_one_and_update(
         self,
         user_id: str,
         update_fn: Callable[[UserAggregates, str], UserAggregates],
         options: Optional[UserRepositoryOptions] = None
-    ) -> UserRepositoryResult:
+    ) -> tuple[UserRepositoryResult | None, str | None]:
         """
         기존 사용자 데이터만 업데이트 (IoC 패턴)
         
         Args:
             user_id: 사용자 ID
             update_fn: 업데이트 함수: (current_aggregates, user_id) -> UserAggregates
-            options: 추가 옵션 (재시도 횟수 등)
+            options: 추가 옵션 (재시도 횟수, 마감 시각)
             
         Returns:
-            UserRepositoryResult: success, data, version 포함
-            
-        Raises:
-            ValueError: 사용자를 찾을 수 없는 경우
+            tuple[UserRepositoryResult | None, str | None]: (결과, 에러)
+                사용자를 찾을 수 없으면 "0x001001" 에러 (재시도하지 않음)
         """
-        if options is None:
-            options = UserRepositoryOptions()
-        
-        max_retries = options.retries
+        def build(current: UserRepositoryResult) -> Optional[UserAggregates]:
+            if current.version == 0:
+                return None
+            return update_fn(current.data, user_id)
         
-        for attempt in range(max_retries):
-            try:
-                # 현재 데이터 조회
-                current_data = await self.find_one(user_id)
-                
-                if not current_data.data:
-                    raise ValueError(f"FindOneAndUpdate: 사용자 {user_id}를 찾을 수 없습니다")
-                
-                # updateFn 실행
-                new_aggregates = update_fn(current_data.data, user_id)
-                
-                # 버전 체크와 함께 저장
-                result = await self._save_with_version_check(
-                    user_id, new_aggregates, current_data.version
-                )
-                
-                if result.success:
-                    return UserRepositoryResult(
-                        success=True,
-                        data=new_aggregates,
-                        version=result.version
-                    )
-                
-            except ValueError:
-                # 사용자를 찾을 수 없는 경우는 재시도하지 않음
-                raise
-            except Exception as e:
-                print(f"Error in find_one_and_update attempt {attempt + 1} for user {user_id}: {e}")
-                if attempt == max_retries - 1:
-                    return UserRepositoryResult(
-                        success=False,
-                        data=None,
-                        version=0
-                    )
-            
-            # 재시도 전 지수 백오프 대기
-            await self._delay(2 ** attempt * 50 + __import__('random').randint(0, 100))
-        
-        return UserRepositoryResult(
-            success=False,
-            data=None,
-            version=0
-        )
+        return await self._save_with_retries("find_one_and_update", user_id, build, options)
     
     async def upsert_one(
         self,
         user_id: str,
         aggregates: UserAggregates,
         options: Optional[UserRepositoryOptions] = None
-    ) -> UserRepositoryResult:
+    ) -> tuple[UserRepositoryResult | None, str | None]:
         """
         사용자 데이터 직접 생성/업데이트 (UserAggregates 객체 전달)
         
         Args:
             user_id: 사용자 ID
             aggregates: 저장할 데이터
-            options: 추가 옵션 (재시도 횟수 등)
+            options: 추가 옵션 (재시도 횟수, 마감 시각)
+            
+        Returns:
+            tuple[UserRepositoryResult | None, str | None]: (결과, 에러)
+        """
+        return await self._save_with_retries("upsert_one", user_id, lambda current: aggregates, options)
+    
+    async def upsert_many(
+        self,
+        entries: List[UserUpsert],
+        options: Optional[UserRepositoryBulkOptions] = None
+    ) -> tuple[List[UserUpsertResult] | None, str | None]:
+        """
+        여러 사용자 데이터를 버전 체크와 함께 대량 저장
+        chunk_size명씩 버전 체크 저장 스크립트를 파이프라인 1회로 보내므로, 사용자마다 조회/저장 왕복을 하지 않음
+        (expected_version이 없는 항목은 스크립트 안에서 현재 버전에 이어 저장하므로 조회와 충돌 재시도가 필요 없음)
+        
+        Args:
+            entries: 저장 항목 목록
+            options: 청크 크기, 진행 상황 콜백
             
         Returns:
-            UserRepositoryResult: success, version, created 포함
+            tuple[List[UserUpsertResult] | None, str | None]: (entries 순서의 사용자별 결과, 에러)
+                Redis 에러는 해당 청크 사용자의 결과에 기록하고 다음 청크를 계속 처리
         """
         if options is None:
-            options = UserRepositoryOptions()
+            options = UserRepositoryBulkOptions()
+        chunk_size = max(1, options.chunk_size)
         
-        max_retries = options.retries
+        results: List[UserUpsertResult] = []
+        for start in range(0, len(entries), chunk_size):
+            results.extend(await self._upsert_chunk(entries[start:start + chunk_size]))
+            if options.on_progress is not None:
+                options.on_progress(len(results), len(entries))
+        return results, None
+    
+    async def _upsert_chunk(self, chunk: List[UserUpsert]) -> List[UserUpsertResult]:
+        """청크 하나를 파이프라인 1회로 저장"""
+        last_modified = datetime.now().isoformat()
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for entry in chunk:
+                expected_version = "" if entry.expected_version is None else entry.expected_version
+                await self._save_script(
+                    keys=self._save_keys(entry.user_id),
+                    args=[expected_version, self.codec.encode(entry.data), last_modified, 0],
+                    client=pipe
+                )
+            replies = await pipe.execute(raise_on_error=False)
+        except Exception as e:
+            print(f"Error in upsert_many for {len(chunk)} users: {e}")
+            return [UserUpsertResult(entry.user_id, success=False, error=f"500: Database error: {str(e)}") for entry in chunk]
         
-        for attempt in range(max_retries):
+        results = []
+        for entry, reply in zip(chunk, replies):
+            if isinstance(reply, Exception):
+                results.append(UserUpsertResult(entry.user_id, success=False, error=f"500: Database error: {str(reply)}"))
+            elif int(reply[0]) == 1:
+                new_version = int(reply[1])
+                results.append(UserUpsertResult(entry.user_id, success=True, version=new_version, created=new_version == 1))
+            else:
+                results.append(UserUpsertResult(
+                    entry.user_id, success=False, version=int(reply[1]), error="409: Version conflict"
+                ))
+        return results
+    
+    async def _save_with_retries(
+        self,
+        operation: str,
+        user_id: str,
+        build_fn: Callable[[UserRepositoryResult], Optional[UserAggregates]],
+        options: Optional[UserRepositoryOptions]
+    ) -> tuple[UserRepositoryResult | None, str | None]:
+        """
+        조회 -> 변경 -> 버전 체크 저장을 버전 충돌 시 재시도
+        버전 충돌 응답에 현재 데이터가 포함되므로 재시도 시 다시 조회하지 않음
+        재시도 간 지수 백오프는 마감 시각까지 남은 시간 안에서만 수행
+        user_lock이 있으면 사용자 락을 잡은 동안 실행 (락 대기도 마감 시각까지만)
+        
+        Args:
+            operation: 로그용 작업명
+            user_id: 사용자 ID
+            build_fn: 현재 데이터로 저장할 데이터 생성 (None이면 사용자를 찾을 수 없음)
+            options: 추가 옵션 (재시도 횟수, 마감 시각)
+            
+        Returns:
+            tuple[UserRepositoryResult | None, str | None]: (결과, 에러)
+        """
+        if options is None:
+            options = UserRepositoryOptions()
+        if self.user_lock is None:
+            return await self._save_attempts(operation, user_id, build_fn, options)
+        
+        timeout = None if options.deadline is None else max(0.0, options.deadline - time.monotonic())
+        try:
+            async with self.user_lock.hold(user_id, timeout):
+                return await self._save_attempts(operation, user_id, build_fn, options)
+        except asyncio.TimeoutError:
+            return None, f"504: Deadline exceeded waiting for user {user_id} lock"
+    
+    async def _save_attempts(
+        self,
+        operation: str,
+        user_id: str,
+        build_fn: Callable[[UserRepositoryResult], Optional[UserAggregates]],
+        options: UserRepositoryOptions
+    ) -> tuple[UserRepositoryResult | None, str | None]:
+        """_save_with_retries의 재시도 루프"""
+        error = "409: Version conflict"
+        current: Optional[UserRepositoryResult] = None
+        for attempt in range(options.retries):
+            if attempt > 0:
+                # 재시도 전 지수 백오프 대기 (마감 전에 끝나지 않으면 포기)
+                if not await self._delay(2 ** (attempt - 1) * 50 + random.randint(0, 100), options.deadline):
+                    return None, f"504: Deadline exceeded after {attempt} attempts ({error})"
+            
+            if current is None:
+                # 현재 데이터 조회 (첫 시도 또는 Redis 에러 후)
+                current, error = await self.find_one(user_id)
+                if error:
+                    continue
+            
+            new_aggregates = build_fn(current)
+            if new_aggregates is None:
+                return None, f"0x001001: User {user_id} not found"
+            
             try:
-                # 현재 데이터 조회하여 기존 사용자인지 확인
-                current_data = await self.find_one(user_id)
-                is_new_user = current_data.data is None
-                expected_version = 0 if is_new_user else current_data.version
-                
                 # 버전 체크와 함께 저장
-                result = await self._save_with_version_check(
-                    user_id, aggregates, expected_version
-                )
-                
-                if result.success:
-                    return UserRepositoryResult(
-                        success=True,
-                        data=aggregates,
-                        version=result.version,
-                        created=is_new_user
-                    )
-                
+                self.saves += 1
+                new_version, latest = await self._save_with_version_check(user_id, new_aggregates, current.version)
             except Exception as e:
-                print(f"Error in upsert_one attempt {attempt + 1} for user {user_id}: {e}")
-                if attempt == max_retries - 1:
-                    return UserRepositoryResult(
-                        success=False,
-                        data=None,
-                        version=0
-                    )
+                print(f"Error in {operation} attempt {attempt + 1} for user {user_id}: {e}")
+                error = f"500: Database error: {str(e)}"
+                current = None
+                continue
             
-            # 재시도 전 지수 백오프 대기
-            await self._delay(2 ** attempt * 50 + __import__('random').randint(0, 100))
+            if new_version is not None:
+                return UserRepositoryResult(
+                    data=new_aggregates,
+                    version=new_version,
+                    created=current.version == 0
+                ), None
+            # 버전 충돌: 스크립트가 반환한 최신 데이터로 다시 변경
+            self.version_conflicts += 1
+            current = latest
+            error = "409: Version conflict"
         
-        return UserRepositoryResult(
-            success=False,
-            data=None,
-            version=0
-        )
+        return None, error
     
     async def _save_with_version_check(
         self, 
         user_id: str, 
         aggregates: UserAggregates, 
         expected_version: int
-    ) -> UserRepositoryResult:
+    ) -> tuple[Optional[int], Optional[UserRepositoryResult]]:
         """
         버전 체크와 함께 데이터 저장 (낙관적 동시성 제어)
+        Lua 스크립트 1회 호출(EVALSHA)로 버전 확인과 데이터/버전/메타데이터 저장을 원자적으로 수행
         
         Args:
             user_id: 사용자 ID
             aggregates: 저장할 데이터
-            expected_version: 예상 버전
+            expected_version: 예상 버전 (새 사용자는 0)
             
         Returns:
-            UserRepositoryResult: success와 새 버전 포함
+            tuple[Optional[int], Optional[UserRepositoryResult]]:
+                저장 성공 시 (새 버전, None), 버전 충돌 시 (None, 현재 저장된 데이터와 버전)
+                (재시도는 호출자가 결정)
+            
+        Raises:
+            redis.RedisError: Redis 에러
         """
-        try:
-            # WATCH를 사용한 낙관적 동시성 제어
-            async with self.redis.pipeline(transaction=True) as pipe:
-                while True:
-                    try:
-                        # 버전 키를 WATCH
-                        await pipe.watch(f"user:{user_id}:version")
-                        
-                        # 현재 버전 확인
-                        current_version = await self.redis.get(f"user:{user_id}:version")
-                        current_version = int(current_version) if current_version else 0
-                        
-                        # 버전이 예상과 다르면 충돌 발생
-                        if current_version != expected_version:
-                            await pipe.unwatch()
-                            return UserRepositoryResult(
-                                success=False,
-                                data=None,
-                                version=current_version
-                            )
-                        
-                        # 새 버전 계산
-                        new_version = expected_version + 1
-                        
-                        # 트랜잭션 시작
-                        pipe.multi()
-                        
-                        # UserAggregates를 JSON으로 직렬화
-                        serialized_data = json.dumps(aggregates.to_dict())
-                        
-                        # 데이터와 버전, 메타데이터를 원자적으로 업데이트
-                        pipe.hset(f"user:{user_id}:data", "data", serialized_data)
-                        pipe.set(f"user:{user_id}:version", new_version)
-                        pipe.hset(
-                            f"user:{user_id}:metadata", 
-                            "lastModified", 
-                            datetime.now().isoformat()
-                        )
-                        
-                        # 트랜잭션 실행
-                        results = await pipe.execute()
-                        
-                        # 성공적으로 실행되면 결과 반환
-                        return UserRepositoryResult(
-                            success=True,
-                            data=aggregates,
-                            version=new_version
-                        )
-                        
-                    except redis.WatchError:
-                        # WATCH된 키가 변경되면 재시도
-                        continue
-                        
-        except Exception as e:
-            print(f"Error in _save_with_version_check for user {user_id}: {e}")
-            return UserRepositoryResult(
-                success=False,
-                data=None,
-                version=expected_version
-            )
+        result = await self._save_script(
+            keys=self._save_keys(user_id),
+            args=[expected_version, self.codec.encode(aggregates), datetime.now().isoformat()]
+        )
+        if int(result[0]) == 1:
+            return int(result[1]), None
+        
+        payload = result[2] if len(result) > 2 else None
+        return None, self._to_result(user_id, payload, int(result[1]))
+    
+    def stats(self) -> Dict[str, Any]:
+        """버전 체크 저장 통계 (메트릭 수집기, 사용자 락을 사용하면 락 대기 시간 분포 포함)"""
+        stats = {
+            "saves": self.saves,
+            "version_conflicts": self.version_conflicts
+        }
+        if self.user_lock is not None:
+            stats["lock_wait_histogram"] = self.user_lock.wait_histogram()
+        return stats
+    
+    @staticmethod
+    def _save_keys(user_id: str) -> List[str]:
+        """버전 체크 저장 스크립트의 KEYS"""
+        return [f"user:{user_id}:data", f"user:{user_id}:version", f"user:{user_id}:metadata"]
     
-    async def _delay(self, milliseconds: int):
+    async def _delay(self, milliseconds: int, deadline: Optional[float] = None) -> bool:
         """
         비동기 지연 함수
+        마감 시각 전에 지연이 끝나지 않으면 기다리지 않음 (응답을 받을 클라이언트가 없는 재시도 방지)
         
         Args:
             milliseconds: 지연할 밀리초 수
+            deadline: 마감 시각 (time.monotonic() 기준, None이면 제한 없음)
+            
+        Returns:
+            bool: 지연 후 재시도해도 되면 True, 마감 시각을 넘기면 False
         """
-        await asyncio.sleep(milliseconds / 1000)
\ No newline at end of file
+        if deadline is not None and time.monotonic() + milliseconds / 1000 >= deadline:
+            return False
+        await asyncio.sleep(milliseconds / 1000)
+        return True
@@ -0,0 +1,188 @@
+"""
+user:{id}:data 저장 데이터 코덱
+UserAggregates를 Redis 해시 필드에 저장할 bytes로 인코딩/디코딩
+
+첫 바이트로 형식을 구분하므로 읽기는 설정과 관계없이 모든 형식을 처리하고,
+쓰기는 설정된 형식을 사용 (기존 데이터는 다음 저장 시 설정된 형식으로 옮겨짐)
+- json: 헤더 없는 JSON 텍스트 (첫 바이트 '{', 기존 저장 데이터와 동일)
+- json_zlib: 0x01 + zlib으로 압축한 JSON
+- msgpack: 0x02 + 필드 이름 없이 위치로 구분하는 MessagePack 배열
+
+msgpack 배열 구조 (필드를 추가할 때는 배열 끝에만 추가):
+- [profile, inventory]
+- profile: [nickname, level, exp, avatar, created_at(ISO 8601)]
+- inventory: [items, gold, gems, capacity]
+- item: [id, quantity, level, rarity, properties] (끝의 None 값은 생략, rarity는 _RARITY_CODES 번호)
+"""
+
+import json
+import zlib
+from datetime import datetime
+from typing import Any, Dict, List
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+from ..aggregates import UserAggregates, ProfileEntity, InventoryEntity, Item, Rarity
+
+FORMAT_JSON = "json"
+FORMAT_JSON_ZLIB = "json_zlib"
+FORMAT_MSGPACK = "msgpack"
+
+_HEADER_JSON_ZLIB = 0x01
+_HEADER_MSGPACK = 0x02
+_HEADER_FORMATS = {ord("{"): FORMAT_JSON, _HEADER_JSON_ZLIB: FORMAT_JSON_ZLIB, _HEADER_MSGPACK: FORMAT_MSGPACK}
+
+# 저장된 번호이므로 순서를 바꾸지 말고 끝에만 추가
+_RARITY_CODES = (Rarity.COMMON, Rarity.UNCOMMON, Rarity.RARE, Rarity.EPIC, Rarity.LEGENDARY)
+_RARITY_INDEX = {rarity: index for index, rarity in enumerate(_RARITY_CODES)}
+
+
+class UserDataCodec:
+    """형식 헤더로 구분하는 UserAggregates 저장 코덱"""
+
+    def __init__(self, write_format: str = FORMAT_JSON, zlib_level: int = 6):
+        """
+        Args:
+            write_format: 저장 형식 (json, json_zlib, msgpack)
+            zlib_level: json_zlib 압축 레벨 (1~9)
+
+        Raises:
+            ValueError: 알 수 없는 형식이거나 msgpack 패키지가 없음
+        """
+        if write_format not in (FORMAT_JSON, FORMAT_JSON_ZLIB, FORMAT_MSGPACK):
+            raise ValueError(f"Unknown user data format: {write_format}")
+        if write_format == FORMAT_MSGPACK and not MSGPACK_AVAILABLE:
+            raise ValueError("msgpack user data format requires the msgpack package")
+        self.write_format = write_format
+        self.zlib_level = zlib_level
+        self.reads: Dict[str, int] = {}
+        self.writes = 0
+        self.bytes_written = 0
+
+    def encode(self, aggregates: UserAggregates) -> bytes:
+        """
+        설정된 형식으로 인코딩
+
+        Args:
+            aggregates: 저장할 데이터
+
+        Returns:
+            bytes: 형식 헤더를 포함한 저장 데이터
+        """
+        if self.write_format == FORMAT_MSGPACK:
+            payload = bytes([_HEADER_MSGPACK]) + msgpack.packb(_to_compact(aggregates), use_bin_type=True)
+        elif self.write_format == FORMAT_JSON_ZLIB:
+            text = json.dumps(aggregates.to_dict(), separators=(",", ":"), ensure_ascii=False)
+            payload = bytes([_HEADER_JSON_ZLIB]) + zlib.compress(text.encode("utf-8"), self.zlib_level)
+        else:
+            payload = json.dumps(aggregates.to_dict()).encode("utf-8")
+        self.writes += 1
+        self.bytes_written += len(payload)
+        return payload
+
+    def decode(self, payload: bytes | str) -> UserAggregates:
+        """
+        저장 데이터 디코딩 (형식 헤더로 형식 판단)
+
+        Args:
+            payload: 저장 데이터 (decode_responses 클라이언트로 읽은 JSON 문자열도 허용)
+
+        Returns:
+            UserAggregates: 사용자 전체 데이터
+
+        Raises:
+            ValueError: 알 수 없는 형식 헤더
+        """
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        data_format = self.format_of(payload)
+        self.reads[data_format] = self.reads.get(data_format, 0) + 1
+        if data_format == FORMAT_MSGPACK:
+            if not MSGPACK_AVAILABLE:
+                raise ValueError("msgpack user data found but the msgpack package is not installed")
+            return _from_compact(msgpack.unpackb(payload[1:], raw=False))
+        if data_format == FORMAT_JSON_ZLIB:
+            return UserAggregates.from_dict(json.loads(zlib.decompress(payload[1:])))
+        return UserAggregates.from_dict(json.loads(payload))
+
+    @staticmethod
+    def format_of(payload: bytes) -> str:
+        """
+        저장 데이터의 형식
+
+        Raises:
+            ValueError: 알 수 없는 형식 헤더
+        """
+        data_format = _HEADER_FORMATS.get(payload[0]) if payload else None
+        if data_format is None:
+            raise ValueError(f"Unknown user data header: {payload[:1]!r}")
+        return data_format
+
+    def stats(self) -> Dict[str, Any]:
+        """형식별 읽기 수와 쓰기 통계 (메트릭 수집기, 읽기 형식 분포로 이전 진행 상황 확인)"""
+        return {
+            "write_format": self.write_format,
+            "reads": dict(self.reads),
+            "writes": self.writes,
+            "avg_write_bytes": round(self.bytes_written / self.writes, 1) if self.writes else 0.0
+        }
+
+
+def _to_compact(aggregates: UserAggregates) -> List[Any]:
+    """UserAggregates -> msgpack 배열"""
+    profile = aggregates.profile
+    inventory = aggregates.inventory
+    items = []
+    for item in inventory.items:
+        fields = [
+            item.id,
+            item.quantity,
+            item.level,
+            None if item.rarity is None else _RARITY_INDEX[item.rarity],
+            item.properties
+        ]
+        while fields[-1] is None:
+            fields.pop()
+        items.append(fields)
+    return [
+        [profile.nickname, profile.level, profile.exp, profile.avatar, profile.created_at.isoformat()],
+        [items, inventory.gold, inventory.gems, inventory.capacity]
+    ]
+
+
+def _from_compact(data: List[Any]) -> UserAggregates:
+    """msgpack 배열 -> UserAggregates"""
+    (nickname, level, exp, avatar, created_at), (items, gold, gems, capacity) = data[0][:5], data[1][:4]
+    return UserAggregates(
+        profile=ProfileEntity(
+            nickname=nickname,
+            level=level,
+            exp=exp,
+            avatar=avatar,
+            created_at=datetime.fromisoformat(created_at)
+        ),
+        inventory=InventoryEntity(
+            items=[_item_from_compact(fields) for fields in items],
+            gold=gold,
+            gems=gems,
+            capacity=capacity
+        )
+    )
+
+
+def _item_from_compact(fields: List[Any]) -> Item:
+    """msgpack 아이템 배열 -> Item (생략된 끝 필드는 None)"""
+    fields = fields + [None] * (5 - len(fields))
+    item_id, quantity, level, rarity, properties = fields[:5]
+    return Item(
+        id=item_id,
+        quantity=quantity,
+        level=level,
+        properties=properties,
+        rarity=None if rarity is None else _RARITY_CODES[rarity]
+    )
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Callable
-from dataclasses import dataclass
+from typing import Optional, Callable, Dict, List
+from dataclasses import dataclass, field
 
 from ..aggregates import UserAggregates
 
@@ -13,10 +13,43 @@ class UserRepositoryResult:
     created: Optional[bool] = None
 
 
+@dataclass
+class UserRepositoryManyResult:
+    """여러 사용자 조회 결과"""
+    found: Dict[str, UserRepositoryResult] = field(default_factory=dict)  # 요청 순서 유지
+    missing: List[str] = field(default_factory=list)  # 저장된 데이터가 없는 사용자 ID
+
+
 @dataclass
 class UserRepositoryOptions:
     """Repository 작업 옵션"""
     retries: int = 3
+    deadline: Optional[float] = None  # 마감 시각 (time.monotonic() 기준): 남은 시간 안에서만 재시도/대기
+
+
+@dataclass
+class UserUpsert:
+    """upsert_many 저장 항목"""
+    user_id: str
+    data: UserAggregates
+    expected_version: Optional[int] = None  # 지정하면 저장된 버전이 같을 때만 저장, None이면 버전과 관계없이 저장
+
+
+@dataclass
+class UserUpsertResult:
+    """upsert_many 사용자별 결과"""
+    user_id: str
+    success: bool
+    version: int = 0  # 성공 시 새 버전, 버전 충돌 시 현재 저장된 버전
+    created: bool = False
+    error: Optional[str] = None  # 실패 사유 ("409: Version conflict", "500: Database error: ...")
+
+
+@dataclass
+class UserRepositoryBulkOptions:
+    """대량 작업 옵션"""
+    chunk_size: int = 500  # 파이프라인 1회로 보내는 사용자 수
+    on_progress: Optional[Callable[[int, int], None]] = None  # 청크 완료마다 (완료 수, 전체 수)로 호출
 
 
 class UserRepository(ABC):
@@ -38,6 +71,19 @@ class UserRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_many(self, user_ids: List[str]) -> tuple[UserRepositoryManyResult | None, str | None]:
+        """
+        여러 사용자 데이터를 한 번에 조회
+        
+        Args:
+            user_ids: 사용자 ID 목록 (중복 없음)
+            
+        Returns:
+            tuple[UserRepositoryManyResult | None, str | None]: (사용자별 결과와 없는 사용자 ID, 에러)
+        """
+        pass
+
     @abstractmethod
     async def find_one_and_upsert(
         self,
@@ -98,4 +144,22 @@ class UserRepository(ABC):
         Returns:
             tuple[UserRepositoryResult | None, str | None]: (결과, 에러)
         """
+        pass
+
+    @abstractmethod
+    async def upsert_many(
+        self,
+        entries: List[UserUpsert],
+        options: Optional[UserRepositoryBulkOptions] = None
+    ) -> tuple[List[UserUpsertResult] | None, str | None]:
+        """
+        여러 사용자 데이터를 버전 체크와 함께 대량 저장 (관리 도구, 마이그레이션, 보상 지급 등)
+        
+        Args:
+            entries: 저장 항목 목록
+            options: 청크 크기, 진행 상황 콜백
+            
+        Returns:
+            tuple[List[UserUpsertResult] | None, str | None]: (entries 순서의 사용자별 결과, 에러)
+        """
         pass
\ No newline at end of file
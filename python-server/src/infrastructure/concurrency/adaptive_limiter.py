@@ -0,0 +1,84 @@
+"""
+적응형 동시 실행 한도 (AIMD)
+관측된 처리 시간으로 동시 처리 한도를 조절하여, 하위 시스템(Redis 등)이 느려지면 대기열을 늘리지 않고 초과 요청을 즉시 거절
+
+- 증가(additive increase): 처리 시간이 임계값 이하이고 한도의 절반 이상을 사용 중이면 한도 +1
+- 감소(multiplicative decrease): 처리 시간이 임계값을 넘으면 한도 x backoff_ratio
+  (한 번 줄인 뒤에는 줄이기 전에 시작된 요청의 느린 결과로 다시 줄이지 않음)
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD 기반 동시 처리 한도 (이벤트 루프 단일 스레드에서 사용)"""
+
+    def __init__(
+        self,
+        initial_limit: int = 100,
+        min_limit: int = 10,
+        max_limit: int = 1000,
+        latency_threshold_ms: int = 500,
+        backoff_ratio: float = 0.9
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_threshold = latency_threshold_ms / 1000
+        self.backoff_ratio = backoff_ratio
+
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self.rejected = 0
+
+    @property
+    def limit(self) -> int:
+        """현재 동시 처리 한도"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """처리 중인 요청 수"""
+        return self._in_flight
+
+    def try_acquire(self) -> Optional[float]:
+        """
+        처리 슬롯 획득 (대기하지 않음)
+
+        Returns:
+            Optional[float]: 시작 시각 (release에 전달), 한도 초과면 None
+        """
+        if self._in_flight >= self.limit:
+            self.rejected += 1
+            return None
+        self._in_flight += 1
+        return time.monotonic()
+
+    def release(self, started: float):
+        """
+        처리 완료: 처리 시간으로 한도 조절
+
+        Args:
+            started: try_acquire가 반환한 시작 시각
+        """
+        self._in_flight -= 1
+        now = time.monotonic()
+
+        if now - started > self.latency_threshold:
+            if started > self._last_decrease:
+                self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+                self._last_decrease = now
+        elif (self._in_flight + 1) * 2 >= self._limit:
+            # 한도를 충분히 사용하고 있을 때만 증가 (유휴 상태에서 한도가 무한히 커지지 않도록)
+            self._limit = min(self.max_limit, self._limit + 1)
+
+    def stats(self) -> Dict[str, Any]:
+        """현재 한도와 사용량 (메트릭 수집기)"""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "rejected": self.rejected
+        }
@@ -0,0 +1,64 @@
+"""
+요청 데드라인 전파
+클라이언트(또는 프록시)가 응답을 기다리는 마감 시각을 요청 처리 흐름 전체에 전달
+
+마감 시각은 time.monotonic() 기준 초 단위 값
+핸들러 실행 중에는 contextvar로 전달되어 서비스/Repository가 남은 시간 안에서만 재시도
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_current_deadline: ContextVar[Optional[float]] = ContextVar("rpc_deadline", default=None)
+
+
+def deadline_after_ms(budget_ms: float) -> float:
+    """지금부터 budget_ms 뒤의 마감 시각"""
+    return time.monotonic() + budget_ms / 1000
+
+
+def deadline_from_wall_clock(epoch_seconds: float) -> float:
+    """Unix 시각(초)으로 표현된 마감 시각을 monotonic 기준으로 변환"""
+    return time.monotonic() + (epoch_seconds - time.time())
+
+
+def remaining_ms(deadline: Optional[float]) -> Optional[float]:
+    """
+    마감까지 남은 시간
+
+    Args:
+        deadline: 마감 시각 (None이면 데드라인 없음)
+
+    Returns:
+        Optional[float]: 남은 밀리초 (지났으면 0 이하, 데드라인이 없으면 None)
+    """
+    if deadline is None:
+        return None
+    return (deadline - time.monotonic()) * 1000
+
+
+def is_expired(deadline: Optional[float]) -> bool:
+    """마감 시각이 지났는지 여부 (데드라인이 없으면 False)"""
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def current_deadline() -> Optional[float]:
+    """현재 요청의 마감 시각 (요청 밖에서 호출하면 None)"""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[float]) -> Iterator[None]:
+    """
+    블록 안에서 시작한 작업(생성된 Task 포함)에 마감 시각 전달
+
+    Args:
+        deadline: 마감 시각 (None이면 데드라인 없음)
+    """
+    token = _current_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _current_deadline.reset(token)
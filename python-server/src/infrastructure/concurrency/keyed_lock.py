@@ -0,0 +1,87 @@
+"""
+키별 비동기 락
+같은 키(예: user_id)에 대한 작업을 프로세스 안에서 순서대로 실행 (다른 키는 서로 기다리지 않음)
+
+락은 WeakValueDictionary로 관리하여 보유하거나 기다리는 코루틴이 있는 키의 락만 메모리에 남음
+고정 개수의 락을 해시로 나눠 쓰는 스트라이핑 대신 키마다 락을 두어, 서로 다른 사용자가 같은 스트라이프를 공유해 기다리는 일이 없음
+(이벤트 루프 단일 스레드에서 사용하므로 락 테이블 자체도 스트라이핑할 필요가 없음)
+"""
+
+import asyncio
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Hashable, Optional
+
+from src.infrastructure.metrics.metrics import Histogram, Metrics
+
+
+class KeyedLock:
+    """키별 asyncio.Lock"""
+
+    def __init__(self, metrics: Optional[Metrics] = None, name: str = "keyed_lock"):
+        self.metrics = metrics or Metrics()
+        self.name = name
+        self._locks: "weakref.WeakValueDictionary[Hashable, asyncio.Lock]" = weakref.WeakValueDictionary()
+        self.acquired = 0
+        self.contended = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._wait_histogram = Histogram()
+        self.metrics.register_collector(name, self.stats)
+
+    @asynccontextmanager
+    async def hold(self, key: Hashable, timeout: Optional[float] = None) -> AsyncIterator[None]:
+        """
+        키의 락을 잡고 실행 (같은 키를 잡은 코루틴이 있으면 도착 순서대로 대기)
+
+        Args:
+            key: 락 키
+            timeout: 최대 대기 시간 (초, None이면 제한 없음)
+
+        Raises:
+            asyncio.TimeoutError: timeout 안에 락을 잡지 못함
+        """
+        # 지역 변수로 강한 참조를 유지하는 동안만 락이 테이블에 남음
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[key] = lock
+
+        self.acquired += 1
+        if lock.locked():
+            self.contended += 1
+            started = time.monotonic()
+            try:
+                await asyncio.wait_for(lock.acquire(), timeout)
+            finally:
+                # 시간 초과로 포기한 대기도 대기 시간에 포함
+                self._record_wait(time.monotonic() - started)
+        else:
+            await lock.acquire()
+
+        try:
+            yield
+        finally:
+            lock.release()
+
+    def _record_wait(self, waited: float):
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+        self._wait_histogram.observe(waited)
+        self.metrics.observe(f"{self.name}_wait", waited)
+
+    def wait_histogram(self) -> Dict[str, int]:
+        """대기한 획득의 대기 시간 분포 (대기 없이 잡은 획득은 제외)"""
+        return self._wait_histogram.to_dict()
+
+    def stats(self) -> Dict[str, Any]:
+        """락 대기 통계 (메트릭 수집기)"""
+        return {
+            "acquired": self.acquired,
+            "contended": self.contended,
+            "avg_wait_ms": round(self._wait_total / self.contended * 1000, 3) if self.contended else 0.0,
+            "max_wait_ms": round(self._wait_max * 1000, 3),
+            "wait_histogram": self.wait_histogram(),
+            "active_keys": len(self._locks)
+        }
@@ -0,0 +1,79 @@
+"""
+Singleflight 요청 병합
+같은 키에 대해 동시에 들어온 호출은 하나의 실행 결과(future)를 공유
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Flight:
+    """진행 중인 실행과 대기 중인 호출자 수"""
+    task: asyncio.Future
+    waiters: int = 0
+
+
+class SingleFlight:
+    """
+    동일 키 동시 호출 병합기
+    결과 객체는 모든 호출자가 공유하므로 읽기 전용 작업에만 사용
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        키 단위로 병합하여 실행
+
+        Args:
+            key: 병합 기준 키 (예: user_id)
+            fn: 실제 실행할 비동기 함수 (진행 중인 실행이 없을 때만 호출)
+
+        Returns:
+            T: fn의 결과 (진행 중인 실행이 있으면 그 결과를 공유)
+        """
+        self.calls += 1
+
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(task=asyncio.ensure_future(fn()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            # 한 호출자가 취소되어도 공유 실행은 다른 호출자를 위해 계속 진행
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                # 마지막 호출자까지 취소되면 실행도 취소
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: Hashable, flight: _Flight):
+        """완료된 실행 제거 (완료 후 들어온 호출은 새로 실행)"""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # 모든 호출자가 취소된 뒤 실패한 경우에도 "exception never retrieved" 경고가 나지 않도록 조회
+        if not flight.task.cancelled():
+            flight.task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """병합 통계 (메트릭 수집기)"""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "hit_rate": round(self.coalesced / self.calls, 4) if self.calls else 0.0,
+            "in_flight": len(self._flights)
+        }
@@ -0,0 +1,183 @@
+"""
+Redis 기반 멱등성 키 저장소
+같은 멱등성 키로 들어온 변경 요청은 한 번만 실행하고, 이후 요청에는 저장된 첫 응답을 재전송
+
+키 상태 (idempotency:{key}, 클라이언트 ID가 있으면 idempotency:{길이}:{클라이언트 ID}:{key}):
+- pending: 첫 요청이 실행 중 (SET NX PX로 선점, 실행이 중단되면 만료되어 다음 요청이 다시 선점)
+- completed: 첫 요청의 응답 저장 (TTL 동안 재전송)
+
+pending 값에는 선점마다 고유한 토큰이 들어가며, complete/release는 저장된 값이 자신의 pending 값일 때만
+덮어쓰거나 삭제 (실행이 선점 유지 시간을 넘겨 다른 요청이 다시 선점한 키를 건드리지 않음)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "idempotency:"
+
+_PENDING = "pending"
+_COMPLETED = "completed"
+
+# 선점한 pending 값이 그대로일 때만 완료 응답으로 교체
+# KEYS[1]: 멱등성 키, ARGV[1]: 선점 시 저장한 pending 값, ARGV[2]: completed 값, ARGV[3]: TTL(초)
+COMPARE_AND_SET_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
+
+# 선점한 pending 값이 그대로일 때만 삭제
+# KEYS[1]: 멱등성 키, ARGV[1]: 선점 시 저장한 pending 값
+COMPARE_AND_DELETE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+@dataclass
+class IdempotencyClaim:
+    """
+    멱등성 키 선점 결과
+    owner가 True이면 호출자가 실행하고 token으로 complete()/release()를 호출해야 함
+    """
+    owner: bool
+    response: Optional[Dict[str, Any]] = None  # 저장된 응답 (재전송용)
+    conflict: bool = False  # 같은 키가 다른 요청(메서드/파라미터)에 사용됨
+    token: Optional[str] = None  # 선점 토큰 (owner일 때만, complete/release에 전달)
+
+
+def request_fingerprint(method: str, params: Any) -> str:
+    """메서드와 파라미터로 요청 지문 생성 (같은 키를 다른 요청에 재사용하는지 확인)"""
+    canonical = json.dumps([method, params], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RedisIdempotencyStore:
+    """멱등성 키 저장소 (응답은 TTL 동안 보관)"""
+
+    def __init__(self, redis_client: redis.Redis, ttl_seconds: int = 86400, poll_interval_ms: int = 50):
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.poll_interval_ms = poll_interval_ms
+        # 같은 프로세스에서 실행 중인 키: 대기자는 Redis를 폴링하지 않고 완료를 바로 통지받음 (선점 토큰, 완료 통지)
+        self._local: Dict[str, tuple[str, asyncio.Future]] = {}
+        self._compare_and_set = redis_client.register_script(COMPARE_AND_SET_SCRIPT)
+        self._compare_and_delete = redis_client.register_script(COMPARE_AND_DELETE_SCRIPT)
+
+    @staticmethod
+    def scoped_key(key: str, client_id: Optional[str] = None) -> str:
+        """
+        클라이언트별로 구분한 멱등성 키 (다른 클라이언트가 같은 키를 골라도 충돌하지 않음)
+
+        Args:
+            key: 클라이언트가 보낸 멱등성 키
+            client_id: 클라이언트 ID (RpcContext.client_id, 없으면 키를 그대로 사용)
+
+        Returns:
+            str: 저장소 키 (클라이언트 ID는 길이를 앞에 붙여 키와 경계가 섞이지 않게 함)
+        """
+        if client_id is None:
+            return key
+        return f"{len(client_id)}:{client_id}:{key}"
+
+    async def claim(self, key: str, fingerprint: str, lock_ttl_ms: int) -> IdempotencyClaim:
+        """
+        멱등성 키 선점
+        다른 요청이 같은 키로 실행 중이면 완료될 때까지(또는 선점이 만료될 때까지) 대기
+
+        Args:
+            key: 멱등성 키 (scoped_key)
+            fingerprint: 요청 지문 (request_fingerprint)
+            lock_ttl_ms: 선점 유지 시간 (실행 타임아웃보다 길게)
+
+        Returns:
+            IdempotencyClaim: 선점 결과
+        """
+        redis_key = KEY_PREFIX + key
+        pending = json.dumps({"state": _PENDING, "fingerprint": fingerprint, "token": uuid.uuid4().hex})
+
+        while True:
+            if await self.redis.set(redis_key, pending, nx=True, px=lock_ttl_ms):
+                self._local[key] = (pending, asyncio.get_running_loop().create_future())
+                return IdempotencyClaim(owner=True, token=pending)
+
+            stored = await self.redis.get(redis_key)
+            if stored is None:
+                # 조회 사이에 만료/해제됨: 다시 선점 시도
+                continue
+
+            entry = json.loads(stored)
+            if entry.get("fingerprint") != fingerprint:
+                return IdempotencyClaim(owner=False, conflict=True)
+            if entry.get("state") == _COMPLETED:
+                return IdempotencyClaim(owner=False, response=entry.get("response"))
+
+            await self._wait_for_owner(key)
+
+    async def complete(self, key: str, fingerprint: str, response: Dict[str, Any], token: str) -> bool:
+        """
+        실행 결과 저장 (TTL 동안 재전송)
+
+        Args:
+            key: 멱등성 키 (scoped_key)
+            fingerprint: 요청 지문
+            response: 요청 id를 제외한 응답 ({"result": ...} 또는 {"error": ...})
+            token: claim이 반환한 선점 토큰
+
+        Returns:
+            bool: 저장 여부 (선점이 만료되어 다른 요청이 키를 가져갔으면 False)
+        """
+        entry = json.dumps({"state": _COMPLETED, "fingerprint": fingerprint, "response": response}, default=str)
+        try:
+            stored = await self._compare_and_set(keys=[KEY_PREFIX + key], args=[token, entry, self.ttl_seconds])
+        finally:
+            self._notify(key, token)
+        if not stored:
+            logger.warning(f"Idempotency claim expired before completion; response not stored: {key}")
+        return bool(stored)
+
+    async def release(self, key: str, token: str) -> bool:
+        """
+        선점 해제 (결과를 저장하지 않음: 같은 키로 다시 실행 가능)
+
+        Args:
+            key: 멱등성 키 (scoped_key)
+            token: claim이 반환한 선점 토큰
+
+        Returns:
+            bool: 해제 여부 (선점이 만료되어 다른 요청이 키를 가져갔으면 False)
+        """
+        try:
+            return bool(await self._compare_and_delete(keys=[KEY_PREFIX + key], args=[token]))
+        finally:
+            self._notify(key, token)
+
+    async def _wait_for_owner(self, key: str):
+        """선점한 요청의 완료 대기 (같은 프로세스면 통지, 아니면 폴링 간격만큼 대기)"""
+        local = self._local.get(key)
+        if local is not None:
+            await asyncio.shield(local[1])
+        else:
+            await asyncio.sleep(self.poll_interval_ms / 1000)
+
+    def _notify(self, key: str, token: str):
+        """대기자에게 완료 통지 (같은 키를 나중에 다시 선점한 요청의 대기자는 건드리지 않음)"""
+        local = self._local.get(key)
+        if local is None or local[0] != token:
+            return
+        del self._local[key]
+        if not local[1].done():
+            local[1].set_result(None)
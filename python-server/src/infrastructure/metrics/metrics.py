@@ -0,0 +1,116 @@
+"""
+서버 내부 메트릭 수집
+카운터/게이지/소요시간을 프로세스 메모리에 집계하고 /metrics 엔드포인트로 노출
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+
+# 대기 시간 히스토그램 기본 구간 상한 (밀리초)
+DEFAULT_HISTOGRAM_BOUNDS_MS: Tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+def metric_name(name: str, **labels: Any) -> str:
+    """
+    라벨을 포함한 메트릭 이름 생성
+
+    Args:
+        name: 메트릭 이름 (예: rpc_timeouts_total)
+        labels: 라벨 (예: method="getUserAggregates")
+
+    Returns:
+        str: 'rpc_timeouts_total{method="getUserAggregates"}' 형태의 이름
+    """
+    if not labels:
+        return name
+    label_str = ",".join(f'{key}="{value}"' for key, value in sorted(labels.items()))
+    return f"{name}{{{label_str}}}"
+
+
+@dataclass
+class TimingStats:
+    """소요시간 집계 (초 단위)"""
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def observe(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 3)
+        }
+
+
+@dataclass
+class Histogram:
+    """소요시간 분포 (구간별 개수, 평균/최대만으로 보이지 않는 꼬리 지연 확인용)"""
+    bounds_ms: Tuple[float, ...] = DEFAULT_HISTOGRAM_BOUNDS_MS
+    counts: List[int] = field(default_factory=list)
+
+    def __post_init__(self):
+        # 마지막 칸은 가장 큰 상한을 넘는 값
+        self.counts = [0] * (len(self.bounds_ms) + 1)
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(self.bounds_ms, seconds * 1000)] += 1
+
+    def to_dict(self) -> Dict[str, int]:
+        """구간별 개수 ({"<=1ms": n, ..., ">1000ms": n}, 누적 아님)"""
+        labels = [f"<={bound:g}ms" for bound in self.bounds_ms] + [f">{self.bounds_ms[-1]:g}ms"]
+        return dict(zip(labels, self.counts))
+
+
+class Metrics:
+    """프로세스 내 메트릭 레지스트리 (이벤트 루프 단일 스레드에서 사용)"""
+
+    def __init__(self):
+        self._counters: Dict[str, int] = {}
+        self._gauges: Dict[str, float] = {}
+        self._timings: Dict[str, TimingStats] = {}
+        self._collectors: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+    def increment(self, name: str, value: int = 1):
+        """카운터 증가"""
+        self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float):
+        """게이지 값 설정"""
+        self._gauges[name] = value
+
+    def observe(self, name: str, seconds: float):
+        """소요시간 기록"""
+        stats = self._timings.get(name)
+        if stats is None:
+            stats = self._timings[name] = TimingStats()
+        stats.observe(seconds)
+
+    def register_collector(self, name: str, collector: Callable[[], Dict[str, Any]]):
+        """
+        스냅샷 시점에 값을 계산하는 수집기 등록 (큐 길이처럼 상태에서 바로 읽는 값용)
+
+        Args:
+            name: 수집기 이름 (스냅샷의 키)
+            collector: 현재 값을 dict로 반환하는 함수
+        """
+        self._collectors[name] = collector
+
+    def counter(self, name: str) -> int:
+        """카운터 현재 값"""
+        return self._counters.get(name, 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 메트릭 스냅샷"""
+        return {
+            "counters": dict(self._counters),
+            "gauges": dict(self._gauges),
+            "timings": {name: stats.to_dict() for name, stats in self._timings.items()},
+            **{name: collector() for name, collector in self._collectors.items()}
+        }
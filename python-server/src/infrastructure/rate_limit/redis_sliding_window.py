@@ -0,0 +1,73 @@
+"""
+Redis 슬라이딩 윈도우 요청 제한
+NGINX 뒤의 모든 언어 서버가 같은 키를 사용하여 클라이언트별 요청 한도를 공유
+
+키 ratelimit:{rule}:{client} (sorted set): 윈도우 안의 요청 시각(마이크로초)을 점수로 저장
+Lua 스크립트 한 번으로 요청에 적용되는 모든 규칙의 만료 요청 제거 -> 개수 확인 -> 기록을 원자적으로 수행하고, 시각은 Redis TIME을 사용하여 서버 간 시계 차이 영향을 받지 않음
+"""
+
+import uuid
+from typing import Sequence, Tuple
+
+import redis.asyncio as redis
+
+KEY_PREFIX = "ratelimit:"
+
+# KEYS: 규칙별 윈도우 키, ARGV[1]: 요청 고유값, ARGV[2i], ARGV[2i+1]: KEYS[i]의 윈도우(ms), 최대 요청 수
+# 모든 키를 먼저 확인하고 전부 허용될 때만 기록 (한 규칙에서 거절된 요청이 다른 규칙의 한도를 사용하지 않음)
+# 반환: {허용 여부(1/0), 거절이면 다시 허용될 때까지 남은 ms (거절한 규칙 중 가장 긴 값) / 허용이면 0}
+SLIDING_WINDOW_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000000 + tonumber(time[2])
+local retry_after = 0
+
+for i, key in ipairs(KEYS) do
+    local window = tonumber(ARGV[i * 2]) * 1000
+    local limit = tonumber(ARGV[i * 2 + 1])
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+    if redis.call('ZCARD', key) >= limit then
+        local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+        local wait = math.ceil((tonumber(oldest[2]) + window - now) / 1000)
+        retry_after = math.max(retry_after, wait, 1)
+    end
+end
+if retry_after > 0 then
+    return {0, retry_after}
+end
+
+for i, key in ipairs(KEYS) do
+    redis.call('ZADD', key, now, now .. ':' .. ARGV[1])
+    redis.call('PEXPIRE', key, ARGV[i * 2])
+end
+return {1, 0}
+"""
+
+
+class RedisSlidingWindowLimiter:
+    """서버 간 공유 슬라이딩 윈도우 (요청마다 Redis 왕복 1회)"""
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+        self._script = redis_client.register_script(SLIDING_WINDOW_SCRIPT)
+
+    async def hit(self, limits: Sequence[Tuple[str, int, int]]) -> Tuple[bool, int]:
+        """
+        요청 하나를 모든 한도에 기록 (하나라도 넘으면 어느 한도에도 기록하지 않음)
+
+        Args:
+            limits: (제한 키, 윈도우 길이(밀리초), 윈도우 안에서 허용하는 요청 수) 목록
+                (제한 키 예: "getUserAggregates:203.0.113.7")
+
+        Returns:
+            Tuple[bool, int]: (허용 여부, 거절이면 다시 허용될 때까지 남은 밀리초 / 허용이면 0)
+
+        Raises:
+            redis.RedisError: Redis 에러 (호출자가 허용/거절을 결정)
+        """
+        args = [uuid.uuid4().hex]
+        for _, window_ms, max_requests in limits:
+            args.extend((window_ms, max_requests))
+        allowed, value = await self._script(keys=[KEY_PREFIX + key for key, _, _ in limits], args=args)
+        if int(allowed) == 1:
+            return True, 0
+        return False, int(value)
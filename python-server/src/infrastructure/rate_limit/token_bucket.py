@@ -0,0 +1,67 @@
+"""
+프로세스 내 토큰 버킷
+I/O 없이 클라이언트별 요청 속도를 제한하는 1차 필터 (서버 간 공유되지 않음)
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable
+
+
+@dataclass
+class _Bucket:
+    tokens: float
+    updated: float
+
+
+class TokenBucketLimiter:
+    """
+    키별 토큰 버킷
+    버킷 수는 max_keys로 제한하며, 가장 오래 사용되지 않은 버킷부터 제거 (제거된 키는 가득 찬 버킷으로 다시 시작)
+    """
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[Hashable, _Bucket]" = OrderedDict()
+
+    def wait_ms(self, key: Hashable, capacity: int, window_ms: int) -> float:
+        """
+        토큰 하나를 사용할 수 있는지 확인 (충전만 하고 사용하지 않음)
+
+        Args:
+            key: 버킷 키 (예: (규칙, 클라이언트))
+            capacity: 버킷 크기 (window_ms 동안 허용하는 요청 수)
+            window_ms: 버킷이 비었다가 가득 차는 데 걸리는 시간
+
+        Returns:
+            float: 사용할 수 있으면 0, 아니면 토큰이 생길 때까지 남은 밀리초
+        """
+        now = time.monotonic()
+        refill_per_ms = capacity / window_ms
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(tokens=float(capacity), updated=now)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            bucket.tokens = min(capacity, bucket.tokens + (now - bucket.updated) * 1000 * refill_per_ms)
+            bucket.updated = now
+
+        if bucket.tokens >= 1:
+            return 0.0
+        return (1 - bucket.tokens) / refill_per_ms
+
+    def take(self, key: Hashable):
+        """
+        wait_ms로 확인한 버킷에서 토큰 하나 사용
+        (여러 규칙을 모두 확인한 뒤 사용하므로, 거절된 요청은 어느 버킷의 토큰도 사용하지 않음)
+        """
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket.tokens -= 1
+
+    def __len__(self) -> int:
+        return len(self._buckets)
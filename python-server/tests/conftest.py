@@ -0,0 +1,42 @@
+"""
+테스트 공통 fixture
+Redis는 fakeredis(Lua 스크립트는 lupa로 실행)로 대체하므로 Redis 서버 없이 실행
+
+실행:
+    uv run --group dev pytest
+"""
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+
+from src.domain.user.aggregates import UserAggregates
+
+
+@pytest.fixture
+def redis_server() -> fakeredis.FakeServer:
+    """테스트마다 비어 있는 Redis (같은 서버를 쓰는 클라이언트끼리 데이터 공유)"""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def redis_client(redis_server):
+    """사용자 데이터 저장용 비동기 클라이언트 (응답을 디코딩하지 않음)"""
+    return fakeredis.aioredis.FakeRedis(server=redis_server)
+
+
+@pytest.fixture
+def other_server(redis_server):
+    """
+    다른 서버 프로세스를 흉내내는 동기 클라이언트
+    update_fn 안(동기 코드)에서 같은 키를 바꿔 서버 간 경쟁을 만들 때 사용
+    """
+    return fakeredis.FakeRedis(server=redis_server)
+
+
+@pytest.fixture
+def new_user():
+    """기본 사용자 데이터 생성 함수: (user_id) -> UserAggregates"""
+    def create(user_id: str = "user1") -> UserAggregates:
+        return UserAggregates.create_new_user(user_id, f"Player_{user_id}")
+    return create
@@ -0,0 +1,127 @@
+"""
+GroupCommitUserRepository 테스트 (호출자별 결과, update_fn 실패, 취소된 호출자)
+"""
+
+import asyncio
+
+import pytest
+
+from src.domain.user.repositories.group_commit_user_repository import GroupCommitUserRepository
+from src.domain.user.repositories.redis_user_repository import RedisUserRepository
+
+
+def add_gold(amount: int):
+    def update(aggregates, user_id):
+        aggregates.inventory.gold += amount
+        return aggregates
+    return update
+
+
+def fail(aggregates, user_id):
+    raise ValueError("invalid item")
+
+
+@pytest.fixture
+def inner(redis_client):
+    return RedisUserRepository(redis_client)
+
+
+async def create_user(inner, new_user) -> int:
+    """사용자를 저장하고 시작 골드 반환"""
+    aggregates = new_user("user1")
+    await inner.upsert_one("user1", aggregates)
+    return aggregates.inventory.gold
+
+
+def test_each_caller_gets_its_own_snapshot(inner, new_user):
+    async def scenario():
+        start_gold = await create_user(inner, new_user)
+        repo = GroupCommitUserRepository(inner, window_ms=20)
+
+        results = await asyncio.gather(*(repo.find_one_and_update("user1", add_gold(amount)) for amount in (1, 10, 100)))
+        assert all(error is None for _, error in results)
+        # 자신의 update_fn까지 적용된 데이터, 버전은 그룹 커밋 1회
+        assert [result.data.inventory.gold - start_gold for result, _ in results] == [1, 11, 111]
+        assert {result.version for result, _ in results} == {2}
+        assert repo.stats()["commits"] == 1
+        assert inner.saves == 2  # 생성 1회 + 그룹 커밋 1회
+
+        stored, _ = await inner.find_one("user1")
+        assert stored.data.inventory.gold == start_gold + 111
+
+    asyncio.run(scenario())
+
+
+def test_failing_update_fn_only_fails_its_caller(inner, new_user):
+    async def scenario():
+        start_gold = await create_user(inner, new_user)
+        repo = GroupCommitUserRepository(inner, window_ms=20)
+
+        results = await asyncio.gather(
+            repo.find_one_and_update("user1", add_gold(1)),
+            repo.find_one_and_update("user1", fail),
+            repo.find_one_and_update("user1", add_gold(10)),
+            return_exceptions=True
+        )
+        assert isinstance(results[1], ValueError)
+        assert results[0][0].data.inventory.gold - start_gold == 1
+        assert results[2][0].data.inventory.gold - start_gold == 11
+
+        stored, _ = await inner.find_one("user1")
+        assert (stored.version, stored.data.inventory.gold) == (2, start_gold + 11)
+
+    asyncio.run(scenario())
+
+
+def test_caller_cancelled_before_commit_is_dropped(inner, new_user):
+    async def scenario():
+        start_gold = await create_user(inner, new_user)
+        repo = GroupCommitUserRepository(inner, window_ms=20)
+
+        kept = asyncio.ensure_future(repo.find_one_and_update("user1", add_gold(1)))
+        cancelled = asyncio.ensure_future(repo.find_one_and_update("user1", add_gold(100)))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        result, error = await kept
+        assert error is None
+        assert result.data.inventory.gold - start_gold == 1
+        assert cancelled.cancelled()
+
+        stored, _ = await inner.find_one("user1")
+        assert stored.data.inventory.gold == start_gold + 1
+
+    asyncio.run(scenario())
+
+
+def test_group_of_only_cancelled_callers_is_not_written(inner, new_user):
+    async def scenario():
+        await create_user(inner, new_user)
+        repo = GroupCommitUserRepository(inner, window_ms=20)
+
+        call = asyncio.ensure_future(repo.find_one_and_update("user1", add_gold(1)))
+        await asyncio.sleep(0)
+        call.cancel()
+        await asyncio.sleep(0.05)
+
+        assert repo.stats()["commits"] == 0
+        stored, _ = await inner.find_one("user1")
+        assert stored.version == 1
+
+    asyncio.run(scenario())
+
+
+def test_later_call_commits_in_a_new_group_on_top_of_the_previous(inner, new_user):
+    async def scenario():
+        start_gold = await create_user(inner, new_user)
+        repo = GroupCommitUserRepository(inner, window_ms=5)
+
+        first = asyncio.ensure_future(repo.find_one_and_update("user1", add_gold(1)))
+        await asyncio.sleep(0.02)
+        second = asyncio.ensure_future(repo.find_one_and_update("user1", add_gold(10)))
+
+        (first_result, _), (second_result, _) = await asyncio.gather(first, second)
+        assert (first_result.version, second_result.version) == (2, 3)
+        assert second_result.data.inventory.gold - start_gold == 11
+
+    asyncio.run(scenario())
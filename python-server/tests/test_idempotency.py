@@ -0,0 +1,150 @@
+"""
+Idempotency-Key 적용 변경 메서드 테스트 (응답 재전송, 동시 중복 요청, 클라이언트별 키)
+"""
+
+import asyncio
+
+import fakeredis.aioredis
+import pytest
+
+from src.api.openrpc_server import JsonRpcError, OpenRpcServer
+from src.api.rpc_context import RpcContext
+from src.infrastructure.idempotency.redis_idempotency_store import (
+    KEY_PREFIX,
+    RedisIdempotencyStore,
+    request_fingerprint
+)
+
+
+class FakeUserService:
+    user_domain_service = None
+
+
+@pytest.fixture
+def store(redis_server):
+    return RedisIdempotencyStore(fakeredis.aioredis.FakeRedis(server=redis_server, decode_responses=True))
+
+
+def make_server(store, handler):
+    server = OpenRpcServer(FakeUserService(), idempotency_store=store)
+    server.register_method("test.grant", handler, mutating=True)
+    return server
+
+
+def grant_request(request_id, amount=10):
+    return {"jsonrpc": "2.0", "method": "test.grant", "params": {"amount": amount}, "id": request_id}
+
+
+def test_retry_with_same_key_replays_first_response(store):
+    async def scenario():
+        calls = []
+
+        async def grant(params):
+            calls.append(params)
+            return {"granted": params["amount"], "call": len(calls)}
+
+        server = make_server(store, grant)
+        context = RpcContext(idempotency_key="key-1")
+        first = await server.handle_request(grant_request(1), context)
+        retry = await server.handle_request(grant_request(2), context)
+
+        assert len(calls) == 1
+        assert first == {"jsonrpc": "2.0", "result": {"granted": 10, "call": 1}, "id": 1}
+        # 재전송 응답은 재시도 요청의 id 사용
+        assert retry == {"jsonrpc": "2.0", "result": {"granted": 10, "call": 1}, "id": 2}
+        assert server.metrics.counter("idempotency_replays_total") == 1
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_duplicates_execute_once(store):
+    async def scenario():
+        calls = []
+        release = asyncio.Event()
+
+        async def grant(params):
+            calls.append(params)
+            await release.wait()
+            return {"granted": params["amount"]}
+
+        server = make_server(store, grant)
+        context = RpcContext(idempotency_key="key-1")
+        requests = [asyncio.ensure_future(server.handle_request(grant_request(i), context)) for i in range(3)]
+        await asyncio.sleep(0.05)
+        assert len(calls) == 1
+        release.set()
+
+        responses = await asyncio.gather(*requests)
+        assert len(calls) == 1
+        assert [response["result"] for response in responses] == [{"granted": 10}] * 3
+        assert [response["id"] for response in responses] == [0, 1, 2]
+
+    asyncio.run(scenario())
+
+
+def test_same_key_with_different_params_is_rejected(store):
+    async def scenario():
+        async def grant(params):
+            return {"granted": params["amount"]}
+
+        server = make_server(store, grant)
+        context = RpcContext(idempotency_key="key-1")
+        await server.handle_request(grant_request(1, amount=10), context)
+        response = await server.handle_request(grant_request(2, amount=99), context)
+        assert response["error"]["code"] == JsonRpcError.IDEMPOTENCY_KEY_REUSED
+
+    asyncio.run(scenario())
+
+
+def test_keys_are_scoped_per_client(store):
+    async def scenario():
+        calls = []
+
+        async def grant(params):
+            calls.append(params)
+            return {"call": len(calls)}
+
+        server = make_server(store, grant)
+        first = await server.handle_request(grant_request(1), RpcContext(idempotency_key="key-1", client_id="A"))
+        second = await server.handle_request(grant_request(1), RpcContext(idempotency_key="key-1", client_id="B"))
+        assert (first["result"], second["result"]) == ({"call": 1}, {"call": 2})
+
+    asyncio.run(scenario())
+
+
+def test_retryable_error_releases_the_key(store):
+    async def scenario():
+        calls = []
+
+        async def grant(params):
+            calls.append(params)
+            if len(calls) == 1:
+                raise RuntimeError("transient failure")
+            return {"call": len(calls)}
+
+        server = make_server(store, grant)
+        context = RpcContext(idempotency_key="key-1")
+        failed = await server.handle_request(grant_request(1), context)
+        retried = await server.handle_request(grant_request(2), context)
+        assert failed["error"]["code"] == JsonRpcError.INTERNAL_ERROR
+        assert retried["result"] == {"call": 2}
+
+    asyncio.run(scenario())
+
+
+def test_stale_owner_cannot_overwrite_new_claim(store):
+    async def scenario():
+        fingerprint = request_fingerprint("test.grant", {"amount": 10})
+        stale = await store.claim("key-1", fingerprint, lock_ttl_ms=1000)
+        # 선점이 만료되어 다른 요청이 같은 키를 선점
+        await store.redis.delete(KEY_PREFIX + "key-1")
+        current = await store.claim("key-1", fingerprint, lock_ttl_ms=1000)
+
+        assert not await store.complete("key-1", fingerprint, {"result": "stale"}, stale.token)
+        assert not await store.release("key-1", stale.token)
+        assert await store.complete("key-1", fingerprint, {"result": "current"}, current.token)
+
+        replay = await store.claim("key-1", fingerprint, lock_ttl_ms=1000)
+        assert (replay.owner, replay.response) == (False, {"result": "current"})
+
+    asyncio.run(scenario())
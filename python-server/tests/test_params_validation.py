@@ -0,0 +1,65 @@
+"""
+openrpc.json에서 컴파일한 params 검증 테스트 (-32602 Invalid params)
+"""
+
+import asyncio
+
+import pytest
+
+from src.api.openrpc_server import JsonRpcError, OpenRpcServer
+from src.api.rpc_registry import SchemaCompiler, compile_params_validator
+
+
+class FakeUserService:
+    user_domain_service = None
+
+
+@pytest.fixture(scope="module")
+def server():
+    return OpenRpcServer(FakeUserService())
+
+
+def call(server, method, params):
+    return asyncio.run(server.handle_request({"jsonrpc": "2.0", "method": method, "params": params, "id": 1}))
+
+
+@pytest.mark.parametrize("method, params, field", [
+    ("getUserAggregates", {}, "userId"),
+    ("getUserAggregates", {"userId": 5}, "userId"),
+    ("getUserAggregates", {"userId": ""}, "userId"),
+    ("getUserAggregates", {"userId": "bad id!"}, "userId"),
+    ("getUserAggregates", {"userId": "x" * 51}, "userId"),
+    ("getUserAggregates", ["user1", "extra"], "params"),
+    ("getUserAggregates", "user1", "params"),
+    ("getUserAggregatesBatch", {"userIds": []}, "userIds"),
+    ("getUserAggregatesBatch", {"userIds": ["ok", 3]}, "userIds"),
+    ("getUserAggregatesBatch", {"userIds": "user1"}, "userIds"),
+    ("calculator.add", {"a": 1}, "b"),
+    ("calculator.add", {"a": "1", "b": 2}, "a"),
+    ("calculator.add", {"a": True, "b": 2}, "a"),
+    ("profile.addExp", {"exp_to_add": -1}, "exp_to_add"),
+    ("profile.addExp", {"exp_to_add": 1.5}, "exp_to_add"),
+])
+def test_invalid_params_are_rejected_before_the_handler(server, method, params, field):
+    response = call(server, method, params)
+    assert response["error"]["code"] == JsonRpcError.INVALID_PARAMS
+    assert response["error"]["data"]["field"] == field
+
+
+def test_unknown_method_is_not_a_params_error(server):
+    response = call(server, "no.such.method", {})
+    assert response["error"]["code"] == JsonRpcError.METHOD_NOT_FOUND
+
+
+def test_positional_params_map_to_spec_names():
+    validate = compile_params_validator(
+        [
+            {"name": "a", "required": True, "schema": {"type": "number"}},
+            {"name": "b", "required": False, "schema": {"type": "integer", "minimum": 0}}
+        ],
+        SchemaCompiler()
+    )
+    assert validate([1.5, 2]) == ({"a": 1.5, "b": 2}, None)
+    assert validate([1.5]) == ({"a": 1.5}, None)
+    assert validate({"a": 1}) == ({"a": 1}, None)
+    assert validate([1, -1]) == (None, {"field": "b", "reason": "b must be >= 0"})
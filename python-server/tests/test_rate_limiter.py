@@ -0,0 +1,87 @@
+"""
+RateLimiter 테스트 (로컬 토큰 버킷, Redis 슬라이딩 윈도우, 클라이언트 식별)
+"""
+
+import asyncio
+
+import fakeredis.aioredis
+
+from src.api.rate_limiter import RateLimiter, RateLimitRule
+from src.infrastructure.rate_limit.redis_sliding_window import KEY_PREFIX, RedisSlidingWindowLimiter
+
+
+class NoLocalLimit:
+    """로컬 토큰 버킷을 통과시켜 Redis 단계만 검사"""
+
+    def wait_ms(self, key, capacity, window_ms):
+        return 0.0
+
+    def take(self, key):
+        pass
+
+    def __len__(self):
+        return 0
+
+
+def check_many(limiter, method, count):
+    async def scenario():
+        return [await limiter.check("client", method) for _ in range(count)]
+    return asyncio.run(scenario())
+
+
+def test_local_method_rejection_does_not_use_the_default_budget():
+    limiter = RateLimiter(RateLimitRule(60000, 5), {"expensive": RateLimitRule(60000, 2)})
+
+    results = check_many(limiter, "expensive", 4)
+    assert results[:2] == [None, None]
+    assert all(retry_after_ms > 0 for retry_after_ms in results[2:])
+    # 거절된 2회는 기본 한도(5)를 사용하지 않음: 남은 3회 허용 후 거절
+    cheap = check_many(limiter, "cheap", 4)
+    assert cheap[:3] == [None, None, None]
+    assert cheap[3] > 0
+    assert limiter.metrics.counter('rate_limited_total{tier="local"}') == 3
+
+
+def test_redis_method_rejection_does_not_use_the_default_budget(redis_server):
+    async def scenario():
+        redis_client = fakeredis.aioredis.FakeRedis(server=redis_server)
+        limiter = RateLimiter(
+            RateLimitRule(60000, 5),
+            {"expensive": RateLimitRule(60000, 2)},
+            shared=RedisSlidingWindowLimiter(redis_client),
+            local=NoLocalLimit()
+        )
+
+        expensive = [await limiter.check("client", "expensive") for _ in range(4)]
+        assert expensive[:2] == [None, None]
+        assert all(retry_after_ms > 0 for retry_after_ms in expensive[2:])
+        # 기본 한도 5 중 허용된 expensive 2회만 기록됨
+        cheap = [await limiter.check("client", "cheap") for _ in range(4)]
+        assert cheap[:3] == [None, None, None]
+        assert cheap[3] > 0
+
+        assert await redis_client.zcard(KEY_PREFIX + "all:client") == 5
+        assert await redis_client.zcard(KEY_PREFIX + "expensive:client") == 2
+        assert limiter.metrics.counter('rate_limited_total{tier="redis"}') == 3
+
+    asyncio.run(scenario())
+
+
+def test_redis_failure_falls_back_to_local_limit():
+    class BrokenShared:
+        async def hit(self, limits):
+            raise ConnectionError("redis down")
+
+    limiter = RateLimiter(RateLimitRule(60000, 2), shared=BrokenShared())
+    results = check_many(limiter, "any", 3)
+    assert results[:2] == [None, None]
+    assert results[2] > 0
+
+
+def test_client_id_uses_the_configured_header():
+    limiter = RateLimiter(RateLimitRule(60000, 5), client_header="X-Real-IP")
+    assert limiter.client_id({"x-real-ip": "203.0.113.7"}, "10.0.0.1") == "203.0.113.7"
+    assert limiter.client_id({"x-real-ip": "198.51.100.1, 203.0.113.7"}, "10.0.0.1") == "203.0.113.7"
+    # 헤더가 없는 직접 연결은 상대 주소, 상대 주소도 없으면(Unix 소켓) 제한하지 않음
+    assert limiter.client_id({}, "10.0.0.1") == "10.0.0.1"
+    assert limiter.client_id({}, None) is None
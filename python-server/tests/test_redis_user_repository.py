@@ -0,0 +1,106 @@
+"""
+RedisUserRepository 버전 체크 저장 (Lua compare-and-set) 테스트
+"""
+
+import asyncio
+
+from src.domain.user.repositories.redis_user_repository import RedisUserRepository
+from src.domain.user.repositories.user_repository import UserRepositoryOptions
+from src.infrastructure.concurrency.keyed_lock import KeyedLock
+
+
+def add_gold(amount: int):
+    def update(aggregates, user_id):
+        aggregates.inventory.gold += amount
+        return aggregates
+    return update
+
+
+def test_upsert_one_creates_then_increments_version(redis_client, new_user):
+    async def scenario():
+        repo = RedisUserRepository(redis_client)
+        created, error = await repo.upsert_one("user1", new_user("user1"))
+        assert error is None
+        assert (created.version, created.created) == (1, True)
+
+        updated, error = await repo.upsert_one("user1", new_user("user1"))
+        assert error is None
+        assert (updated.version, updated.created) == (2, False)
+
+    asyncio.run(scenario())
+
+
+def test_version_conflict_is_retried_with_latest_data(redis_client, other_server, new_user):
+    async def scenario():
+        repo = RedisUserRepository(redis_client)
+        await repo.upsert_one("user1", new_user("user1"))
+        start_gold = new_user("user1").inventory.gold
+        calls = []
+
+        def update(aggregates, user_id):
+            calls.append(aggregates.inventory.gold)
+            if len(calls) == 1:
+                # 조회와 저장 사이에 다른 서버가 같은 사용자를 저장
+                other_server.incr("user:user1:version")
+            aggregates.inventory.gold += 10
+            return aggregates
+
+        result, error = await repo.find_one_and_update("user1", update)
+        assert error is None
+        # 1(생성) -> 2(다른 서버) -> 3(재시도 성공)
+        assert result.version == 3
+        assert result.data.inventory.gold == start_gold + 10
+        assert len(calls) == 2
+        assert repo.stats() == {"saves": 3, "version_conflicts": 1}
+
+        stored, _ = await repo.find_one("user1")
+        assert (stored.version, stored.data.inventory.gold) == (3, start_gold + 10)
+
+    asyncio.run(scenario())
+
+
+def test_version_conflict_gives_up_after_retries(redis_client, other_server, new_user):
+    async def scenario():
+        repo = RedisUserRepository(redis_client)
+        await repo.upsert_one("user1", new_user("user1"))
+
+        def always_conflict(aggregates, user_id):
+            other_server.incr("user:user1:version")
+            return aggregates
+
+        result, error = await repo.find_one_and_update(
+            "user1", always_conflict, UserRepositoryOptions(retries=2)
+        )
+        assert result is None
+        assert error == "409: Version conflict"
+        assert repo.version_conflicts == 2
+
+    asyncio.run(scenario())
+
+
+def test_update_of_missing_user_is_not_retried(redis_client):
+    async def scenario():
+        repo = RedisUserRepository(redis_client)
+        result, error = await repo.find_one_and_update("nobody", add_gold(1))
+        assert result is None
+        assert error.startswith("0x001001")
+        assert repo.saves == 0
+
+    asyncio.run(scenario())
+
+
+def test_user_lock_queues_same_process_updates_without_conflicts(redis_client, new_user):
+    async def scenario():
+        repo = RedisUserRepository(redis_client, user_lock=KeyedLock())
+        await repo.upsert_one("user1", new_user("user1"))
+        start_gold = new_user("user1").inventory.gold
+
+        results = await asyncio.gather(*(repo.find_one_and_update("user1", add_gold(1)) for _ in range(10)))
+        assert all(error is None for _, error in results)
+        assert sorted(result.version for result, _ in results) == list(range(2, 12))
+        assert repo.version_conflicts == 0
+
+        stored, _ = await repo.find_one("user1")
+        assert stored.data.inventory.gold == start_gold + 10
+
+    asyncio.run(scenario())
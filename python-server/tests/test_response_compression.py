@@ -0,0 +1,82 @@
+"""
+ResponseCompressor 테스트 (협상, 크기 임계값, 버전 태그 압축 캐시)
+"""
+
+import gzip
+import json
+import zlib
+
+import pytest
+
+from src.api import jsonrpc_codec
+from src.api.response_compression import DEFLATE, GZIP, ResponseCompressor
+
+
+def decompress(body: bytes, encoding: str) -> bytes:
+    return gzip.decompress(body) if encoding == GZIP else zlib.decompress(body)
+
+
+def large_result(version: int):
+    return {"items": [{"id": f"item_{i}", "quantity": i} for i in range(100)], "version": version}
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    (None, None),
+    ("identity", None),
+    ("gzip", GZIP),
+    ("deflate", DEFLATE),
+    ("gzip, deflate", GZIP),
+    ("gzip;q=0.5, deflate", DEFLATE),
+    ("gzip;q=0", None),
+    ("*", GZIP),
+])
+def test_negotiate(accept_encoding, expected):
+    assert ResponseCompressor().negotiate(accept_encoding) == expected
+
+
+def test_small_responses_are_not_compressed():
+    compressor = ResponseCompressor(min_size=1024)
+    body, encoding = compressor.encode({"jsonrpc": "2.0", "result": {"ok": True}, "id": 1}, GZIP)
+    assert encoding is None
+    assert json.loads(body) == {"jsonrpc": "2.0", "result": {"ok": True}, "id": 1}
+
+
+@pytest.mark.parametrize("encoding", [GZIP, DEFLATE])
+def test_large_responses_are_compressed(encoding):
+    compressor = ResponseCompressor(min_size=1024)
+    response = {"jsonrpc": "2.0", "result": large_result(1), "id": 1}
+    body, content_encoding = compressor.encode(response, encoding)
+    assert content_encoding == encoding
+    assert json.loads(decompress(body, encoding)) == response
+
+
+@pytest.mark.parametrize("encoding", [GZIP, DEFLATE])
+def test_tagged_results_reuse_the_compressed_fragment(encoding):
+    compressor = ResponseCompressor(min_size=1024)
+    tagged = jsonrpc_codec.TaggedResult(value=large_result(1), tag="user1:1")
+
+    bodies = [
+        compressor.encode({"jsonrpc": "2.0", "result": tagged, "id": request_id}, encoding)[0]
+        for request_id in (1, "req-2")
+    ]
+    # 요청마다 id만 다르고 result 조각은 캐시에서 재사용
+    assert [json.loads(decompress(body, encoding)) for body in bodies] == [
+        {"jsonrpc": "2.0", "result": large_result(1), "id": 1},
+        {"jsonrpc": "2.0", "result": large_result(1), "id": "req-2"}
+    ]
+    assert compressor.metrics.counter("response_compression_cache_misses_total") == 1
+    assert compressor.metrics.counter("response_compression_cache_hits_total") == 1
+
+
+def test_tag_cache_evicts_least_recently_used():
+    compressor = ResponseCompressor(min_size=1024, cache_size=2)
+    for version in (1, 2, 1, 3):
+        tagged = jsonrpc_codec.TaggedResult(value=large_result(version), tag=f"user1:{version}")
+        compressor.encode({"jsonrpc": "2.0", "result": tagged, "id": 1}, GZIP)
+
+    assert compressor.stats()["cache_entries"] == 2
+    assert compressor.metrics.counter("response_compression_cache_hits_total") == 1
+    # 버전 2가 가장 오래 사용되지 않아 제거됨
+    tagged = jsonrpc_codec.TaggedResult(value=large_result(2), tag="user1:2")
+    compressor.encode({"jsonrpc": "2.0", "result": tagged, "id": 1}, GZIP)
+    assert compressor.metrics.counter("response_compression_cache_misses_total") == 4
@@ -0,0 +1,73 @@
+"""
+RedisUserRepository.upsert_many 파이프라인 대량 저장 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from src.domain.user.repositories.redis_user_repository import RedisUserRepository
+from src.domain.user.repositories.user_data_codec import (
+    UserDataCodec,
+    FORMAT_JSON,
+    FORMAT_JSON_ZLIB,
+    FORMAT_MSGPACK
+)
+from src.domain.user.repositories.user_repository import UserRepositoryBulkOptions, UserUpsert
+
+
+@pytest.mark.parametrize("data_format", [FORMAT_JSON, FORMAT_JSON_ZLIB, FORMAT_MSGPACK])
+def test_mixed_success_and_conflict(redis_client, new_user, data_format):
+    async def scenario():
+        repo = RedisUserRepository(redis_client, codec=UserDataCodec(data_format))
+        await repo.upsert_one("existing", new_user("existing"))
+        await repo.upsert_one("stale", new_user("stale"))
+        await repo.upsert_one("stale", new_user("stale"))  # 버전 2
+
+        fresh = new_user("fresh")
+        progress = []
+        results, error = await repo.upsert_many(
+            [
+                UserUpsert("fresh", fresh),
+                UserUpsert("existing", new_user("existing"), expected_version=1),
+                UserUpsert("stale", new_user("stale"), expected_version=1),
+                UserUpsert("unversioned", new_user("unversioned"))
+            ],
+            UserRepositoryBulkOptions(chunk_size=3, on_progress=lambda done, total: progress.append((done, total)))
+        )
+        assert error is None
+        # 입력 순서대로 사용자별 결과
+        assert [(r.user_id, r.success, r.version, r.created, r.error) for r in results] == [
+            ("fresh", True, 1, True, None),
+            ("existing", True, 2, False, None),
+            ("stale", False, 2, False, "409: Version conflict"),
+            ("unversioned", True, 1, True, None)
+        ]
+        assert progress == [(3, 4), (4, 4)]
+
+        # 충돌한 사용자는 저장되지 않음
+        found, _ = await repo.find_many(["fresh", "existing", "stale", "unversioned"])
+        assert {user_id: result.version for user_id, result in found.found.items()} == {
+            "fresh": 1, "existing": 2, "stale": 2, "unversioned": 1
+        }
+        assert found.found["fresh"].data == fresh
+
+    asyncio.run(scenario())
+
+
+def test_redis_error_is_reported_per_user(redis_client, new_user):
+    async def scenario():
+        repo = RedisUserRepository(redis_client)
+        # 데이터 키가 해시가 아니면 스크립트의 HSET이 실패 (WRONGTYPE): 해당 사용자만 에러
+        await redis_client.set("user:broken:data", "not-a-hash")
+
+        results, error = await repo.upsert_many([
+            UserUpsert("ok", new_user("ok")),
+            UserUpsert("broken", new_user("broken"))
+        ])
+        assert error is None
+        assert results[0].success
+        assert not results[1].success
+        assert results[1].error.startswith("500: Database error")
+
+    asyncio.run(scenario())